@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+'''
+Batch computation of mc34063 designs from a stream of specs.
+Reads csv (with header) or json lines with the mode and the seven
+inputs of the GUI (vsat, vf, vin, vout, iout, fmin, vripple),
+computes and snaps them to standard values in chunks with
+mc34063vec and writes csv or json lines as it goes, so memory
+stays constant whatever the length of the stream.
+
+Command line:
+  mc34063bat.py specs.csv > designs.csv
+  cat specs.jsonl | mc34063bat.py -f jsonl -t jsonl > designs.jsonl
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import argparse
+import csv
+import itertools
+import json
+import math
+import sys
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+from mc34063ser import SERIES
+
+# inputs in the order of the GUI (values[0..6])
+SPEC=('mode','vsat','vf','vin','vout','iout','fmin','vripple')
+FIELDS=eng.INPUTS+('ok',)+eng.OUTPUTS+vec.SNAPS
+
+def _float(x):
+    '''float or nan'''
+    try:
+        return float(x)
+    except (TypeError,ValueError):
+        return math.nan
+
+def readspecs(f,fmt='csv'):
+    '''generator of specs (dict) from a csv or jsonl stream'''
+    if fmt=='csv':
+        yield from csv.DictReader(f)
+    else:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def columns(specs):
+    '''column arrays of a list of specs'''
+    cols={'mode':vec.modecode(np.array([str(s.get('mode','')) for s in specs]))}
+    for k in SPEC[1:]:
+        cols[k]=np.array([_float(s.get(k)) for s in specs])
+    return cols
+
+def run(specs,chunk=10000,asbuilt=False,**series):
+    '''compute a stream of specs
+    input:
+      specs= iterable of dict with the keys of SPEC
+      chunk= specs computed together
+      asbuilt= add the columns of vec.asbuilt()
+      series= sct, srsc, sr, sl, sc as in vec.snap()
+    output:
+      generator of {name in FIELDS (and vec.ASBUILT): array}
+      for every chunk'''
+    specs=iter(specs)
+    while True:
+        part=list(itertools.islice(specs,chunk))
+        if not part:
+            return
+        cols=columns(part)
+        batch=vec.fromrecords(cols)
+        out={k:cols[k] for k in eng.INPUTS}
+        out['ok']=batch.ok
+        for k in eng.OUTPUTS:
+            out[k]=getattr(batch,k)
+        snaps=vec.snap(batch,cols['vout'],**series)
+        out.update(snaps)
+        if asbuilt:
+            out.update(vec.asbuilt(cols,batch,snaps))
+        yield out
+
+def _rows(out):
+    '''rows of a chunk, with mode names and None for nan'''
+    names=np.asarray(eng.MODES+('?',))[np.where(out['mode']<0,3,out['mode'])]
+    data=[out[k].tolist() for k in list(out)[1:]]
+    for m,row in zip(names.tolist(),zip(*data)):
+        yield [m]+[None if isinstance(x,float) and math.isnan(x) else x
+                   for x in row]
+
+def write(f,chunks,fmt='csv'):
+    '''write the chunks of run() as csv (with header) or jsonl'''
+    if fmt=='csv':
+        w=csv.writer(f,lineterminator='\n')
+        for i,out in enumerate(chunks):
+            if i==0:
+                w.writerow(list(out))
+            w.writerows(_rows(out))
+    else:
+        for out in chunks:
+            f.writelines(json.dumps(dict(zip(out,row)))+'\n'
+                         for row in _rows(out))
+
+def main(argv=None):
+    '''command line interface'''
+    p=argparse.ArgumentParser(description='mc34063 batch computation')
+    p.add_argument('input',nargs='?',default='-',
+                   help='csv or jsonl file (default stdin)')
+    p.add_argument('-o','--output',default='-',help='output file (default stdout)')
+    p.add_argument('-f','--format',choices=('csv','jsonl'),default=None,
+                   help='input format (default from the file name, or csv)')
+    p.add_argument('-t','--to',choices=('csv','jsonl'),default='csv',
+                   help='output format')
+    p.add_argument('--chunk',type=int,default=10000,help='specs per chunk')
+    p.add_argument('--asbuilt',action='store_true',
+                   help='add the as-built columns')
+    for k,d in (('sct','E12'),('srsc','E12'),('sr','E24'),('sl','E6'),
+                ('sc','E6')):
+        p.add_argument('--'+k,default=d,choices=sorted(SERIES),
+                       help='series for %s (default %s)' % (k[1:],d))
+    args=p.parse_args(argv)
+    fmt=args.format or ('jsonl' if args.input.endswith(('.jsonl','.json'))
+                        else 'csv')
+    fin=sys.stdin if args.input=='-' else open(args.input,newline='')
+    fout=sys.stdout if args.output=='-' else open(args.output,'w',newline='')
+    try:
+        series={k:SERIES[getattr(args,k)] for k in ('sct','srsc','sr','sl','sc')}
+        write(fout,run(readspecs(fin,fmt),args.chunk,args.asbuilt,**series),
+              args.to)
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+
+if __name__ == "__main__":
+    main()
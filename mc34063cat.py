@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+'''
+Local parts catalog, to snap computed values to parts in stock
+instead of abstract E series.
+The catalog is a csv file or a sqlite file (table parts) with the
+columns
+  part   name or code of the part
+  kind   R (resistor), C (capacitor) or L (inductor)
+  value  Ohm, F or H (suffixes p n u m k M are accepted)
+  tol    relative tolerance
+  rating W for resistors, V for capacitors, A for inductors
+  price
+and any other numeric column (like dcr, isat, esr, size).
+Every kind is kept in sorted numpy arrays; for every rating level
+and max tolerance asked for, an index with the cheapest part of
+every value meeting them is built at first use, so nearest value
+queries are a searchsorted over the whole sweep. The indexes are
+cached (at most MAXINDEX, least recently used out).
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import collections
+import csv
+import math
+import sqlite3
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+
+# column of the catalog and suffixes of the values
+COLUMNS=('part','kind','value','tol','rating','price')
+SUFFIX={'p':1e-12,'n':1e-9,'u':1e-6,'m':1e-3,'k':1e3,'M':1e6}
+# max number of indexes cached by a catalog (least recently used out)
+MAXINDEX=64
+
+def value(s):
+    '''value of a string like 4.7k, 100n, 10u, 0.33'''
+    s=str(s).strip()
+    if s and s[-1] in SUFFIX:
+        return float(s[:-1])*SUFFIX[s[-1]]
+    return float(s)
+
+def _float(s):
+    '''float of a catalog field, nan if empty or not a number'''
+    try:
+        return value(s)
+    except ValueError:
+        return math.nan
+
+def readrows(path):
+    '''rows (dict) of a csv or sqlite catalog'''
+    if path.endswith(('.db','.sqlite','.sqlite3')):
+        db=sqlite3.connect(path)
+        db.row_factory=sqlite3.Row
+        try:
+            return [dict(r) for r in db.execute('SELECT * FROM parts')]
+        finally:
+            db.close()
+    with open(path,newline='') as f:
+        return list(csv.DictReader(f))
+
+class Catalog:
+    '''parts catalog indexed by kind and value
+    input:
+      rows= iterable of dict with the COLUMNS (and others)'''
+
+    def __init__(self,rows):
+        by={}
+        for r in rows:
+            by.setdefault(str(r['kind']).strip().upper(),[]).append(r)
+        self.kinds={}
+        self._index=collections.OrderedDict()
+        for k,rs in by.items():
+            cols={'part':np.array([str(r['part']) for r in rs])}
+            for c in rs[0]:
+                if c not in ('part','kind'):
+                    cols[c]=np.array([_float(r.get(c)) for r in rs])
+            for c in ('tol','rating','price'):
+                if c not in cols:
+                    cols[c]=np.full(len(rs),math.nan)
+            order=np.lexsort((cols['price'],cols['value']))
+            self.kinds[k]={c:a[order] for c,a in cols.items()}
+
+    @staticmethod
+    def load(path):
+        '''catalog of a csv or sqlite file'''
+        return Catalog(readrows(path))
+
+    def __len__(self):
+        return sum(len(c['value']) for c in self.kinds.values())
+
+    def parts(self,kind):
+        '''columns of all the parts of a kind, sorted by value'''
+        return self.kinds[kind]
+
+    def _cached(self,key,build):
+        '''index key, built by build() if not cached'''
+        if key in self._index:
+            self._index.move_to_end(key)
+        else:
+            self._index[key]=build()
+            if len(self._index)>MAXINDEX:
+                self._index.popitem(last=False)
+        return self._index[key]
+
+    def levels(self,kind,rating,col='rating'):
+        '''ratings rounded up to the ratings (col) of the parts of kind
+        (inf above the highest)'''
+        c=self.kinds[kind]
+        levels=np.append(np.unique(c[col][np.isfinite(c[col])]),math.inf)
+        return levels[np.searchsorted(levels,np.nan_to_num(rating))]
+
+    def index(self,kind,rating=None,maxtol=None):
+        '''sorted index of the cheapest part of every value of kind
+        with rating>=rating and tol<=maxtol (cached)
+        output:
+          log of values, indexes of the parts in parts(kind)'''
+        c=self.kinds[kind]
+        if rating is not None:
+            # round up to a rating of the catalog, to share indexes
+            rating=float(self.levels(kind,rating))
+        key=(kind,rating,maxtol)
+        def build():
+            ok=np.isfinite(c['value'])&(c['value']>0)
+            if rating is not None:
+                ok&=c['rating']>=rating
+            if maxtol is not None:
+                ok&=c['tol']<=maxtol
+            i=np.flatnonzero(ok)
+            # parts are sorted by value then price: keep the first
+            # (cheapest) of every value
+            first=np.ones(len(i),dtype=bool)
+            first[1:]=c['value'][i][1:]!=c['value'][i][:-1]
+            i=i[first]
+            return np.log(c['value'][i]),i
+        return self._cached(key,build)
+
+    def snap(self,kind,values,rating=None,maxtol=None):
+        '''nearest parts of kind to an array of values
+        input:
+          values= wanted values
+          rating= min rating, scalar or array (same for all if scalar)
+          maxtol= max tolerance
+        output:
+          indexes in parts(kind) (-1 if none), errors in % as
+          matchval() ((value-part)/part)'''
+        values=np.asarray(values,dtype=float)
+        if rating is None or np.ndim(rating)==0:
+            return self._snap(kind,values,rating,maxtol)
+        rating=self.levels(kind,np.broadcast_to(rating,values.shape))
+        idx=np.full(values.shape,-1)
+        err=np.full(values.shape,np.nan)
+        # one searchsorted for every rating level of the catalog
+        for r in np.unique(rating):
+            m=rating==r
+            idx[m],err[m]=self._snap(kind,values[m],r,maxtol)
+        return idx,err
+
+    def _snap(self,kind,values,rating,maxtol):
+        '''snap() with one rating'''
+        keys,i=self.index(kind,rating,maxtol)
+        if len(keys)==0:
+            return np.full(values.shape,-1),np.full(values.shape,np.nan)
+        with np.errstate(divide='ignore',invalid='ignore'):
+            x=np.log(values)
+            j=np.clip(np.searchsorted(keys,x),1,max(len(keys)-1,1))
+            lo=np.maximum(j-1,0)
+            hi=np.minimum(j,len(keys)-1)
+            n=np.where(np.abs(x-keys[lo])<=np.abs(keys[hi]-x),lo,hi)
+            v=self.kinds[kind]['value'][i[n]]
+            err=(values-v)/v*100
+        ok=np.isfinite(x)
+        return np.where(ok,i[n],-1),np.where(ok,err,np.nan)
+
+    def nearest(self,kind,v,rating=None,maxtol=None):
+        '''nearest part of kind to value v
+        output:
+          dict of the part with its error in % (err), or None'''
+        i,err=self.snap(kind,[v],rating,maxtol)
+        if i[0]<0:
+            return None
+        p={c:a[i[0]].item() for c,a in self.kinds[kind].items()}
+        p['err']=float(err[0])
+        return p
+
+    def rangeindex(self,kind,col='rating',rank=('dcr','size')):
+        '''index of the parts of kind for best() (cached, one for every
+        kind, col and rank): the parts sorted by col, and for every
+        level h the blocks of 2**h consecutive ones sorted by value
+        with a sparse table of the best rank (lowest rank columns, nan
+        last) over any range of values of a block. col>=x is a suffix
+        of the parts, covered by at most 2*log2(n) blocks
+        output:
+          col sorted, sorted values, parts(kind) index of every rank,
+          {h: (block*n+value position, sparse table of ranks)}'''
+        key=('range',kind,col,rank)
+        def build():
+            c=self.kinds[kind]
+            i=np.flatnonzero(np.isfinite(c['value'])&np.isfinite(c[col]))
+            i=i[np.argsort(c[col][i],kind='stable')]
+            n=len(i)
+            # position of every part in the values and rank, ties by
+            # position in parts(kind) (the last column of lexsort is
+            # the first)
+            vo=np.argsort(c['value'][i],kind='stable')
+            vp=np.empty(n,dtype=np.int64)
+            vp[vo]=np.arange(n)
+            order=np.lexsort([i]+[np.nan_to_num(c[k][i],nan=math.inf)
+                                  if k in c else np.zeros(n)
+                                  for k in rank[::-1]])
+            r=np.empty(n,dtype=np.int32)
+            r[order]=np.arange(n)
+            pos=np.arange(n)
+            levels={}
+            h=0
+            while n and 2**h<=n:
+                o=np.lexsort((vp,pos>>h))
+                # table[j][p]: best rank of p...p+2**j-1 (j<=h, inside
+                # a block)
+                table=[r[o]]
+                for j in range(h):
+                    t=table[-1]
+                    table.append(np.minimum(t[:-2**j],t[2**j:]))
+                levels[h]=((pos[o]>>h)*n+vp[o],table)
+                h+=1
+            return c[col][i],c['value'][i][vo],i[order],levels
+        return self._cached(key,build)
+
+    def best(self,kind,lo,hi,rating,col='rating',rank=('dcr','size')):
+        '''best part (lowest rank columns) of kind with value in
+        [lo, hi] and col>=rating, for arrays of lo, hi, rating
+        output:
+          indexes in parts(kind), -1 where there is none'''
+        lo,hi,rating=np.broadcast_arrays(np.asarray(lo,dtype=float),
+                                         np.asarray(hi,dtype=float),
+                                         np.asarray(rating,dtype=float))
+        shape=lo.shape
+        lo,hi,rating=lo.ravel(),hi.ravel(),rating.ravel()
+        x,v,part,levels=self.rangeindex(kind,col,rank)
+        n=len(x)
+        best=np.full(lo.shape,n)
+        # parts from p on have col>=rating, values a...b-1 are in range
+        p=np.searchsorted(x,rating,'left')
+        a=np.searchsorted(v,lo,'left')
+        b=np.searchsorted(v,hi,'right')
+        q=np.flatnonzero((p<n)&(b>a))
+        p=p[q]
+        while len(q):
+            # largest block of 2**h parts starting at p (h at most the
+            # trailing zeros of p) not going past the last part
+            room=np.floor(np.log2(n-p)).astype(int)
+            h=np.minimum(np.log2(np.where(p>0,p&-p,n)).astype(int),room)
+            for hh in np.unique(h):
+                k=np.flatnonzero(h==hh)
+                keys,table=levels[hh]
+                blk=(p[k]>>hh)*n
+                s=np.searchsorted(keys,blk+a[q[k]],'left')
+                e=np.searchsorted(keys,blk+b[q[k]],'left')
+                m=e>s
+                k,s,e=k[m],s[m],e[m]
+                # two overlapping ranges of 2**j parts cover s...e-1
+                j=np.floor(np.log2(e-s)).astype(int)
+                for jj in np.unique(j):
+                    w=q[k[j==jj]]
+                    r=np.minimum(table[jj][s[j==jj]],
+                                 table[jj][e[j==jj]-2**jj])
+                    best[w]=np.minimum(best[w],r)
+            p=p+2**h
+            m=p<n
+            q,p=q[m],p[m]
+        return np.where(best<n,part[np.minimum(best,n-1)],-1).reshape(shape)
+
+def ratioindex(cat,r1range=(100.0,10000.0),span=100.0):
+    '''sorted table of the ratios r2/r1 of the stock resistors
+    (cheapest part of every value), with r1 in r1range and r2/r1
+    from 1/span to span (cached)
+    output:
+      log of the ratios, indexes of r1 and r2 in parts('R')'''
+    key=('ratios',r1range,span)
+    def build():
+        lv,i=cat.index('R')
+        p1=np.flatnonzero((lv>=math.log(r1range[0]))&
+                          (lv<=math.log(r1range[1])))
+        # the r2 of every r1 are a range of the sorted values
+        a=np.searchsorted(lv,lv[p1]-math.log(span),'left')
+        b=np.searchsorted(lv,lv[p1]+math.log(span),'right')
+        n=b-a
+        q1=np.repeat(p1,n)
+        q2=np.repeat(a-np.cumsum(n)+n,n)+np.arange(n.sum())
+        k=lv[q2]-lv[q1]
+        o=np.argsort(k,kind='stable')
+        return k[o],i[q1[o]],i[q2[o]]
+    return cat._cached(key,build)
+
+def bestdivider(cat,alfa,r1range=(100.0,10000.0),span=100.0):
+    '''stock resistors for dividers r2/r1=alfa, as bestress() with
+    the ratios of ratioindex()
+    input:
+      alfa= array of ratios r2/r1 (>0)
+    output:
+      indexes of r1 and r2 in parts('R') (-1 where there is none),
+      errors in % of alfa ((alfa-r2/r1)/(r2/r1))'''
+    keys,i1,i2=ratioindex(cat,r1range,span)
+    alfa=np.asarray(alfa,dtype=float)
+    if len(keys)==0:
+        return np.full(alfa.shape,-1),np.full(alfa.shape,-1), \
+               np.full(alfa.shape,np.nan)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        x=np.log(alfa)
+        j=np.clip(np.searchsorted(keys,x),1,max(len(keys)-1,1))
+        lo=np.maximum(j-1,0)
+        hi=np.minimum(j,len(keys)-1)
+        n=np.where(np.abs(x-keys[lo])<=np.abs(keys[hi]-x),lo,hi)
+        err=(alfa/np.exp(keys[n])-1)*100
+    ok=np.isfinite(x)
+    return np.where(ok,i1[n],-1),np.where(ok,i2[n],-1), \
+           np.where(ok,err,np.nan)
+
+def _isat(cat):
+    '''column of the saturation current of the inductors'''
+    return 'isat' if 'isat' in cat.parts('L') else 'rating'
+
+def bestinductor(cat,lmin,ipk,margin=1.0,span=2.0,rank=('dcr','size')):
+    '''best inductors of a catalog for arrays of designs: lowest DCR
+    (then size) among the ones with lmin<=L<=lmin*span and
+    Isat>=ipk*margin (isat column, or rating)
+    output:
+      indexes in cat.parts('L'), -1 where there is none'''
+    lmin=np.asarray(lmin,dtype=float)
+    return cat.best('L',lmin,lmin*span,np.asarray(ipk)*margin,_isat(cat),
+                    rank)
+
+def inductors(cat,lmin,ipk,k=5,margin=1.0,span=2.0,rank=('dcr','size')):
+    '''the k best inductors of a catalog for one design, as
+    bestinductor()
+    output:
+      list of dict of the parts'''
+    c=cat.parts('L')
+    i=np.flatnonzero((c['value']>=lmin)&(c['value']<=lmin*span)&
+                     (c[_isat(cat)]>=ipk*margin))
+    i=i[np.lexsort([np.nan_to_num(c[x][i],nan=math.inf)
+                    if x in c else np.zeros(len(i)) for x in rank[::-1]])]
+    return [{x:a[j].item() for x,a in c.items()} for j in i[:k]]
+
+def bestcap(cat,mode,iout,ipk,di,f,ton,vripple,vout,vmargin=1.0,
+            chunk=1<<22):
+    '''cheapest output capacitors of a catalog for arrays of designs,
+    with total ripple (vec.ripple() with the esr column, 0 if there
+    is none; parts with unknown esr are skipped) <= vripple and
+    rating>=|vout|*vmargin
+    input:
+      mode, iout, ipk, f, ton, vripple, vout= arrays of the designs
+      di= ripple current of the inductor (ipk with L=Lmin)
+      chunk= max designs*parts evaluated at once
+    output:
+      indexes in cat.parts('C') (-1 where there is none), ripple'''
+    mode,iout,ipk,di,f,ton,vripple,vout=[np.atleast_1d(x) for x in
+        np.broadcast_arrays(vec.modecode(mode),iout,ipk,di,f,ton,vripple,
+                            vout)]
+    c=cat.parts('C')
+    esr=c['esr'] if 'esr' in c else np.zeros(len(c['value']))
+    rating=cat.levels('C',np.abs(vout)*vmargin)
+    idx=np.full(mode.shape,-1)
+    rip=np.full(mode.shape,np.nan)
+    for lev in np.unique(rating):
+        # candidate table: parts rated for lev, cheapest first
+        i=np.flatnonzero((c['rating']>=lev)&np.isfinite(esr)&
+                         (c['value']>0))
+        i=i[np.lexsort((c['value'][i],c['price'][i]))]
+        m=np.flatnonzero(rating==lev)
+        if len(i)==0:
+            continue
+        step=max(1,chunk//len(i))
+        for a in range(0,len(m),step):
+            k=m[a:a+step]
+            r=vec.ripple(mode[k,None],iout[k,None],ipk[k,None],di[k,None],
+                         f[k,None],ton[k,None],c['value'][i],esr[i])
+            good=r<=vripple[k,None]
+            j=np.argmax(good,axis=1)
+            found=good[np.arange(len(k)),j]
+            idx[k]=np.where(found,i[j],-1)
+            rip[k]=np.where(found,r[np.arange(len(k)),j],np.nan)
+    return idx,rip
+
+# components of snapbatch(): index in parts(kind), value (SI units)
+# and error in % (r_err for the divider)
+CATSNAPS=('ct','rsc','r1','r2','l','cout')
+
+def snapbatch(cat,batch,vout,vmargin=1.0):
+    '''parts of a catalog for a batch of designs (vec.snap() with the
+    parts in stock instead of E series)
+    Rsc is rated for ipk**2*rsc, Cout for |vout|*vmargin, L is
+    chosen by bestinductor(), R1 and R2 by bestdivider()
+    input:
+      cat= Catalog
+      batch= Batch from vec.compute()
+      vout= output voltages of the batch
+    output:
+      {name+'_i', name for name in CATSNAPS, and ct_err, rsc_err,
+      r_err, l_err, cout_err: array}, index -1 and nan where there
+      is no part or batch.ok is False'''
+    ok=batch.ok
+    def fill(x):
+        return np.where(ok,x,np.nan)
+    want={'ct':(fill(batch.ct),'C',None),
+          'rsc':(fill(batch.rsc),'R',fill(batch.ipk**2*batch.rsc)),
+          'cout':(fill(batch.cout),'C',fill(np.abs(vout)*vmargin))}
+    out={}
+    def put(name,kind,x,rating=None):
+        i,e=cat.snap(kind,x,rating)
+        v=np.where(i>=0,cat.parts(kind)['value'][i],np.nan)
+        out[name+'_i'],out[name],out[name+'_err']=i,v,e
+    for name,(x,kind,rating) in want.items():
+        put(name,kind,x,rating)
+    i=bestinductor(cat,fill(batch.lmin),fill(batch.ipk))
+    out['l_i']=i
+    out['l']=np.where(i>=0,cat.parts('L')['value'][i],np.nan)
+    with np.errstate(invalid='ignore'):
+        out['l_err']=(batch.lmin-out['l'])/out['l']*100
+    r=cat.parts('R')['value']
+    i1,i2,out['r_err']=bestdivider(cat,fill(np.abs(vout)/eng.VREF-1.0))
+    for name,i in (('r1',i1),('r2',i2)):
+        out[name+'_i']=i
+        out[name]=np.where(i>=0,r[i],np.nan)
+    return out
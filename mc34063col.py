@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+'''
+Columnar files for the results of large sweeps.
+Every column is a file of raw little endian values, appended chunk
+by chunk, so a sweep never has to fit in memory; a small json
+header (meta.json) keeps the number of rows and the dtype of
+every column. read() memory-maps the columns back without copying.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import json
+import os
+import numpy as np
+import mc34063eng as eng
+
+FORMAT=1
+META='meta.json'
+
+def columns(cols,batch):
+    '''columns of one chunk of a sweep (inputs, ok, outputs and the
+    other columns of cols, like the as-built ones)
+    the mode is stored as code (index in eng.MODES)'''
+    out={k:cols[k] for k in eng.INPUTS}
+    out['mode']=np.asarray(cols['mode'],dtype=np.int8)
+    out['ok']=batch.ok
+    for k in eng.OUTPUTS:
+        out[k]=getattr(batch,k)
+    for k in cols:
+        if k not in out:
+            out[k]=cols[k]
+    return out
+
+class Writer:
+    '''append chunks of columns to a directory of column files'''
+
+    def __init__(self,path):
+        os.makedirs(path,exist_ok=True)
+        self.path=path
+        self.rows=0
+        self.dtypes={}
+        self.files={}
+
+    def write(self,cols):
+        '''append one chunk
+        input:
+          cols= {name: 1-D array}, all with the same length and the
+          same names and dtypes at every call'''
+        n=None
+        for k,a in cols.items():
+            a=np.ascontiguousarray(a)
+            dt=a.dtype.newbyteorder('<')
+            if k not in self.files:
+                if self.rows:
+                    raise ValueError('new column %s' % k)
+                self.dtypes[k]=dt.str
+                self.files[k]=open(os.path.join(self.path,k+'.col'),'wb')
+            elif dt.str!=self.dtypes[k]:
+                raise ValueError('dtype of column %s changed' % k)
+            if n is None:
+                n=len(a)
+            elif len(a)!=n:
+                raise ValueError('columns of different length')
+            self.files[k].write(a.astype(dt,copy=False).tobytes())
+        self.rows+=n or 0
+        self._meta()
+
+    def _meta(self):
+        '''write the header (last, so readers never see missing rows)'''
+        for f in self.files.values():
+            f.flush()
+        tmp=os.path.join(self.path,META+'.tmp')
+        with open(tmp,'w') as f:
+            json.dump({'format':FORMAT,'rows':self.rows,
+                       'columns':self.dtypes,'modes':eng.MODES},f)
+        os.replace(tmp,os.path.join(self.path,META))
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+        self.files={}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+def writesweep(path,chunks,valid=True):
+    '''write a sweep (generator of mc34063swp.sweep())
+    input:
+      valid= write only the valid points
+    output:
+      number of rows written'''
+    with Writer(path) as w:
+        for cols,batch in chunks:
+            c=columns(cols,batch)
+            if valid:
+                c={k:a[batch.ok] for k,a in c.items()}
+            w.write(c)
+        return w.rows
+
+def read(path):
+    '''memory-map the columns of a directory (read only)
+    output:
+      {name: numpy.memmap or empty array}, header'''
+    with open(os.path.join(path,META)) as f:
+        meta=json.load(f)
+    if meta['format']!=FORMAT:
+        raise ValueError('unknown format %s' % meta['format'])
+    n=meta['rows']
+    out={}
+    for k,dt in meta['columns'].items():
+        if n==0:
+            out[k]=np.empty(0,dtype=dt)
+        else:
+            out[k]=np.memmap(os.path.join(path,k+'.col'),dtype=dt,
+                             mode='r',shape=(n,))
+    return out,meta
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+'''
+Continuous (CCM) and discontinuous (DCM) conduction of mc34063
+designs.
+The equations of compute() are for continuous conduction and Lmin
+is the inductance at the boundary for iout: at lighter loads (or
+with a smaller inductor) the inductor current reaches 0 before the
+end of the cycle and ton, the peak current and Cout are different.
+classify() gives the regime and the boundary load of arrays of
+designs, dcm() the discontinuous conduction values and regime()
+the columns of a sweep with the values of the right regime.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+
+# regimes
+CCM=0
+DCM=1
+
+# columns of regime(): regime, boundary load (A), inductance at the
+# boundary (H) and ton, toff (s), diode conduction time (s), Ct (F),
+# peak current (A), Rsc (Ohm), Cout (F) of the regime
+REGIME=('regime','iob','lcrit','rg_ton','rg_toff','rg_tdiode','rg_ct',
+        'rg_ipk','rg_rsc','rg_cout')
+
+def boundary(mode,vin,vout,vf,vsat,ton,toff,l):
+    '''load current at the boundary of continuous conduction
+    input:
+      mode, vin, vout, vf, vsat (V), ton, toff (s) of continuous
+      conduction, l (H), as scalars or arrays
+    output:
+      boundary load (A): continuous conduction above it'''
+    down=vec.modecode(mode)==vec.STEPDOWN
+    with np.errstate(divide='ignore',invalid='ignore'):
+        di=np.where(down,vin-vsat-vout,vin-vsat)*ton/l
+        # the mean inductor current is iout in StepDown,
+        # iout*(ton+toff)/toff otherwise
+        return np.where(down,di/2,di/2*toff/(ton+toff))
+
+def classify(mode,vin,vout,iout,vf,vsat,ton,toff,l):
+    '''regime of arrays of designs
+    input:
+      as boundary(), iout (A) load current
+    output:
+      regime (CCM or DCM, int8), boundary load (A)'''
+    iob=boundary(mode,vin,vout,vf,vsat,ton,toff,l)
+    # at the boundary (l=lmin) rounding must not give DCM
+    dcm=np.abs(iout)<iob*(1-1e-9)
+    return np.where(dcm,DCM,CCM).astype(np.int8),iob
+
+def dcm(mode,vin,vout,iout,fmin,vripple,vf,vsat,l):
+    '''values of discontinuous conduction with a given inductor
+    input:
+      as vec.compute(), l (H), as scalars or arrays
+    output:
+      {'ton','toff','tdiode','ct','ipk','rsc','cout': array}
+      (valid where classify() gives DCM)'''
+    mode=vec.modecode(mode)
+    up=mode==vec.STEPUP
+    down=mode==vec.STEPDOWN
+    vo=np.abs(vout)
+    iout=np.abs(iout)
+    vl=vin-vsat
+    with np.errstate(divide='ignore',invalid='ignore'):
+        tonplustoff=1/np.asarray(fmin,dtype=float)
+        k=2*l*tonplustoff*iout
+        # the mean current delivered in a cycle is iout
+        ton=np.where(down,np.sqrt(k*(vo+vf)/((vl-vo)*(vl+vf))),
+                     np.sqrt(k*np.where(up,vo+vf-vin,vo+vf))/vl)
+        ipk=np.where(down,vl-vo,vl)*ton/l
+        tdiode=ipk*l/np.where(up,vo+vf-vin,vo+vf)
+        # charge of the capacitor while the current is over iout, and
+        # the load discharge of a cycle skipped by the comparator
+        q=np.where(down,ton+tdiode,tdiode)*(ipk-iout)**2/(2*ipk)+ \
+          iout*tonplustoff
+        return {'ton':ton,'toff':tonplustoff-ton,'tdiode':tdiode,
+                'ct':eng.KCT*ton,'ipk':ipk,'rsc':eng.VSENSE/ipk,
+                'cout':q/vripple}
+
+def regime(cols,batch,l=None,iout=None):
+    '''regime columns of a batch of designs
+    input:
+      cols= columns of the inputs
+      batch= Batch from vec.compute()
+      l= inductance (default batch.lmin, at the boundary for iout)
+      iout= load current (default cols['iout'], e.g. a light load)
+    output:
+      {name in REGIME: array}, nan where batch.ok is False'''
+    ok=batch.ok
+    mode,vin,vout,vf,vsat=[cols[k] for k in
+                           ('mode','vin','vout','vf','vsat')]
+    l=batch.lmin if l is None else l
+    iout=cols['iout'] if iout is None else iout
+    r,iob=classify(mode,vin,vout,iout,vf,vsat,batch.ton,batch.toff,l)
+    d=dcm(mode,vin,vout,iout,cols['fmin'],cols['vripple'],vf,vsat,l)
+    down=vec.modecode(mode)==vec.STEPDOWN
+    with np.errstate(divide='ignore',invalid='ignore'):
+        # continuous conduction: compute() with the inductor and load
+        di=np.where(down,vin-vsat-vout,vin-vsat)*batch.ton/l
+        ipk=np.where(down,np.abs(iout),
+                     np.abs(iout)*(batch.ton+batch.toff)/batch.toff)+di/2
+        cout=np.where(down,di*(batch.ton+batch.toff)/8,
+                      9*iout*batch.ton)/cols['vripple']
+        ccm={'ton':batch.ton,'toff':batch.toff,'tdiode':batch.toff,
+             'ct':batch.ct,'ipk':ipk,'rsc':eng.VSENSE/ipk,'cout':cout}
+        out={'regime':np.where(ok,r,-1).astype(np.int8),'iob':iob,
+             'lcrit':l*iob/np.abs(iout)}
+    for k in ccm:
+        out['rg_'+k]=np.where(r==DCM,d[k],ccm[k])
+    return {k:out[k] if k=='regime' else
+            np.where(ok,np.broadcast_to(out[k],ok.shape),np.nan)
+            for k in REGIME}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+'''
+Losses and efficiency of mc34063 designs.
+The inductor current of a cycle is a ramp during ton (switch and
+Rsc) and a ramp during the diode conduction, continuous or, in
+discontinuous conduction (mc34063dcm), from 0 in the cycles fired
+by the comparator (ton is fixed by Ct, the others are skipped);
+mean and rms currents of the ramps give the loss of
+the switch (vsat), of the diode (vf), of Rsc, of the DCR of the
+inductor, of the quiescent current and of the R1/R2 divider. All
+the equations work on arrays, so efficiency maps over vin x iout
+of a built design take one pass (effmap()).
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+import mc34063dcm as dcm
+
+# supply current of the mc34063 (A, typical of the datasheet)
+IQ=0.0025
+
+# dissipation (W) of: switch, diode, Rsc, inductor DCR, quiescent
+# current, R1/R2 divider
+LOSSES=('psw','pdiode','prsc','pdcr','pq','pdiv')
+# outputs of losses(): output power, total loss (W), efficiency,
+# the LOSSES and the peak current (A)
+EFFS=('pout','ploss','eff')+LOSSES+('ipeak',)
+
+def _ramp(a,b,t,tonplustoff):
+    '''mean and mean square over a cycle of a current going from a to
+    b in t'''
+    k=t/tonplustoff
+    return (a+b)/2*k,(a*a+a*b+b*b)/3*k
+
+def losses(mode,vin,vout,iout,vf,vsat,ton,toff,l,rsc,dcr=0.0,r1=eng.R1,
+           r2=None,iq=IQ):
+    '''losses and efficiency
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting', code or array of them
+      vin, vout (V), iout (A), vf, vsat (V), ton, toff (s) of the
+      oscillator (from vec.compute() or vec.evaluate(), ton fixed
+      by Ct),
+      l (H), rsc (Ohm, the standard value or network), dcr (Ohm) of
+      l, r1, r2 (Ohm, r2 default from vout), iq (A),
+      as scalars or arrays
+    output:
+      {name in EFFS: array}, ipeak is the peak of a fired cycle'''
+    mode=vec.modecode(mode)
+    down=mode==vec.STEPDOWN
+    up=mode==vec.STEPUP
+    io=np.abs(iout)
+    vo=np.abs(vout)
+    tonplustoff=ton+toff
+    r2=(vo/eng.VREF-1.0)*r1 if r2 is None else r2
+    with np.errstate(divide='ignore',invalid='ignore'):
+        reg,_=dcm.classify(mode,vin,vout,iout,vf,vsat,ton,toff,l)
+        # continuous: ramps around the mean inductor current
+        di=np.where(down,vin-vsat-vout,vin-vsat)*ton/l
+        il=np.where(down,io,io*tonplustoff/toff)
+        # discontinuous: ton is fixed by Ct, a fired cycle ramps from 0
+        # to di and the comparator skips the cycles not needed; the
+        # fraction k of fired cycles is the charge of iout in a cycle
+        # over the charge of a fired one
+        tdiode=di*l/np.where(up,vo+vf-vin,vo+vf)
+        q=di/2*np.where(down,ton+tdiode,tdiode)
+        k=np.minimum(io*tonplustoff/q,1.0)
+        c=reg==dcm.CCM
+        a=np.where(c,il-di/2,0.0)
+        b=np.where(c,il+di/2,di)
+        t1=np.where(c,ton,k*ton)
+        t2=np.where(c,toff,k*tdiode)
+        isw,isw2=_ramp(a,b,t1,tonplustoff)
+        idi,idi2=_ramp(b,a,t2,tonplustoff)
+        p={'psw':vsat*isw,'pdiode':vf*idi,'prsc':rsc*isw2,
+           'pdcr':dcr*(isw2+idi2),'pq':vin*iq,'pdiv':vo*vo/(r1+r2)}
+        pout=vo*io
+        ploss=sum(p.values())
+        out={'pout':pout,'ploss':ploss,'eff':pout/(pout+ploss),'ipeak':b}
+    out.update(p)
+    shape=np.broadcast(*out.values()).shape
+    return {k:np.broadcast_to(out[k],shape) for k in EFFS}
+
+def efficiency(cols,batch,snaps=None,dcr=0.0,iq=IQ):
+    '''losses of a batch of designs
+    input:
+      cols= columns of the inputs
+      batch= Batch from vec.compute()
+      snaps= {name in vec.SNAPS: array} to use the standard values
+        (vec.snap()) instead of the computed ones
+      dcr (Ohm), iq (A)= as losses()
+    output:
+      {name in EFFS: array}, nan where batch.ok is False'''
+    mode,vin,vout,iout,vf,vsat=[cols[k] for k in
+                                ('mode','vin','vout','iout','vf','vsat')]
+    if snaps is None:
+        r=losses(mode,vin,vout,iout,vf,vsat,batch.ton,batch.toff,
+                 batch.lmin,batch.rsc,dcr,batch.r1,batch.r2,iq)
+    else:
+        p=vec.parts(snaps)
+        e,_=vec.evaluate(mode,vin,iout,vf,vsat,**p)
+        r=losses(mode,vin,e['vout'],iout,vf,vsat,e['ton'],e['toff'],p['l'],
+                 p['rsc'],dcr,p['r1'],p['r2'],iq)
+    return {k:np.where(batch.ok,r[k],np.nan) for k in EFFS}
+
+def effmap(mode,parts,vin,iout,vf,vsat,dcr=0.0,iq=IQ):
+    '''efficiency map of a built design over vin x iout
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting'
+      parts= {'ct','rsc','r1','r2','l','cout'} in SI units
+        (vec.parts() of the standard values)
+      vin, iout= 1-D arrays of the axes
+      vf, vsat (V), dcr (Ohm), iq (A)
+    output:
+      {name in EFFS: array (len(vin), len(iout))}, ok mask (False
+      where the design cannot work or the current limit is reached)'''
+    vin=np.asarray(vin,dtype=float)[:,None]
+    iout=np.asarray(iout,dtype=float)[None,:]
+    r,ok=vec.evaluate(mode,vin,iout,vf,vsat,**parts)
+    e=losses(mode,vin,r['vout'],iout,vf,vsat,r['ton'],r['toff'],parts['l'],
+             parts['rsc'],dcr,parts['r1'],parts['r2'],iq)
+    ok=ok&(e['ipeak']<=r['ilim'])&np.isfinite(e['eff'])
+    return e,ok
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+'''
+Design engine for switching regulator with mc34063
+in step down, step up and invert mode.
+This module has no globals state, does not print and does not
+import the GUI: all functions take the input parameters and
+return an immutable Design record, so it can be called from
+batch tools and from many threads at once.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+from collections import namedtuple
+from mc34063ser import E24, E12, E6, matchval, bestres
+
+# version of the results of compute() and snap(),
+# to change when they change (it invalidates the stored designs)
+VERSION=2
+
+MODES=('StepDown','StepUp','Inverting')
+
+# mc34063 constants
+VREF=1.25       # reference voltage (V)
+VSENSE=0.3      # current sense threshold (V)
+KCT=0.00004     # ct=KCT*ton (F/s)
+FMINLO=24000.0  # limits for fmin (Hz)
+FMINHI=42000.0
+VINLO=3.0       # limits for vin (V)
+VINHI=40.0
+R1=1000.0       # fixed value of r1 (Ohm)
+
+# inputs of a design, in the same order used by compute()
+INPUTS=('mode','vin','vout','iout','fmin','vripple','vf','vsat')
+# computed values
+OUTPUTS=('ton','toff','ct','ipk','rsc','lmin','cout','r1','r2')
+
+Design=namedtuple('Design',INPUTS+OUTPUTS)
+Design.__doc__='''inputs and computed values of a mc34063 design'''
+
+def valid(mode,vin,vout,iout,fmin,vripple,vf,vsat):
+    '''test input parameters
+    output:
+      True if a design can be computed'''
+    if iout<=0 or vripple<=0 or fmin<FMINLO or fmin>FMINHI or vsat<=0 or \
+       vf<=0 or vin>VINHI or vin<VINLO or abs(vout)<VREF:
+        return False
+    if mode=='Inverting':
+        return vout<0 and vin-vsat-vout>0
+    elif mode=='StepDown':
+        return vout>0 and vout<vin and vin-vsat-vout>0
+    elif mode=='StepUp':
+        return vout>vin and vin-vsat>0
+    return False
+
+def compute(mode,vin,vout,iout,fmin,vripple,vf,vsat):
+    '''compute a design
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting'
+      vin, vout (V), iout (A), fmin (Hz), vripple, vf, vsat (V)
+    output:
+      Design record or None if input data are not valid'''
+    if not valid(mode,vin,vout,iout,fmin,vripple,vf,vsat):
+        return None
+    tonplustoff=1/fmin
+    if mode=='StepUp':
+        tonontoff=(abs(vout)+vf-vin)/(vin-vsat)
+    else:
+        tonontoff=(abs(vout)+vf)/(vin-vsat-vout)
+    toff=tonplustoff/(tonontoff+1.0)
+    ton=tonplustoff-toff
+    ct=KCT*ton
+    if mode=='StepDown':
+        ipk=2*abs(iout)
+        lmin=(vin-vsat-vout)/ipk*ton
+        cout=ipk*tonplustoff/(8*vripple)
+    else:
+        ipk=2*abs(iout)*(tonontoff+1.0)
+        lmin=(vin-vsat)/ipk*ton
+        cout=9*iout*ton/vripple
+    rsc=VSENSE/ipk
+    r1=R1
+    r2=(abs(vout)/VREF-1.0)*r1
+    return Design(mode,vin,vout,iout,fmin,vripple,vf,vsat,
+                  ton,toff,ct,ipk,rsc,lmin,cout,r1,r2)
+
+# standard values, as printed by printc():
+# Ct (pF), one of the 3 resistors of Rsc (Ohm), R1 and R2 (kOhm),
+# Lmin (uH), Cout (uF) and their errors in %
+SNAPS=('ct_pf','ct_err','rsc3','rsc_err','r1_k','r2_k','r_err',
+       'lmin_uh','lmin_err','cout_uf','cout_err')
+
+Snap=namedtuple('Snap',SNAPS)
+Snap.__doc__='''standard values of a design and their errors in %'''
+
+def snap(d,sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6):
+    '''standard values of a design, as printc()
+    input:
+      d= Design from compute()
+      series (E3...E192) used for Ct, Rsc, R1 and R2, Lmin, Cout
+    output:
+      Snap record'''
+    ct=matchval(d.ct/1e-12,sct)
+    rsc=matchval(d.rsc*3,srsc)
+    r=bestres(abs(d.vout)/VREF-1.0,sr)
+    lmin=matchval(d.lmin/1e-6,sl)
+    cout=matchval(d.cout/1e-6,sc)
+    return Snap(ct[0],-1*ct[1],rsc[0],-1*rsc[1],r[0],r[1],-1*r[2],
+                lmin[0],-1*lmin[1],cout[0],-1*cout[1])
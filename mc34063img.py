@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 '''
-This module includes base64 encoded png images of stepup,
-stepdown and inverting switching regulator with mc34063.
+This module loads the png images of stepup,
+stepdown and inverting switching regulator with mc34063
+(img/StepUp.png, img/StepDown.png, img/Inverting.png).
+Every image is read only when first needed and then kept.
 Images from 'MC3x063A 1.5-A Peak Boost/Buck/Inverting
 Switching Regulators' by TEXAS INSTRUMENTS
 SLLS636N – DECEMBER 2004 – REVISED JANUARY 2015
@@ -10,1644 +12,35 @@ Fabio Sturman fabio.sturman@gmail.com (c) 2023
 This program is covered by
 GNU General Public License, version 3
 '''
+import functools
+import os
 
-StepUp='iVBORw0KGgoAAAANSUhEUgAAAe0AAAF1CAYAAADFgbLVAAAAw3pUWHRSYXcgcHJvZmlsZSB0eXBl\
-IGV4aWYAAHjabVBBEsMgCLz7ij5BARWeYxs70x/0+QUhM7Htzshu2GSDpPl+PdPNAIUS1c5NWssK\
-EhIYKjg7xqol06oL8whV9n7qNSQoozK6wc25nP344OQyVNVLED/CuO+GkDPwVxA4oU1k+oggiSAE\
-N0oEDL9WbsL9eoX7zDvYT7JCvI/989x1e0fV/yDAxIJZKyL5AGgHEw4zVhV7UXlgxbY6PcJ0If/2\
-dCJ9AIVSWYM69CkYAAABhGlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw0AYht+maqVUHNpBxCFDdbJL\
-FXGsVShChVArtOpgcv2FJg1Jiouj4Fpw8Gex6uDirKuDqyAI/oC4ujgpukiJ3yWFFjHecdzDe9/7\
-cvcdILRqTDX7EoCqWUYmlRRz+VUx8IogwjTjGJCZqc9JUhqe4+sePr7fxXiWd92fY6hQNBngE4kT\
-TDcs4g3imU1L57xPHGEVuUB8Tjxp0AWJH7muuPzGueywwDMjRjYzTxwhFss9rPQwqxgq8TRxtKBq\
-lC/kXC5w3uKs1hqsc0/+wlBRW1nmOq0xpLCIJUgQoaCBKmqwEKNdI8VEhs6THv5Rxy+RSyFXFYwc\
-C6hDhez4wf/gd2/N0lTcTQolgf4X2/4YBwK7QLtp29/Htt0+AfzPwJXW9ddbwOwn6c2uFj0ChreB\
-i+uupuwBlzvAyJMuG7Ij+WkJpRLwfkbflAfCt0Bwze1b5xynD0CWepW+AQ4OgYkyZa97vHuwt2//\
-1nT69wOfXnK4D7J/fQAADXhpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdp\
-bj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+Cjx4OnhtcG1ldGEgeG1sbnM6\
-eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDQuNC4wLUV4aXYyIj4KIDxyZGY6\
-UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5z\
-IyI+CiAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgIHhtbG5zOnhtcE1NPSJodHRw\
-Oi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5h\
-ZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOmRjPSJodHRw\
-Oi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgIHhtbG5zOkdJTVA9Imh0dHA6Ly93d3cu\
-Z2ltcC5vcmcveG1wLyIKICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8x\
-LjAvIgogICAgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIgogICB4bXBN\
-TTpEb2N1bWVudElEPSJnaW1wOmRvY2lkOmdpbXA6ZDYyNzVlN2YtZmNiZi00ODQ4LTk5NTctMWNm\
-N2Q3Y2IxYzlhIgogICB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOjEwMjFmZjg1LWE4YWYtNDUy\
-Yy1iOTljLTZiZDA3NzlmMmJlYSIKICAgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlk\
-OjgyMzgyMDQ0LWFlZTItNDkzZi1hNGYyLTVjMmZhNGViMmQzOSIKICAgZGM6Rm9ybWF0PSJpbWFn\
-ZS9wbmciCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IkxpbnV4IgogICBHSU1Q\
-OlRpbWVTdGFtcD0iMTY5Nzc0NTM4MTI1NTg3NiIKICAgR0lNUDpWZXJzaW9uPSIyLjEwLjM0Igog\
-ICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCIKICAg\
-eG1wOk1ldGFkYXRhRGF0ZT0iMjAyMzoxMDoxOVQyMTo1NjoxNyswMjowMCIKICAgeG1wOk1vZGlm\
-eURhdGU9IjIwMjM6MTA6MTlUMjE6NTY6MTcrMDI6MDAiPgogICA8eG1wTU06SGlzdG9yeT4KICAg\
-IDxyZGY6U2VxPgogICAgIDxyZGY6bGkKICAgICAgc3RFdnQ6YWN0aW9uPSJzYXZlZCIKICAgICAg\
-c3RFdnQ6Y2hhbmdlZD0iLyIKICAgICAgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDpmNGQxNWJm\
-MC03YTIyLTQ0YWItODkzNS0wMWU5ZGQ2ZWUyM2MiCiAgICAgIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9\
-IkdpbXAgMi4xMCAoTGludXgpIgogICAgICBzdEV2dDp3aGVuPSIyMDIzLTEwLTE5VDIxOjU2OjIx\
-KzAyOjAwIi8+CiAgICA8L3JkZjpTZXE+CiAgIDwveG1wTU06SGlzdG9yeT4KICA8L3JkZjpEZXNj\
-cmlwdGlvbj4KIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAK\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-IAogICAgICAgICAgICAgICAgICAgICAgICAgICAKPD94cGFja2V0IGVuZD0idyI/PoMOKfYAAAAG\
-YktHRAD/AP8A/6C9p5MAAAAJcEhZcwAACxMAAAsTAQCanBgAAAAHdElNRQfnChMTOBWrqyRzAAAg\
-AElEQVR42uzdd1gU19fA8S+9SrPH3nvBhoIkRhFFjdixoYn5mVijYu+x995716jYGyiiJhILimLH\
-EkEsCCpFOsvu+4eRVwOoKCC7nM/z+LhM3Tlzd8/emTv3aqlUKhVCCCGEyPG0JQRCCCGEJG0hhBBC\
-SNIWQgghJGkLIYQQQpK2EEIIISRpCyGEEJK0hRBCCCFJOxscPHAApVIpZ1kIIT7gxvXrPLh/XwKh\
-BrQ0uXOV8mXKoEyWpC2EEB+SJ08e+g0YQO9ff5Fg5HC6mnxw5ubmHPc6iaWVpZxpIYRIx6wZMyQI\
-akLuaQshhBCStIUQQgghSVsIIYSQpC2EEEIISdpCCCGEkKQthBBCSNIWQgghhCRtIYQQQkjSFkII\
-ISRpCyGEEEKSthBCCCEkaQshhBCStIUQQgghSVsIIYQQ/6UrIdAMp06d4sLf5yhZqhQAtna2FC9R\
-Is1lPY4dIyI84ov3Wap0KWzq109z3jX/a9y6efOL92FkbMQPrVujrZ3692VoaCjeXie/eB9aWlo0\
-beaIlZVVqnnJCgWHDh4iPj7+i/dTvUZ1KlepkuY8n7M+BD969MX7yJ8/P02aOqQ578GDB/heuPjl\
-Xxp6urRs1QojI6NU82JiYjh6+DDJmTCOvV1DO4oVL56lZbh0mdLUs7FJc56/vz+3b976ou0nJCQQ\
-GPiQsePHo6srX7dCkrb417hRo3n+/HnK3y5dOjMtjTFyw1+F81v/ASiVX/6lWqhwIc6eO5fmvEkT\
-JuDv758px1apUmXKVyifavof27ezeOGiTNlHVFQUvX/9JdX0GzduMMzNLVP2Ub9BA7bu2J7mvEED\
-BhAR8eVJSEdXh6vXrmFkbJxq3tJFizl08GCmHIuFhQUOTZummn7C8zijR47KlH106dqVKdOnpZr+\
-8uXLTCvD33zzDX/+7ZPmvN/Hj+f6teuZcix16tSh5Q8/yBeV+PJKhkqlUmnqwdWtVYvjXiextLLU\
-+BPZvUsX/PyusGbdOgCqVa+GmZlZmsvevnWLV6/Cv3ifRYsWpUTJtGvzz549458H/3zxPkxNTahR\
-s2aa8+Li4rji58eXlmBtbS1q1a6NgYFBmvP9Ll8mLu7La9rlypWlQMGCac77559/ePb02RfvI1++\
-fFSoWCHNeRHh4dz8wpojgL6+HrXr1Enz6keyQsGlS5dQKJK/eD8fKsO3bt4kPBNq2sWKFU33ilRm\
-lOHg4GCOHj7EspUryZMnT479/pg1YwZWVnnT/OEqJGlL0s4CP7q6cvmyH9dv3ZRSLYSQpK2hpCGa\
-EEIIIUlbCCGEEJK0hRBCg61asZJFCxZIIIQkbXWlUqnYvWsXQ34bxOaNm0hISJCgCKFhEhMTWbFs\
-GXNnz+b2rdsSECFJW115HD3GtMlTsLWzZe3q1WzbskWCIoSGueTri/9Vf+y//VaCISRpqzNDI0OM\
-jIyoWq0a5ubmaT6HK4TIWa75X6Nn9+6Ef+IjljY29Vm5ZjUFCxWS4AlJ2uqsob09BQsVwrnVD7x4\
-8YLmzZ0kKELkcL4XL+Bz1of79+9/0vI6ujoSNCFJWxNsXL+B5ORk/K75U9PamhnTpklQhBBCkrbI\
-iSIjI1EoFOj82wtVRGSEBEUIIXIZ6XtcTbj2cMX34kWsq9fA3Nyc1evXSVCE0FAzZs2UIIjcU9O+\
-ffs2rl27EhkeQY/u3fE566P2x1SwUCF2uu/G94of53wvUqNGDSm9QgghNW319uzZM1zadyA+Lh6l\
-SsWd27f5X6+f+GPXrnQHnlAnOXnQASHUUc1q1Yh+HZ2l++jSqVOOjoGWlhbdXLtLYZCknf28jp9A\
-qVKhVL0Ztk+lUpGsUOC+e7dGJG0hROaKfh3N/cCHWbLtdWvWMGPadHbs2kXdenUl2EKS9n+ZmJqk\
-mqZUqtixbTs7tm3X+BNatmQpKdVC/b+YdHS58+CeBEIITU/aTk5OLF28hOfPn5MQH4+enh5GRkYc\
-9fSkUGHN7bDgR1dX/Pz8uHZThuYU8uNTCE2lcQ3RjIyNOXz0KIMGD0ZPTw/Xnj047n1SoxM2QEcX\
-F3r/8quUaCGEkJq2ejE2MeaXPr+yZvUq+vbrj6WVpcafyJatWklpFkIIqWkLIYQQQpK2EEIIISRp\
-CyGEEJK0hRBCCCFJWwghhBCStDXehvXrGTV8hARCCCEkaYuc7sypUxw5ckQCIUQOYmRsDICxsZEE\
-Q2QKGZpTCCGySIeOHalYsSJVqlaVYAipaQshRE6mr69Prdq1JRBCkrYQQgghSVsIIb6i8FfhmJqY\
-EHAnQIIhhCRtIUROpFQq2bF9O82bNqWDSyeKlyguQRHiP6QhmhBpiI+P58C+fRQt9uWJQ6VS8c+D\
-+9SzqU+p0qUwMDD4ou29DHtJs6ZNsLCwwjSPabbF5OmTJ9jY1GfJimWZvu2bN24wcfwE9PR02bRt\
-KxUrVpRCKIQkbSE+zYhhwzh6OGseoatRsyatnZ1xbuOMhWXGR6B7/CSYiIhIkpWQrEzOtpiEh4dz\
-+87tjy7XqKE9p8/+9UnbjIyMZPHChRw7eozhI0bQpl1btLS0NOrqQVBQEKVKyfjgQpK2EFmmZMmS\
-APTp14+iRYt+0baSkpLwu3wZM7M8vHz5ij//PMOUSZNYsmgRbsOH0blLF7S1P/1OlfG/z/669nDF\
-bdjQbItJtUqVPykWjx8//qSrD/v37mPOrFk4tWyBp9cJ8uTJo3HlaI+7O6NHjOSIhwcVKlaQD5aQ\
-pC1EVjA0NATAsVkzqteo/sXbc+3ZI+V1XFwcR48cYd6cuUwYO46TJ7xYumI5Rka5owOOt5fClcpk\
-Vq5ZkynxzamiIiPf/B8VJR8qkSmkIZoQ2czIyIj2HTpw/KQXbdq15czp0/Ts7kp0dLRGH3dkZCRT\
-Jk2iV88fafXDD7jv26fRCVsISdoix1CpVBqfZLKaqakpc+bNo9f//off5cuMGTVKY8vKvj17adbE\
-gcjISDy9TvBjr58ydEtACPGGXB4Xn+WvP/+kf9++xMXGaeTxmZubZct+tLS0GD12DMGPHnH08BHs\
-7e3p6OKiMXG8eeMGv0+YSHKygtXr1knNWghJ2uJrSEpMwtbOjlVr1mjk8S1fupT5c+dlW+KeOWc2\
-/v7+zJ09h1atW6v9/e23rcIPHzxE3/796fFjT6lZC5EJ5FMkRI6o2ZvTp29fXr58yR/bt6v98TRr\
-4gCA1+lTcilcCKlpC6F5XLp0ZvnSpezYtp2ffv5ZrY9l49Ytn9VByvOQEJYvXUZAwB3y5c9Pt+7d\
-aWBri0qlYo+7O3+eOUORIkXoP3AgpqamUmiE1LSFEF+HgYEB3zdpwj///MOjoCC1PpbPSdjR0dG0\
-be3MrVu3aNuuPRYWFvTo1h2fsz6479rF1EmTsa5Vi2NHj7Fg3jwpMEJq2kJ9GRubYPJvpxtCfX33\
-3Xfs3rkTHx8fipcokeH1d+/axdHDR0hISODb777llz59MnRpOr2abnY4sH8/r1+/Zu2G9Zibm+PS\
-pTOPg4NZv3Yto8eOYfmqldja2eF3+TKhoaFSWITUtIX6mjpjOn/s3i2BUHMVKr2poQY/epThdS9e\
-uMC4MWNoaN+Qxk2aMH/uPHbv3JUpNd3sEBQYRNFixTA3N0+ZVrlKFR4FBVG2XDls7ew4feoUXsdP\
-4NK5sxQWITVtob6srKywsrKSQKi5ggUKvqnxPn+e4XUjIiJQKVUAODZzpE7dOuTLly9Tarp2De2y\
-vgznteLlixcolUoiIiIwNzMnNDSUfPnfHIP3SW8G9O3LmHHjaGhvL4VFSNIWQnxdxibG6OjqcNzD\
-g7L79mdoXYemTXHt2YOF8xcwY9p0qlStyrIVy7+4pnvC8zjwZuSzs3/9RdmSWTP4RdOmTVk4bz5L\
-Fy/GzMycHdu28fjxY9yGDeVuwF0G9uvHD61bU9PamocPH8ogHEKSthDi64qOjiZZkUxzZ2fmpNPY\
-6t7duzg5Nks1/XFwMM5t2jJi1Ch8L15k0oSJLJg3n3kLF2RKTdfQ0JDadeqwccvmD27nc5N6mbJl\
-Wbh4MVMmT+Z5SAgmJiZo6+hw88ZN7gbcJSEhgT3u7uxxd8fWzo7N27ZKgRGStIUQX8+rly8BsLTM\
-+K0Oj2MeLF64kI1btlCyZEmMTUxQKpWZUtPNLs1bONG8hROvX7/G1NSUkJAQDuzfT5++fZk1d44U\
-ECFJW0IgRM5x4/oNAEqXLp3hdV179uDihQt07tgRgAoVKzBw8KBMqekmJiZmaxzeDtNZuHBh+vTt\
-KwVDCEnamiUyMpK42DgKFS4kwVBjf//9pqX25zT8MjIyYu2G9cTGxKJUKT+r85H0arr6+vpycoTI\
-AeSRLw0xZuQo2jk7SyDUWHx8PCc8j1O8RAmKFS/+2dsxNjH+4t7C8uTJg5aW1mfXdO/dvasWMY+O\
-jsbMzOyzHrETQpK2+GwxMdG8lqEy1doed3devnyJa88ean8srl27MczNjcePH6c5PzQ0lEb235Ks\
-UHyV96dSqdi/dx+OTRxo3sKJvHnzZcl+qlWvTqVKlShRsoQUcCFJWwhNERERwfKly7CwsMDFRf07\
-Djn15xnKlStP29atGTdmDGFhYe/NX7ZkKY+Dg3Hflf0dAt2+dYsunTqxYf16lq1YzvSZMzE2yZre\
-BOvZ2HDo2FEKFCgghVxI0hZCU0wYN47nISGMHD0qyxJIdjIyNubXvn04cfIk5ubmODk2Y86sWbx+\
-/ZonT56kjGQ2a+ZM4uI+f0z2Rg0/vZOVqKgopkyaRM/urjR3asHeA/uxrlVLCp9QK9IQTWisimXK\
-oUj+vMuv5uZm2fIeVSoV06dO4+jhIzR1dKSji4tGnQMLS0uGjxxJ9x49WLZkCQ6NvqdgwULo6euT\
-HBdHXHwcq1euYtCQwZ+1/fQuv/83xvv37mP2zJnY2TfE08sLSytL+YAISdpC5CSKZAX3Ax9+1rrL\
-ly5l/tysHUnq9evXTJo4kf1791Gnbh3mzNfckasKFy7M1OnTaeLgQO+ff4Y3va2SlJjE6lUr6fnT\
-j1hYWGT6fm9cv87vEyaiVCazau1aqteoLh8Modbk8rgQ2SwmJobdO3fSzKEp+/fu47tGjdiwaVOu\
-GB96x7bt6Om8X1dITEhkzqxZmbqfiIgIpkyaxK+9f6Fb9+7s2b9fEraQmrYQmiohIQGA456e3Lp5\
-84u353/1KlraWoQ+D+XChQvExcZiZmbG9Jkz6ejSCS0tLY2PacCdAE55e6NSqd6brlKp2L1rN85t\
-2lDPxuaL9qFUKjmwbz+zZ86kRauWeHqdyBU/hoQkbSFytYf/vLmsvnL58kzdrp6eHlWrVaNt+3a0\
-bNXqvcE5NEXRokXTnF74m8IcPHKYSpUrp0q0nsc8GDViJMWKFWXUmDGplvkUb/tbt7C0ZPO2rZQr\
-X/6rx+JRUBBbNm/BbagbRjLevZCkLUTWmD5rJjb161Myk0aSCgsNpWq1apQqXQodHR2Njt3ps3+l\
-Od3MzAyzNJKxtrY2Ti1b0KSpA9u2buWnHj359rvvGDN+3Cfd5w4NDWX2zJmcP3eOocOG07Z9uxwT\
-i5NeXmxYt45mzZtTp24d+WAJSdpCZAVTU1O6uXaXQGQjfX19furVi04uLnxra0ffAf0/KWm3au5E\
-l25dOeHtjZGRUY46prcDtvz3loAQkrSFEBrBxMSEyMjITx4v+/hJLywsv/wRruchISxfuoyAgDvk\
-y5+fbt2708DW9r1lVq1YSXx8HIOGDJETJb4KaT0uhFBrmZGwo6OjadvamVu3btG2XXssLCzo0a07\
-PmffDOCSmJjIimXLmDt7Nrdv3ZagC6lpCyEEwO3bb5Lirj920tTRMVs6Qjmwfz+vX79m7Yb1mJub\
-49KlM4+Dg1m/di12De245OuL/1V/7L/9Vk6QkJq2EEIArF29mrat34xWN3XyJBrZ22fKI3cfExQY\
-RNFixd5rzV+5ShUeBQUBYGNTn5VrVlOwkAx9KyRpCyEEERERzJ45C0VSEgCxsXHExcUyYdz4LN+3\
-VV4rXr54gVKp5NWrVyQrkgkNDSVf/jejf+no6sgJEjmCXB4XQuQIISEh6OjopLS4BlAqVVy9coWy\
-JUtl6b6bNm3KwnnzWbp4MWZm5uzYto3Hjx/jNmyonBghSVsIIf6rbNmyWFpZERYWhurfxG1gYED7\
-jh2YPHVq2utkUjIvU7YsCxcvZsrkyTwPCcHExARtHR1u3rhJYmIi+vr6coKEJG2Reewa2mNubiGB\
-EOr7ZaSry+atWxg08DcC7tz5t9OVlowZNy5b9t+8hRPNWzjx+vVrTE1NCQkJ4cD+/e8l7BmzZsqJ\
-EpK0xZfr/esvEgSh/rXtcuU44nGMsiVLcetuALq62f8VlSdPHuDNyGR9+vaVkyIkaQshMiYuNpYk\
-hQIzs/TH+b565QrLliwFQEtbC3Nzc7q7ulKjZk21rXkLId4nrceFyEbhr8I5feoUl3wvoVAoPrr8\
-o6AgXLt2o0E9G763/5bOHTsSHByc5rJhYWGc8vambr16NLC1JfT5c3p0607Sv62xNdXdgLtSsITU\
-tIUQmevIocOMGDYMbR0dlMnJFChYkB07d1KocNrP/sbGxPJjj5781KsXG7dsBmDvnj2MHT36g/vp\
-7uqKsYkxBQoU4ML5C8TGxmrkaGJv/fzjj1SvUYOhI4ZTunTpNJc57umJY7NmUgiF1LSFEB/3+vVr\
-hrsNJSEhgbjYWBIS4nn29Cnjxo5Jdx0Pj2NUrlIZ15490NHRQUdHh46dOmHf0P6D+2rp5ESjhvb8\
-PmECQ4cP1+iEDeD95xnq1qtH5w4dGTdmDKGhoe/N9/TwoN+vffD08JCCKKSmLUSOLdw6uln+fO/n\
-00KhUHDa+1S671FbW5vfBg9ONb1y1aocOXI43S1PnT6dzZs2EvgwkNbOrTX+POvp6fFjr59o274d\
-q1eupEWz5rh0dqFPv34YGRkxafxEACaNn0gTBwe5Vy4kaYuvz+PYMQIfPqRPv34SjH/deXAvx7yX\
-uNhYbOrUJTY2NmWavr4+js2asXDJ4jTXOXTwIPv37ks1/dIlXxISEtPdl7W1NdbW1rR0csJt8BC2\
-7tiOlpaWxp9vc3Nzho8cSfcePVi2ZAkOjb6nZk1rXkW8AiDydRRbN2/mx1695MMh1JZcHtcQf2zf\
-wfJlyyQQOZSRsTHLV63CzMwMLW0ttLW1qVipEr9PnpTuOs2dnHgeEsLc2XOIjIzk9evXLFuylJvX\
-b3x0f8YmxsyaM5uLFy6we+euXBXrwoULM3X6dNasX8fpM6dQJL1p8JcQH8/CefOJjo7Otveio/Om\
-XqQr3aAKSdrifSpUKolCTtbQviHnfC9Sv4Et4ydOZM/+fR8cVlJPT4/N27fx7NlTGn/7Hd/ZNSQg\
-4E66HXw0dXTkfuBDjE2MAahnY8O9h//QqbNLroz3rj92wn8+E/Hx8cyfOy/b3kObtm2YMn0a1atX\
-lw+AyBRyeVyIbGRgYIC5uRn58+f/pEvWVlZWzFuw4M3PMpUKLS0t7t2VR5w+5m7AXXbu/AOV8v2s\
-rUhOZtuWzXTs1JFKlStn+fuwsLSkS9euckKEJG0hcpvccF/6LUMjQzau30Dnrl0wNDRMd7miRYum\
-nSwtzNnl7o51rVrvJ22FAvddu/n5x5+oXbcOI0eNomixYlK4hNqQy+NCiBzn4JEj+F68SJNG37Nx\
-/Qbi4+PTXO702b/SnF6gYMFUCRve9LLWuWsXjnufpFSp0rRp7czY0WOIiIiQoAtJ2kII8TlKly7N\
-spUrGDRkMCuXL6NDm7aZun1TU1Pchg3lqMcx/vbxweOoPMMt1INcHhdCTUVFRRH86FG27U+lUqHK\
-ptaOPmd9WLRgAS9evKBPv/507d4tS/ZToGBBylcoT/78+aRACUnaQojM9/r1awC2bt7M1s2bs3Xf\
-/9x/kGXbViqVnPY+xZLFi0hKTOLn3r1p3cYZHR31flxKxuMWkrSFyMWqVquGbUM7LC0syWOWJ9v2\
-G/gwEIemDlm2/RaOzYiIiGDwUDdcOnfWiIZ3nh4eDB08hKOeHhQvUUIKr5CkLURuo6+vz+atWzXu\
-uLbv2snOHTtYOG8+PmfP0rdfPypXqaLWx/Q4OJj4+HiePw/NkUl727ZtdO/eHXgzjnipUqWoWLEi\
-NWvWxN7ennr16slVghxGGqIJIXIEKysr+vbvz59/+2Bn15Bf/9cblw4d+dvHR4KTDe7evYufnx/z\
-5s0jPj4ee3t7BgwYwKtXryQ4krSFECL9Kwmdu3bB+88zOLVowcB+/XHp0EECkw10dHQoWrQoY8eO\
-pXv37qxZs4bff/8dpVIpwZGkLYQQaYuNiWX1ylUsX7oUpxYtmD5zpgQlm3849ezZE4AlS5Zw+/Zt\
-CUoOIfe0hRA5RlJSEnt2u7N40SJq16nNrj17KFmqpATmKyhevHjK64CAAKqoefsCSdpCCJGJFsyb\
-x64//sC6Vm02bdlMufLlJShfkYGBQcrrqKgoCUgOIZfHhRA5wuuoaBSKZFQqFXFx8RKQrywhISHl\
-tZmZmQREkrYQQvy/CZMm8vfFCzg2a8aQQb/h0qEj3l4nJTBfSVBQUMrrChUqSEAkaYvMpKurh56u\
-3O0Q6k1PT4+27dvh6eVFp84uzJw+nXbOzrjv3i3ByUaJiYls/re3vQEDBlCpUiUJiiRtkZlGjBrF\
-0hXLJRBCQ36E6tKkSRMaOzThwf0HXLhwQYKSDZKTk3ny5AnTp09n69at/PLLL0yaNAltbUkVOeaz\
-ISHQDOUrlKd8BWm4I9RfbEwsWzZvZt2aNTg2b8YJ75MUKFhQApPFChcuTOXKlalatSo1a9bk7Nmz\
-1K1bV3pEk6QthBCppTzutXAhtevWwX3fXumvO4t169aNbt26SSAkaQshRMa0cGzG6+hohg0fRodO\
-nSQgQqRBblQIIXKEI54eDB02lLVr1lKpXHmCAoMkKEJI0hZC5ET6+vp0dHHh2HFPkpKScuWzwSqV\
-Cvfdu/ltwABmzZhBdHS0FAwhSVsTKZVKkpKSJBBC7b0dR9vSyjLXHbv7rl1MnTQZ61q1OHb0GAvm\
-zZMCId4j97TVxIF9+zl//nzK30WLFqX/wAEpf48dNRq/y5fxPOklwRJCTVnXqsXyVSuxtbPD7/Jl\
-QkNDJShCatpq+etKTxcDAwMMDAzw9vIiKDDwvfnPnj3l6bNnEighcpCixYphaGhIwYIFPmn5suXK\
-YWtnx+lTp/A6fgKXzp0liEJq2uqoZatWtGzVips3bnDq5EnGTZwgQREih2vWvDnfX2ucoWedvU96\
-M6BvX8aMG0dDe3sJopCatjqbPnUaP/fuLR34C6EmMpKw7wbcZWC/fvzQujU1ra15+PChBFBI0lZX\
-V69cwf/qVdq0ayvBEEIDbdm0iYSEBPa4u9O2dWsmjhsvQRGan7RVKhWnT50iPi6ekye8UCgUGnFc\
-Z06fpnqNGlLLFiKTPLh/n0dBjzh37m/i47/+cKBTpk/jfuDDlH+bt23N1v3HxcVxYN9+1qxazYV3\
-Gr6KnEPj7mknJyfT68cfuXTRl8TERH6fOIHVq1ex7+ABTExM1PrYAh8GUqp0KSm1QmSCkye8GNC/\
-P0pFMkGBgXif9Obw0aMYmxjnyniEhYXh3OoHXkdGoVQpUaGiRcuWzJ0/XwqL1LSzzonjx7l86TIJ\
-CQmoVCri4+N48vgxmzZsUPtjW7B4EdNmzJBSK0QmmDRxIkmJiSQrk0lMTCT0+XN2/rEj18Zj0fwF\
-vHr5krj4OBISEkhMSOTo4SNc8fOTwpKDaKlUKpUmHdD6tWuZP3deqktd+vp6GBlp7i/o2NhYFApF\
-tl06VygUJCYkYPwVrl4kJiZy5fo1dNV0/PAB/frRqtUPNG/hJN9A6WjU8E2r6cePH2vIEakALTmx\
-/6Gro8udB/ckEBmJmaYdUEP7b5kze/b7CdtAn1mz5/Bto+809kT2+/VX/P2v4f3nmWzZ35lTp9l/\
-YD8LFi7M9mNtUNcGpVIpn14NdvrsX1m+j//91Aufv86SpEj694e9PivXrObb7zLve2Lj+g1MnTyZ\
-3Xv3Yl2rVo6O+fZt25g2ZSoJ71R4DA0N8f7zDAUKFMiSfZYtKbf7cn3SLl+hPIuWLGH8mLG8fPkS\
-Y2Njho0YwQ/OrTX6ROrp6aGlpYW5uXm27M/ExAQ9Xd1s21/qWosQX2bG7FkM7NePy5cuo6evx6BB\
-gzM1YQMkJ79pBKtQJOf4eHTp2pXnISGsWbWaxMREihQpwqy5c7IsYQtJ2ikcmzXDsVkz6lhbc+Kk\
-d67sw1gI8WH58+fnj927iYuNRd/AAB0dnVwdDy0tLYYMHUpzpxa4DRnMMU9PKSSStLO/EAohxIcY\
-GRtLEN6hra2Ntnx35tzzIyEQQgghJGkLIYQQQpK2EEKIrKBMTs4RvcMJSdpCCCE+Ijj4MSHPQiQQ\
-OZQMzSmEECKFSqVKsx+Y6OhokpOT0dLSkvEPJGmLL1WqdGnCwyMkEEKITBcXG0szh6bExsSAlhZX\
-rvlLUCRpiy8xcdIkCYIQIksYGRvjc/4c//zzD33+11sCIklbCCFEdrl18xbdu3TB3MIi1byIiAgS\
-4hP4rqE92tr/3+xJoVAQEx0tXahL0hZCCJGdVColhQoXZtWa1e9NT0hIoL1zWwDq1K7N4KFu76yj\
-IiYmRjqj+cqk9bgQQuQysbGxvAh7waqVK/H19aVY8eIUK16cA/v3o/i3v/Tjx48TGxuXMq94iRJU\
-qlyZkiVLSgAlaQshhMguFSpWpH2HdlStWo0iRYoA8PTpUzasX09CQkJKrXvMqFESrBxGLo8LIUQu\
-Y2ZmxsgxY96bNnbkKBRJSSl/K5VK7gUEcOzIUZxatpCgSU1bZCZ/f3+Oy6g8QojP8LePD5cuX041\
-hGhsXBwTxo0jLjZWgiQ17awXFRmVa07kovkL8Lt8GcdmzdTmPUdERBD6/DlGRgaUuoUAACAASURB\
-VEYZWk+lUvE4OBg9PT21PFdxsbG8ePGC4EePPmn55ORkdHR1KVasmHxjqVut6N/W13Xr1c2x7zFZ\
-oWDMyFHpJub4+HiWLVnCsJEj5YRK0s7iwpicnGtOpFKZTLJSqVbvuVkTB16+fPlZ6zo2cVDr83Xm\
-9JkMLa+lpcXte3fR1ZU7WuqkiYMDz3J4l6Dr16374OcwLi6OjRs20qGTCyVLlZSTKklb5FZm5mbE\
-J8TT3dU1Q+slxCdgYGigtsedmJiInq4uWtqfdnfK64QXD+7fR6lmP8oEFC9RgjHjxubY9/fixQsW\
-L1xEXFzch8tsUiITxo1j87atclIlaYvcytTUlLi4OIbLZbcPehz8mAf370sgxAclK5LR0dXJ0DqT\
-f/8d5SdckVQmK/G/coUzp0/zXaNGEuyvSBqiCSGEBshowr7i54eX53ESEhM/afmY2FjGjRpN0jst\
-zIXUtIUQQmSDy76+mJmbp5qekJBAdHQ0efPmTb2SlhaPgoIoU7asBFCSdtYIDw/H0spSzrQau3D+\
-PGtXr2HN+nUSDCEyyf9+/ZX//fprqumexzxxGzKI85d8JUg5kEZfHjczy4NLxw4sXbxEnjNUYyHP\
-Qjjl7S2BECI7vjctzDAykv7FJWl/BX7XrrHv4EEunD9PHevaBAUFvTf/6pUr9O71M717/cwv//sf\
-w4cOxf/qVSkVQohMcfHCBX5wakFoaKjavGcrSysKFiwgJ0+Sdvb728eH4W5uPA8JYfioEak6pwgL\
-C+OUtzd169Wjga0toc+f06Nbd2looUauXrnCxQsXJBAiR7p+7Rq3b98mKDBIgiEyhUbe077ke4lF\
-CxYQHBxMn7596dipIzof6JSiu6srxibGFChQgAvnLxAbG4t5Gg00RM6hUqnQ0tLC56wPUVFR1LOx\
-kaAIISRpq5uGDWzR0dbGbdgwWrX+AR2djz8G0dLJCZVSSUxsDEOHD09J2Mc9Pbl96xYVKlakuZMT\
-AMGPHnH0yFH0DfRp36EDZmZmUoqy0eqVq/A6cYJXr15SuPA32NSvD8CYUaPQ1dFl8rSpEiQhhMbS\
-uMvjnTt3QalU4uV1gsfBjz9pnanTp1OhUkWsrPLS2rk1APv37mPJosWYmZkxbfIU9u/dx+PgYNq1\
-aUNYWCgXzp2nV88fpQRls6SkJPLly8cJb2+eh4Tw/Plz9u3Zw59nzjBx0iQJkBBCkrY6GTBoIN5/\
-nqF27Tp0bNeOcWPGEBYW9sF1rK2tWbBwEYmJibgNHoJKpcLM3JyI8HCSk5UsWb6Mxg5N2LVzF00d\
-HRk3YQKLly1l8tQpqFQqKUVZzLltG+4HPkz5W5GsQEtLCz39NwOGFC9Rgrx58/HXX39KsIQQkrTV\
-jZ6eHj/2+onjJ70wMjSiRbNmjBszlsQP9PxjbGLMrDmzuXjhArt37uL7xt8zbOQILvn60r1LV06f\
-OsWrVy/Jly8/APr6+lSuUgUtLS0pRdns3t17ODZugqGhEQULFqR2nTqMHT+O6VOmolAoJEBCCI2l\
-0Z2rmFtY0MDWFh8fHzw9POjbvx9FihRJmd/U0fG9Glw9GxvuPfwHgA3r1/M66jUr16xm3py5nP3z\
-L6xr12Kv+x5iYvpw6+YtZs2Ywa497inD74ns0cShCUOHD081pOdx75MSHCGEJG115HPWh3lzZhMf\
-H0/vX37FuW2bDCVXBwcHuri4sH3rVrR1dFi+cgVVq1Xj/N/nsLOpj5mZGaPGjJGEnc3q2dQjLi4u\
-w2NwCyFSO3/uHNu2vj9y1+uo1zx98pSB/fu/N93Q0JCJkyZhamoqgZOknXncd+1i65atJCsUDBw8\
-iKaOjp91CbtY8eKcPXeO6Ojo9wrpoqVLSEhIwMAgpw0NqYV2LrhUX7dePfnUCpFJihUvTosWLd+b\
-plQqsalfn5IlS743XVtHGyNDQwmaJO3MNXP6DPIXKMDM2bOpUbPGF28vrV+VOS9hw8+9/8ejIOnA\
-QQjx6YoUKfLeLUMhSTvbXfS7jOcxDwYNHEi16tUYNnwEJUqW0PgTaf/tt1KahRCf5cWLFwTcCUhz\
-no6ONnXr1fukPi+EJO0M09bWxqllCxo1/p7NGzfRsV07HJs3Y7CbG/ny5Uu1fFJSEkqlEh0dHXTT\
-6DVNoVCgVCrR1tZOmZ/WtHepVKqU+dK6XAiR013y9WXHtm3pfKfqUL5CBaysrCRQkrSzjpGREb/2\
-7UOHjh0ZMWwYDes3wPPEcUqUKpWyzNtkraenl36A0kjKurofDpuWlpb8KhUfFBYWxtJFiwkIuEPR\
-YsXoP3Agpd4pm0Jkp+ZOTim9PoocXjHV1ANTKpUcPXwE125diYiIYOGSxe8l7LfLSE1YZLf4+Hg6\
-tm1HYOBDWrdpQ+DDQH5y7fHBfgSEyA7R0dHcuH6dG9evE3AnQDqPkpp21lOpVJw66c3CBQtQKZUM\
-/G0QzVs4pZmcpUCKr+HokSOEhYVx2OMYpqamODg44HfZj+TkZAmO+Lpl8/ARtv97mVxLC5atXMk3\
-33wjgZGknXXqWtfCysqKsRPG812jRh9cVmrZ4mt4+M9DChUulPJkQoGCBWnewok97u6EvwpPWa5O\
-3TrUtLaWgIls06mzC506u0ggJGlnnxGjR7F+7TrWrVlLvnz5qFK16geT9tshHtXdwvnz8b/qz4bN\
-m6RU53BWVpaEvwpPaawYERGB32U/khITCQ4O5sC+ffTp3w+lUvneepXLV8h9X1A6utx5cE8KjRCa\
-mrQ7ubjQvn173He70661M75XrmBmnvbwmTo6OhpzifzqlStcvuwnJVoNNG7iwOyZs1i1YgXt2rdn\
-/tx5HD50iLPnzlGxUiW8TpygT9++qda7dTcAfX39XBWrsiXVu3Ge2b/D/MoQviKzaGRDNB1dXVy6\
-dCZZqfzofUK5RC6yW4mSJViwaBGbNmzErn4DTp48ybwFC7C0spTgaJj2HTrgdeoUFSpWkGAISdoi\
-93r27BkTx42nc8eO/DZgAL4XfTO8jcuXLjGgX7/3Xr87LT0+Z31SXbrOqOYtnDh/yZdLV6/g63eZ\
-5i3kcRuN/ILV1qZkqZISCCFJW+ReUVFRdGzXjlu3btG2XXvMzczp1rkz58+dy9B2LCwtqV79TVe3\
-YaFhnDl9JuX/9Phe9KVn9+6olJlzW8XCwkKu9gghJGkLzXXc05PIiEjWbliPS5fOTJk+DbuGDVm1\
-YiUAD+7fp52zM/Vq1aa9cxvCwsJQKBSMHT0aW5v6dOnUiWv+13jy+DEH9+9Pdz8xMTH82rs3tvVs\
-aN2yFTdv3GD2zJkAuHTsCMDihQtp/F0jmjk05ejhIwB4enjQ1aUz7Z3bpCz/qWpaW+Nz/pyc5FxG\
-pVKxYd06+v7yK2tXr5HHUYUkbaE57t+7R9FixTD/t5EPQKXKlQgMDATAffduFIpktu7YQbuOHXgR\
-Fsae3e4cOniQ9Zs20sDWjjOnTxMbE0vQo0fp7icoMJBq1apz2OMY2tra7N61m67dugEwY9ZMDh86\
-xMrlK5g2YzodO3XCbfBggh89Ijo6mosXLuDasyedXDrLCRMfdeTwYZYvW0YDW1sWLVzImdOnJSgi\
-TbqafHDSlahmsrC05MWLMJKTk1POcWhoaErf8q2dnfE+6U2LZs0oVrw4s+bMJiDgDlWqVKFixYpU\
-rFgRAI+jxz64HzMzM27dvIlr166EvwonKSmRAgULAlC6dBn+2LGD6jWq08DWltp16jBn1ixu3rgJ\
-vBkdrk27tnKyxCdxaNoU61q1iImOQVdHh/j4eAmKyH017fQe9RLqramjI9Gvo5k7ezavXr3C2+sk\
-x44cpUXLFgA8exbCr337cMbnLMWKFWPzpk0ULVqUoMAgwsLC2LB+Pb9PmPjR/axbu5bw8HAOHztG\
-8RLFUalU6Oq++ZEQFx9H2XLluH3rNk+fPuWUtzdKpZIyZcsAYCjjDgsgMTERv8uXP7qcoaEhRYoU\
-4ecff6RAgQLUs7GR4Incl7SFZipTpgwLlyzm0MGD1KtVm0EDB+Laswc9ev4IQKFCBVm1fAVdO7lw\
-+/YtXDp3xqVLF0qWKoWdTX02rd+AQ1OHj+6niYMD9+7dw7FxE5KSFDx98oSSJUtiYmJCo4b2dOjY\
-EQfHpjT9vjFDfhvEyNGjKVe+vJwgkcJ99246te/AjevXP2n5P//2oUzZskyfOlWCJ9KkKyEQ6qhZ\
-8+Y0a96cqKgoTE1N0db+/9+flatUwfOkF69fv8bY2DjlEvr2nX8QExODiYlJyrJvH7Vq3sLpvdcA\
-De3tOe97EZVK9d5IcBf93tSc9PT0mLdgAdNmzEBXVzdl9Lf2HTrQvkMHOUmCuNjYN//Hffhy98b1\
-Gzh96hRLli8jOjr6ix8pFFLT/qARQ4exY/v2lL+v+Pnxy88/ExEeLhEWWcrMzOy9hP2uPHnypGrX\
-8G7C/qRftbq6qYZuNTAwwMDAIOVvQ0PDjw7XKsSHNHdyIiQkhFrVa/Do0SPchg2ToIisq2kbGRmx\
-ZtVqunTtCry5JPT8eSgWltLDU2Y6f+4cf2zfQanSpfi5d++UASfUlUqlQqlUEhkZKSf3AxKTkiQI\
-Gq5Q4UJ4nDhOZGTke09FCJElSdu5bRu2bd3KNf9rVKlahROex+nTr69ENxMFP3pET1dX+g8YyEkv\
-LwAGDRmi1sf0ODiYiIhIateoKSdYCJCELbInadeqXZtixYtz5PBhoqNfExERQasffuDqlStERUWR\
-N29eHjx4QGtnZ6Kiojhy+HBKrVx8mmNHj1G6dBka2DbArqEdtevUUftjate+AzduXKd0mTJygj8g\
-9PlzEhWKXDdYCLwZ5UvdBw0B6NKpk1q9X0tLS3yvyABEGpu0AZzbOLNntzsxMdE0sG1AgYIF2b1r\
-N0GBgVSqUpnpU6ZSrFgxrKzysnTxEknaGf3iDn1O4MOHLFqwkNu3buE2bCjdXF3V+pjGjB8nJ1Z8\
-kLoPy7luzRpmTJvOjl27qFuvrlq854A7AbgNHiSFL4fKtEe+nNu25dmzZ+zZ7U7rNm1Szc+bNy8T\
-xo4jWZksUf8MxsYmmOYxZcv2bfz088/8seMPCYoQQm0lJydjYmLCimXLuHf3rgQku5N2qVKlqF6j\
-Otra2jRr3jzVfAfHppjmycPmjZsk6p+hStUqREVGERgYSEjIM7VvhCaEyN10dHQYPNSNmOgYenZ3\
-ZfHChamWadTQPs3XuVmmPqey98CBdOdpocWUaVNxbvVDmq3KFQoFSxcvxuOYByqVikbff8+QoW6f\
-3bOUSqVCpVSSrFBoxIlyaNqUps0cadbEAQsLC1asXvXefHNzCywtLKRECyHURuPGTShRsgS/9O1D\
-p/YdqFipEo7NmqXMf/z4cZqvpaadTcqWK8dPvXqlOe+3/gO4d/cei5cuZfnKFUSEh/NTj56f1cnA\
-yRNe1K5Rk4iISL6zt2frli0a8at06fLlXLl+jfOXfFM1RJs1dw6Hjh2VEi2EUKPvtTcpyMzMjN8G\
-DeLQwYMSlOysaf9X/4EDUk0bNnIEw0aOeG/axQsXePjwIYePHkHn304qZs6ZTZdOnTju6UlzJ6dP\
-3uejoCAGDuhPYkIiAAkJCUybPIWyZctSv0EDtT9h6XUOYmhomO5ViRFDh2Fdu1ZK478rfn6sWLaM\
-2XPnyrP0QoivV2t8p/Ojwt8U5umTpxKUr5m0P5Wfnx9NmjRJSdgAWlpaNHV0ZMhvgxmQ1O+Ltp+U\
-lET3LprfWr1o0aKcPvtXqunS+Y0QIkcmba3/v9jrvns3DWxtJSjqkLQN9PV5mZiYanpiYiL/+6U3\
-Q4d/epd+O3f8wdQpU1L6/IU3z3q6/tiTsbn0ESPp/EYIkTNr2tq8fPmSlctX4HvhIgcOH5KgfCxm\
-2b1DpVJJaGgoCe+MF2tTvz7HPTyIjfn/RKtQKDh44CANbDN2SbtJUwe0tbXReqc/ai0dbdq1b5dr\
-T/K7nd9cOH8+pfMbeNPT2qoVK9mwfj1RUVEp66Q3XQih2WJjY7Nl3IjExEQaNbSnYf36XLvmzx/u\
-uzEyNpYTkNOSNrwZhMHgnfuvlatUwbFZM7p27oynhwfeXifp0a07latUxtbOLkPbzpcvH9t2bKdy\
-5UoAFCtWjJWrV1GpcuVcfaKd2zhz9PBhjh45ktL5zePgYNq1aUNYWCgXzp2n179DW6Y3XQih+XR1\
-dTHO4MA6n0NfX5/N27axet16TIxN+K3/ABQZeNrnzp07DB08hLi4uNx1frJ7hyqVKs0GU2MnjOfA\
-/v0c2LcfRbKC1s7OuHTp/Fn7qFqtGgcOH6ZurVrsPXAASyvNv3f79OlTIsLDqVylStpJu21bli5e\
-wp7d7kydMR2AXTt30dTRkXETJpCYmMj9e/dQqVTpTtfS0pJvNCE0nL6+frZ1mVuufDnMzc1paN+Q\
-vr/8yuaNG+n1v/990rqhz59zYP9+Jk6ehJGRkSTtrJReK2fnNm1wTqM3NfFxv0+YwBU/P3z90u4v\
-+G3nNwF3AlI6v3n16iX58uVP+aC+TfjpTRdCZEx2/NANCwtj6aLFBATcoWixYvQfOJBSpdSjv/a3\
-Q+dqaWnRvUcP1qxa+clJO9deCfkahTi98Y/F50tMSCA+PuGDy/y385sqVauy130PMTF9uHXzFrNm\
-zGDXHvd0p8t5y91WLF/Bq5cvyZcvnwQDiI+P53lICL9PmZxuzbRuPRsa2jekXLmyWfYeOrZtR4mS\
-JWjdpg173ffwk2sPjnufVIsBZt5tPQ6gUEg31zkyaYucoWOnTpz/+xx2NvUxMzNj1JgxaGtrpztd\
-5G4L5s79rM6ONF09GxvatGub5rxq1auxMQs7dzp65AhhYWEc9jiGqakpDg4O+F32IzlZPZKf9r+d\
-qyQrFCxdvIi27dpLgZKkLdI9+bq6LFq6hISEBAwMDD46XeRu+vr6lClblhGjRkkwAE8PD7Zv3Urh\
-bwp/tffw8J+HFCpcKGUsggIFC9K8xZvOqPa4uxP+6v9bgdepW4ea1tY5KoZ37twhOCiI9evWUbx4\
-CTp1dsnwNp4+fZryhIuFhYXGj8ugKx89kV5iloQt/vuD29LSEruGdhIM4O7dgK/+HqysLAl/FY5S\
-qURbW5uIiAj8Lvth/609yuRkgoODObBvH33698txV0kSExPp1rkLiqQkqlavxrARwzNUqdPT08PK\
-yooeXbulTBsybKjGD/ssSVsIIdRU4yYOzJ45i1UrVtCufXvmz53H4UOHOHvuHB1dXChX/gpeJ07Q\
-p2/O60xJX1+fG7dvkZSUxMb1G+jepSvu+/eRP3/+T1q/ga0tF/0u57pzLklbCCHUVImSJViwaBG/\
-T5jAvDlvxhKYt2DBRx9znfz775zyPpXmPEWSgpevXvD9t9+lu75zG2cGu7l98fvX0tJCX1+fX/r8\
-SkREOBvXr2f4yJFyYiVpCyGEZmrewonmLZyIiIjA3Nz8ky4xuw0blu6Ii/Dm0vWHWp/nL1Ag04/D\
-oWlTZkybnuH1YmNi0DcwQEdHJ1e0mZKkLYTIEVatWEl8fByDhgxJmaZSqdjj7s6fZ85QpEgR+g8c\
-mNLQaOH8+Tx/HgpA7Tq16dCxY8p6OWVku4A7ASxbuoSp06djZmaWpfuysLD45GVNTU3TbLD14sUL\
-njx+zL1797C2tuabb77Jtq5FHz9+nOGOsJ48foyBoSGG0rmKEEJkj8TERNatWcP8ufNo4uDw3jz3\
-XbuYNmUqg9yGsGnDRhITExk/cSLJimRWr1yFg2NTzM3MUz2SmFNGtvM5+xdHDx+hR88fqVO3TrbH\
-tqa1NT7nz6U7X6lU4nXiBMeOHMXn7FlUqMibNx9PgoP5pkgRnj57RskSJWjS1IG27dpTomSJLHmf\
-T548Yd7sOcxdMD9D61laWWFgYJCrHkmVpC2E+Kou+frif9Uf+2+/TTXPulYtlq9aia2dHX6XLxMa\
-+qZm/c8/D0hMTKRWrdoUfOcxp7dyysh2KpXqvf9zkqOHjzB/7lys8ualfYcOjB43lgIFChBwJwC3\
-wYM44uGBQqHg5o0bHDl8hE7t2/Ndo0YMHzXykxuLfczE8eMJeRbC1StXGOQ2hLr16mVofeNcOMCI\
-JG0hxFdlY1MfWzs7Ro8cRfirV+/NK1uuHGXLleP0qVN4HT/BmvXrAAgMDMTQ0JArfn74+Phw/fo1\
-Bru5Ef/v6IHvjmwXHf36vZHtcjuVSsXA/v3558EDZsye9cFEqaurS42aNalRsya/DR7EymXLcW7Z\
-ioVLFlPPxuaL3kdSUhJ+l/2IjY1BV1eXQgULfdZ2kpOT34zsmEv6AJGkLYT4qnR0dT443/ukNwP6\
-9mXMuHE0tLcHoKmjI9dv30JLS+vNQDju7piZmzN31mwArt28iXMbZ/bsdicmJjplZDvxpsV2q1Y/\
-0NihSYa6OjU1NWXYyBE0aeqQKSNr6enpcejoEQD8/f3p2/sXVhVYS7Xq1T55G7ExsahQ5aoat/RN\
-KYTIcV68eIHPWR/uBtxlYL9+/NC6NTWtrXn48GFKIv+pRw9iY2J5cP8+lSpVol27drjv24v7vr0Y\
-Ghni3LYtz549Y89ud1rLQETvad7C6bP7JreuVSvDQyZ/TI0aNeg/cAB/7NieofWePn2a686dJG0h\
-RI5z6aIvfX75hS2bNpGQkMAed3fatm7NxHHjAWhg2wCAOtbW+PpeZMBvAylQsCA1ra2paW2NtrZ2\
-ysh22traKSPbiZyrWvUa3Lp5M0PrlC1XFhMTk1zVPbZcHhe5WlxsLG6Dh6Cro8uSFcskIF/RjFkz\
-36sJvm1cNmX6tFTLGhkZsXHLFuJiYz/4SNJ/R7YTHxcUGMSjoKBs3+/ff/tQvnwFOQGStIVITaVS\
-sX/vPubOmcPzkBCMctFznprEKBe2Hs6Oz4Yym1u7e3p4sHHdevYc2C8nQJJ2+qZOnoxzm7YZavgg\
-1N81/2tMnTwZv8uXMTc3J3/+Augb6EtghADMLc0xNjbJ8v0kJyczsH9/7gXcRU9fj7Ub1lOkSJH3\
-lilatGiar3Mzjb6nHRMdQ0JCQrrzvU96ExLyTCOOtUXLVnTu0kVK9AeEPAthmJsb7du0wd//Kp27\
-duHEKW/y5csrQ8YK8S9LC0sKFMif5fvR0dHhuIcnK9es5qinJ1Wrpa48nT77V5qvpaatoQwMDdDR\
-Tv04yfSp0zi4fz/h4eGMHDac8fpj8fA6kaFuAHOazxmHNreIi4tjzapVrF65ivj4eOwa2jF2/ATK\
-VygvwRHiKytTtqwEQZL2vwenq4uuXupDbNehPfUbNGDc6NF06NSJmtbWGj9wem6kUqnwOHqMGdOm\
-8fTpU0qXLs2osWNp3KSxBCebXL1yhWVLlgKgpa2Fubk53V1dqVGzZprLK5VKZkydxrVr1xg1ZjTW\
-tWpJEIV4R6585KtixYo0btIYQyMjqlWvRuMmjdHVlTZ5msTf359O7TswsH9/YmNjGT5yJEc8PSRh\
-Z7OwsDBOeXtTt149GtjaEvr8OT26dScpKSnN5Z8+ecKG9etx7dmDcuXlSogQkrTf4el1ItUABUK9\
-vb1v3aFNW65fu0bnrl047n2SX/v2QU9PTwL0lXR3deWnXr3o1LkzCQkJxMbGEhsTy+CBv9Ggbj3+\
-91MvXrx4wW8DBgAwd9ZsYmNTz/f08KCrS2faO7dh9syZaW7jzzNncOnQkeFDh2Jbz4apkycDoFAo\
-GDt6NLY29enSqRPX/K+lub4QOVmurl7Kl7jmiIuNZc3q1R+9by1PDHwdLZ2cUCmVxMTGMHT4cMzN\
-zVm+dCnXrl1j1x53Jowbz+IFCxns5kavnj8ye95cdv2xM9X8GtY1uXjhAnPnz6emtTUbN6xPtYyt\
-nR2XL11i0JDB1KtXj9EjR+E2dBiHDh7k0MGD7Nqzh+Menpw5fZqzf/2Zav3J06bmmvMScCeA06dO\
-pbo68vLlK1atWPl+stDVwbVnz8/uSU1I0hYizfvWo8eN5fvGaV8G9z7pjU39+pK0s9nU6dPZvGkj\
-gQ8Dae3cGoC7AXeJiopi8G+DiIyMQKlMplChwgAUL16C7Vu3pZpfw7ompqamtGnXNt1t2NrZYWho\
-iK2dHdf8rwEQExtDQMAdqlSpQsWKFalYsSIAgwf+lmr93CQhIYGoqMj3puloa1G9evXU03V0SU5O\
-lsIsSVtkht07d3Lv3n3GjBuba47Z/+pVpk6ewhU/PywsLBg3YQKuPVzRSaN9wseeGAh5+oyyJUtJ\
-QUpD0aJFv/hxG2tra6ytrWnp5ITb4CFs3bGd6jWq8+D+fXa678bj2DHy5s373jppzX/69CmGhoYf\
-XCYyIhKtf8dXfvdRvqJFi+Jx9BhhYWEcPnSIoMCgj74HTVe9RnWq16guhVySdvZIViiIjon5YC0s\
-KioKbZ20b93r6+lpTI9KRw4f5vJlv1yRtJ89e8a8OXM4sG8/Ojo6dO7ahaHDhmNpZZnuOh97YqDQ\
-N4U5/def8o2QhYxNjJk1ZzbdOndh985dtG7ThgP7D1C7Rk0sraxYsXrVe8unNf+/A0SktUxkRGSa\
-+3fp0gWvE17Y2dTnm2++YeqM6VSsVOmD7+FL6esbvPk/h3feE/gwkPPnzqU5z8DAgFatf5DbiZK0\
-v9zhw4eZPPH3dOfHxMTQtnXrdDvOKF+hPDt27Upz3qoVK4mPj2PQkCEA7N2zB6/jJ6hTtw4//fwz\
-WlpaaU77kHcff3lrsNsQqlStKiXxE7y9b71qxUoSEhKwa2jHuAkTPqmV8dtLou8+MSCyXlNHR+4H\
-Pkz5u56NDfce/pPy94HDh4iJicHE5P974Hp3+f/Or1SpEu07dEiZny9fvjSXedtvebXq1d7b3vad\
-f6TaX1rvIbO079CBosWKUr16zq7NPnnyhBs3rqc5T1tLm8YOTTA3N5cCLUn7yzi3aYNzJg+5l5iY\
-yLo1a5g/d15Ky/KbN24wesRIRowayeKFi/jmmyIUK14s1bS3XxTpefv4qARDBwAAIABJREFUy4hR\
-o9DTf/Or1cLSUkrhRyiVSg7s28/smTMJCwujTJkyjB43lkbff5/hbXl6nUBHR0eCmoN8LFl+SjLN\
-SMJNa9msSNhvry6k174iJ7FraIddQzspjJK0s19EeDi3b98m+FEwjx49omSpkhQoUICq1aphZWX1\
-0fUv+frif9Uf+2+/TZl2yvsUFStV4ufevbly5QreJ09SvESJVNPeJu2EhATCX4VTqHAhwl+Fo6Or\
-g5mZWcr2uru6YmwiAx18iqtXrjB18hSuXrny0fvWn0Iu8QkhJGl/ZfHx8ezZvZt9e/fx8J9/qFCx\
-IiVKlODQwYM0dXQkPPwV/lf9KVa8OG3btcWlc5d0k6aNTX1s7ewYPXIU4a9epdSQ8+TJA4CpiSmh\
-oaEYGRunmvZWUGAQWzZtYsr0aRw+dAhLK0ta/fBDynzrfy+VlS5ThmPHPaUUpuG/9617/vQjg4YM\
-ee/HjxAic61bs4YZ06YDoKOrw6k//+Sbb76RwEjSzjx73N2ZO2s21rVqMdjNjfoN6qf0bubldYIJ\
-v/+OpZUlSqUS34sX2bnjD1avXIXbsKF0dEndX7eObupLpyYmxigUb3pwSlIkYZrHNM1pn2rvgf0Y\
-GhlhIM87ppLWfevxEydStly5r/J+wsLCWLpoMQEBdyharBj9Bw6kVKmc1crc56wPDWwboK2dM/tK\
-ymhXphlx+dIlNqxfz9Lly9U2PjnJz71783Pv3hKIHEytS/HEcePZsmkzG7ZsZvmqlTS0b5hud6Ta\
-2trY1K/P/EUL2bBlM1s2b2HMqFGftJ/y5Stw/959IiMjuX3rFhUrVkxz2rsUCkXKa9V/xqYtVao0\
-ZcqUoWixYlIC3zFrxkxsbeqzeOEiSpUqxeZtW9m0detXS9jx8fF0bNuOwMCHtG7ThsCHgfzk2oPE\
-xMQcEzPfi7707N4dlVKVY89rRrsyzdC2Q8M4c/qMWsdHiFxT0/61X18KFiiQ4fubFStWxH3fXu7c\
-vvNJyzu1bIH77t3UqWlN2XLl6NK1G8YmxqmmvaVUKfE5e5b1a9eSkJDAJV9f7O3tNargfFO0CL4X\
-Lmbqs83a2toolUqKFivGlBnTsba2/qrHePTIkTfP9Hocw9TUFAcHB/wu+6V0MLF44UL279uPnp4e\
-gwYPpkWrlhzYt599e/eiq6vL3YAAev70I54enoSFhTF95gxiYmLYsG49Vnmt8LvsR5euXRnw20Bi\
-YmJwGzyY6/7XyJc/PzNmzeTx48ds2rCRhPh4qlarRsjzkPfmV6laldkzZwLg0rEj7vv2pnpPOro6\
-KduwaVCfEZ/4QzUrvG3LUaBAAS6cv0BsbCx6unqMGTWKC+fPU6VqVWbOmY2JiQkjhg3j8qX/a+++\
-o6K43j6Af3fpoAKigqKyCCo2FLvYsaM0a0zE2GOJxlhji9EgSSxRRGOLUaOvib0AKipY0FgSW+yR\
-BBBRmhTpLLv3/cO4PwmLgiCw8P2c4/FwZ2fm7jOXebh3Zu5cQ+8+fXD+3DmMHTcWB/bvx8EjR3Dn\
-9m1M+3Qq/I4F5Nq+uhi+LT7OA/oj8MSJ9xqj58+fV7jnv+k9EuVYawcHkfA8odi2l5KSUqCyS7/9\
-JoJOnRYZGRlCCCHSUtPe+3f9eMQI0bRRY40+Xs+iosT8L+aJBjY2wlZmLWbPmCliYmLe+34H9O0n\
-unbqnKd85fIVwqlrV7Xr+B09KhrVbyB+u3hRbNm0WTS0sRWPIyLEz9t3iIY2tuLB/QfiizlzRdNG\
-jUVoaKgYO2q0mDplijh88JCwsZKJI4cPi3179wobK5l4cP+BuHvnjvD1WSueP38u3Aa4iMWLvhT7\
-9+0TNlYycejAQRHg559nuRBCHNx/QNhYycRfDx+qrdPqVatU2wj7J6xIcWpq10h8PMKz0OudDAwU\
-NlYy0a1zF9G1YyfR2sFBbN64SQghxHpfX9G9S1fxOCJCjPIcKRbNXyB2bNsu7Bs3EY/++kt8s2yZ\
-sLGSiXVrfUWrFg5CCCF+v/q7sLGSieTkZHE84Jiq3auL4dvi8zgiIlecCxOjn7ZuFTZWMnH50qV8\
-P3PowEFR37qeCH30SFBeNlYyBqGQyvVFHoVCUazT7ql7fae6svj4eCiFUjVzE+8ULxiLWrWw7Btv\
-HAsMROcuXXDwwAH06NYda9esQVZWVonXp2pVUyQmJEKpVAIAkpKSEBwUDLlcjhvXr8O+uT06ODpi\
-5KiPIYTA3Tt3AQA1atRAQ7uGqF27NurWrQMbGxvIrGVIeZEC4OVkFS6urnD38ICWlhb+Dg1FlSpV\
-cO/uXXh++CFiY2Igl2er2pf7QA/YN7dXu7yGuTkAoF49m3zr9GobMmtZqR5fL29vNGxkh6pVzdRO\
-ZRoZ+RgREeF4/DgCdo0awbZ+ffRzdlbT0VCq3b66GBYkPq/Hubhj9Px5PJRKJRISEvkLTsUzIlme\
-v1xqSgpSU1JLfL8DXFzQs1cvtq53ZGNjg592bMfmH39EtWrVsHaND/r17oPjAcdKtB5OPXoiIyMD\
-mzZsQEx0NL7xWoapkycjNSUVtvXr4/69+3j69CnOBAdDqVTCxtbm5TWn1x4r09HJe7NhVlYWrly+\
-jBvXb0ChUKB2nTrY+uOPSExMhP/x46hrVVd1H8SrP/zyW679742TGZkZ+dbp9Wk/S5ODgwNWr/FB\
-dnY2Zkz/HEII2De3R00LC+zZvw/TZ8zAxMmTYd+8Oe7fv4cHDx7A7+hRAC+fo05LTUVGejpCQ0PV\
-bl9djAoSn9fjTMSkTfSuSbNnD5wMOo2FX36J5/HxmDplCjw//AgPHzwskf1byayw2scHO7ZtR8f2\
-HRAUFIRVq1fDtKopBg8Zgp69e6FXdyd8Pu0zzJ03r8DvfzYwNMSyr70wYvhwDBk6FPbN7dGjZ088\
-evQIvZ16QC7PwdOoqFzr5LdcJpPByMgI3Tp1LlKdSsqrqUyvXrmimspUqqWFVs1bYOXyFTAxNUXP\
-nr3Qrl17DB8yFAnPXz522a5De1jWtkTH9h1w7sxZtdtWFyNNiw/RW5Xnsf9mjZuIuJjYCnGdozxc\
-036TmOhosWDePFHfup5oYGMjFsybV2z3K+R3Tft1iYmJQqlU5inPyMgQcrm8wPs6fPCQ6tpsampq\
-rmVyuVxkZ2fnu25+yzMzM0VmZuY71+l9X9MuiNdjcSHkgvh6yRIRFRUlDh88JBrY2Ai5XC6USqVI\
-T3vz/SHqYvS+4lOQa9o/bt4sbKxk4uqVq7wYy2vavKb9Nnp6uu88cxaVLTXMzeHl7Y39hw7B3r45\
-ft39C3o5OWH7T9ugeO3xuvfFxMRE7dzy+vr6+T5mqE7lypUhk8lUQ76v09bWfuOMbfkt19PTg56e\
-3jvXqSx4PRZ2jezw6K+/MKBvP3y/ciW+XLwY2trakEgkb33Bj7oYlYf4EHF4nDSSfXN77D2wHytW\
-rYKOjg68li6Fc5++CDmvGW/ocurZA/sPHeSBfAMzMzPs2LUL1/+8hXMXL+AjT08GhYhJmzSVRCKB\
-x6CBCD53FtOmf4bIyEiMHvkxJowdiyeRkQwQEZVbHCMijWVgaIhp06fDzd0DK1csx/GAYwg5H4IP\
-R3yEGbNmqYZcX7x4gcHuHnnWX7H6ezRv3hwAEP30WaEnijEyqoRbd2/zQBARkzYVju5/rttVJFYy\
-K/iuX4/fPrwIr6VLsWPbdhw/dhyz58yB+0APVKlSBSeDg964DYtaNXE2pOBD7BdCQvDj5i1seETE\
-pF1Y0c+i4b3MK88c32mpaZj3xdw8N6aMmzBB1cMqLxYvWYKkxIo9gYNjx47wCwjAvr37sGrlCsye\
-ORM7f96BRYsXw6FlS/62F1FOTg7u3L6Nj0eMYDAAPH36FACQmprKYBCTdmGYVjWFs3P/PEm7aZNm\
-qGtVN2/PrG7dcncgLS0tYWlpWeEbtJa2Nj74cDj6OveDr48Pdv28E0MHDYabhzvmzpuH6tWr87f+\
-HRkZGSEjIwN3bt8ptTqkpKSoXolb2hQKBaRaUphVq8bGQUzahaGnp4e+zv14NEnFxMQEixYvxuAh\
-Q7D0qyU4fPAQAk8EYvyE8Zg4eTJ0+VrUQvvj5o1Sr4OtzBrXbt3kwSAm7fIgMzMT586ehVKRd25i\
-iUSC9h3aw8TUlEe9AmnUuDF+2bsHwaeDsHTJEqxd44Ojh49g5uzZ6NffmQEiIibt0hIbEwN/P798\
-l5tVq4Y2bdvwqFdATj17wLFTR+zYth3r1/li6pQpcNzdEYsWf8ngEBGTdmmoa/XyLmIidfT19fHJ\
-pIlw93DHiuXLceTQYbg490eVKpWhb8A3sRFR2VcuJ1d5dZfrq39paWnl/kBmZmYiOTmZLboAzC0s\
-sPL777F7zx40aNgQCQmJeB4fz8AQEXvapSE0NBQL5y8AAGhJpZgybRqcejiV6wP5xew5uH7tGs7/\
-dpGtuoDatG2Dw35H8c0yb2hJOTkgETFplwo7Ozsc9jtaoQ5kUlIiEpOS2KILSSqVYsGihQwEvRcN\
-GjZEzZo1UbtO7UKt9yQyEgvnz8c3y5ejZs2aDCSV76RdXq35/nvExMQCAFq1boXBQ4YwKERlWOcu\
-XRBy6bdCraNUKjF75iz8fvUq0tPTGUTK3dFgCDSDIkeBzRs3IS0tFdpaWpByOJeoXNr+009M1sSk\
-ren++edvZGdno2XLVnDs2BEeAwcyKETlzN+hodi0YSO8v/2GwSAmbU0WHh4OfX193Lh+HYsWLsSK\
-775jUIjKmaVffQWZtTWOHzsOAPh19y8MCjFpa6JevXvj9v178Fnni1GjR6t+qYmo/GjUuDEsLCzw\
-z99/AwAiwsMYFMqFN6JpiOCgYPy8fRt+2LgJf4eGolGjRgwKUTnzxfz5AIDEhEScDAzE3H9/JmJP\
-W8N0cOwAAGjt4IDff7+KT6dNZVCIyrjoZ9FY77sOWVlZhVrPtKopQsPDYGNjwyASe9qayMDAANt3\
-7kRGejoMDDnlJpEmOH78GFavWoX2HdqjVevWDAixp13hkjcTNpHGUCoUL/9XCgaDmLSJiIgqEg6P\
-l4IL5y9AoVRAW7v4wp+UlASFQoGLFzj3eEm4e/ceMjIyGQgqV7KyshATHY26VlYMBpM2vbLkq8Uw\
-NDSAiYlJsW3zSWQkcnJysHnjBga4BGRmZsLUzIyBKOkTlpY2bGXWGlfv4UOHakxd9Q0McOf+PTY2\
-Jm16xdKyFsZN+ASdOncqtm2O8vTEtWvXsWPXLgaYyq0Hfz/SqPpu3bIF3yzzxi9796JN2zZlvr7B\
-QcH4dff/saGVYbymTURExKRNRERETNpEREQVEK9plxPNW7SARMK/wYiImLSpzPt85kwGgYionGPX\
-jIiIiEmbiIiImLSJiIiYtImIiIhJm4iIiIqEd4+XE2fPnMGd27fh5u5epO3o6OjCoqZFvsufPn0K\
-RU5Oketbq1YtaOXzwpSEhASkpaYWeR9VzcxgZGSkdllGejri4+OLvA8DQ0NUq1ZN7TKlUomoJ0+K\
-vA+JVApLS0tIJBK1y2NjYpCVlVXk/dQwN4eenp7aZS9evEByUlKR91G5SpV859yXy+WIfvasyPt4\
-WxuOiopSvTKzSG3Y0hJaWlpvbMNJiYk8ORGTNuW1YN48xETHYM33q4u8re07f0anzp3zlPv7+WH6\
-1GnFUt/RY8ZgwZeL1J7sOrZrD7lcXuR92NjYIDDotNplH3uOxPVr14q8Dy0tLZwMCoKVLO9bkdb7\
-roPP6tXFEq8lXl/joxEj8pTfunULg909IETR39fs1LMHNv/4Y55yIQR6dOuGxISiJyBDI0P8ceMG\
-dHV18yz7Ys4cHDl0uFjitWPXLnTs1DFP+dEjRzDjs+nFso8x48Zh/sIFecrj4+PRuYNjrjYcGxPD\
-kxQxadP/TJw0BSHnz6F+g/pF7KXooGmzZmqXtW3bFpOmTIFSWfReSt9+zmrLTUxMMGPWLCQlFT1B\
-NGjYMN9l4yaMx62bRX+Bg5GREWpZ1srnO/ZFZmZG0XvaEim6du2qdll92/qY+tm0Yulpd3B0zGf/\
-EsyaPQePH0cUeR/m5hZqEzYAfDB8OCwsLIqhp62DJk2bqF3Wvn37YmvD/ZzVt2FTU1N8PnMmkpOT\
-kJ6WhrCwMHTt3o0nKSoWElEcf6JToYzy9Cz2t3wRERXVq7d8bd66tUT2ZyuzRmh4GANfCLwRjYiI\
-SENweJyIqAKKfPwYd27fyVV2+/YdxMXG4njAsVzlVYyN1d4jQEzaRERUAq79cQ1B/7lRMz0tHUoh\
-cOxYQK5yA30DOHZ0zPcJBmLSJiKi98h9oAfcB3owEEzaRESkKeLj4/N9Pl5PTw/1GzRgkJi0iYio\
-LDhy6BD8jvqpXVa5cmVs/3lHvhMhEZM2ERGVoLHjx2Ps+PEMBJM2ERFpirS0NCQ8fw7gzdPzEpM2\
-aYibN25gve86AIBEKoGxsTFGeHqieYsWEELgwP79OH/uHCwtLTFl6lRUqlSJQSPSEBvW/4AAf38A\
-gK6uLo74+0FfX5+BKWM4uQoVWFxcHM4EB6NN27bo4OiI2JgYjPxoBORyOfbv3QuvJUvh0LIljh87\
-jtWrVjFgRBpk1pzZOHP+HM6cP4fA06eYsNnTpvJihKcnDI0MUaNGDVy5fAXp6elwaNkSP2zaCMeO\
-HXH92jXExsYyUERETNpU2vr36wehVCItPQ0zZ8+GsbExjI2NYVu/Ps6eOYPTJ09hy09bGSgiomLG\
-4XEqNC9vbzRsZIeqVc3g6uaqKg8OCsbkTyZi/sKFal/tSUSkaebMnIVfdu9W/Xzj+nVMGDu21N6V\
-zqRNhebg4IDVa3yQnZ2NGdM/hxACfz38C1MnT4aLqytaODggLIxv7iEizWdgYIAtmzarft6/bx9i\
-YmJhYmrKpE2aw9DIEN+tWI6rV65g35692LljB7KysnBg/354uLpi8cJFDBIRaTw3D3c8jojAn7f+\
-hEKhwKnAk3Bzdyu1+vCaNhVYr969c737tm27dngU9g8AYOgHw/C19zIGiYjKlZatWqFO3boI8PdH\
-amoKkpKSMMDFRbU8LCwMp0+eglQqQf8BLrCoaYHbf97G8+fx6Na9O+Lj43Hq5Eno6uoiMeF/Q+qt\
-27RGCwcH9rSJiIiKtbft7oZj/v44FhCADo4dUMPcHAAQ+ugRBrm5IyIiHI/+egSX/s6IfhaNK5cv\
-w+/IUQDAs6fPsG6tL5QKBSIjI7Fu7VrkKHKgVCrfqS5M2kRERG9K2h4eePbsGQ7s2w9Xd3dV+eGD\
-h9DXuR+8vL3x7YrlaNCgIfbv26d2G0OGDYPHQA8YVaqEiZMmoWWrVkzaVLyOHj6MWzdv5SlPT0/H\
-urVr1a6ze9f/Iewf3oRGRO/fk8hIrFy+AlMmTsKG9euRmpr6XvZjbW0N++b2kEql6NO3r6o8NjYW\
-lStXUf1cp04dJCUlQktbC0IIAIAQAtJifA85k3YJSkpMxMzpn+Pq5SuY/8Vc+Pv5ldm6ZmVlYeni\
-r7By+fI8y37evh0/rFuP8LDwXOXJycn41tsbvmt8eLCJKF9nz5xBn549AQCrV62CQqEo9Dbu3rmD\
-oYMGQyqVwsXNFU+ePIHbgAF4/u/86cXt4JEjuPvwQa7pmZvZ2yPo9CkkJCQgNjYWISEhaNbMHqYm\
-pggPD4MQAk+jolC5SuViq4dEvPpzgN4rpVIJdxdXhD56hOzsbAAv5/f1WeeLXr17l7n6bt64CTdv\
-3sCtm7ewdfs22NnZAQBevHiBXt2dMMDVBSkvUrB81UrVOt96eyMpMQmnT5/GEX8/WFpa8sATUS4P\
-HzyEu4sL5HI5AEBfXx9TPp2CSZ9+WqjtDHL3wKgxo+Hi+r+5IlYuX4HExAQs++abEvkucrkcc2bO\
-QlDQaQilgIubK7y8vZGamorRniMR8fgx5NnZWLrMC27u7rh54wamTJqMi5cvMWmXdffu3sUgdw9V\
-Q1UNu9SrhxkzZ5ZKnZ5ERiIuLi5PeXZWNo76HcGBw4dxJigIN27cgO/69arEnJGegbnz5sGpa1fs\
-3rsH9erVQ/SzaLj274+AwBPYsW07UlJSsOTrpQCAtavX5DtsVdfKCmZmZmwgRBXEkcOHcCb4TK7e\
-tbm5OS5euVzgbbx48QLdO3fBHzdvQPLa0PPTp0/xweAhOP/bxRL9TtnZ2ZBIJNDR0clVnpGeDj19\
-fUilxTeozUe+Skhqaiq0tbTzJO242FgcOxZQKnWKCI9AQkLeoSSFQoF27dvD2toatTw9sfXHrXjw\
-4AFMjE1wcP8BBASegKGRITw//hgb1/+A5atWYuWK5Rgx0hPVq1fHuPHj0NOpByZM/AQpKSnYvGkT\
-jE2Mc/1yAYBEIkHt2rVRrXp1NhCiitLTfvhXnuHwmJgY2MqsC7WdKsZ5zylGRkZIS0sr8e+kq6ur\
-ttzA0LDY98WkXUKaNWsGXT1dZGRmqMr09PUxbsJ4fDptWpmtt56eHsaOG4v1vr7Q09PDiJEjUf3f\
-JPvx6FFw6tIVQUFBuBhyAUvOngEAmJia4oPhw7F54yY8jojAvAXz8ZGnJxsBEeHUyZOYPnUasrKy\
-AAA6Orro07cP1viuLdR2HNu1x/3799GoUSNV2dngM7Bv3rx8B1BQifn96u+itYODsJVZC1uZtZg6\
-ZYrIzs4u8/XOyMgQbVq2Em0cWoq01LRcy9at9RWObduJXTt35ipPTEgQLZo2FV07dRZyuZwHn4hU\
-Fi9cJGytrYWNlUw49+4j4uLiCr2NQwcOip7duotrf/whMjIyxMnAQNGuVWvx560/37leOTk5Iicn\
-R/WzUql8ef5SKoVCoVAtf/VP8e9nFQqFyJHLc637pvLCSE5OFlcuXxYJz58LIYTgNe0SpsjJwfCh\
-w/DxmDHoP6C/xtR7mZcX9HR1MWvOnFzlycnJGDJwMI4FHoe2du6Bm9kzZqJJ0yYYNWYMDzwR5RIf\
-H4/2rdvgUdg/eYa5CyrA3x8b1q1HeHg4Gjdpgi/mz3vj889CKSCRSjQqTikpKYiJiYFQCtRvUJ83\
-opWGUZ6eGDfhE3Tq3InBIKIKy1ZmnWtq5PdNLpdDoVBAX19fk0bDIYRARno6DI2M+Jw2ERFVDDk5\
-ORpXZ4lEAqlUCh1dXcjlct6IRkREFYOBgYHG1l1XV/fl7Go8jCUvMjISMdExDAQRUQnKyMjQ6PpL\
-JBIm7dLwIjkZ8fHxDAQRUQnSpGvZ+WHSJiKiCkEikWj8d2DSJiIiYtImIiIiJm0iIiImbSoJCqVS\
-9XpOIiIiJu0yrHHjJvh5+zbs3PGzRj7sT0T0vnktXYrbf95mIJi0S9+uX3Zj1y+/4PSpU2jfpi3O\
-nj3LoBBRhZKamvrG5cFBwYiOfsZA/QdnRCugmzduYL3vOgCARCqBsbExRnh6onmLFqrPbNqwEZmZ\
-Gfjs88/f2lhPnTyJ+/fuwaFFC1jVsWKAiahCOX/2HBo3bpyn3NtrGY4ePozExETMnTUbi3QX4MTp\
-UzAxMWHQ2NMuuLi4OJwJDkabtm3RwdERsTExGPnRCMjlcmRnZ2PD+vVYuXw57t+7n+820tPSsWnD\
-RnTv0gUPHz7AngP7sWXbT7C2sWaAiahCERCwrlcvT/nAwYPg/d13MDMzw4iRI+H93XeoVKkSA8ae\
-9rsZ4ekJQyND1KhRA1cuX0F6ejru3rmDWzdvoXOXLvmuN3/uFwg8fgI9e/fCgUOHUNeKvWsiov+y\
-s7ODnZ0d9A0M0My+GZx6ODEoTNrvrn+/fhBKJdLS0zBz9mwYGxujXbv2cOzYEfPmfoHEhAS16xkY\
-GkBbRxtp6WnIyMhkIIlII8TFxWGdz1o8fPgAtevUwZSpU2Ft/f5HBwNPn4KWlhYPwH9weLyQvLy9\
-0bCRHapWNYOrmysAQEv77Q1r0eLFCLn0Gzp16owxo0ZhwtixuHvnDgNKRGVWZmYmhngMRHh4GFzd\
-3REeFo7RniNL5JFVHR0dSKVMUexpF5GDgwMcHBzQv18/zJj+OXb9srvA89nq6urigw+Hw83DHb/u\
-3o3xY8bCylqGJV9/jQYNGjC4RFSmHAsIQFxcHPxPHEelSpXQs2dPXL92HQqFgsFhT1tzGBoZ4rsV\
-y3H1yhXs27O30OsbGBigZevWqGtlhcfh4YiP5Ru/iKjsCfsnDBY1LVQ3gtUwN0df536q91KHhYVh\
-y6bN2LplC6KfRTNg7GmXHb1690ZoeJjq57bt2uFR2D+5PvPNd9++dTtRUVFYvWoVLl+6hE+nTsOQ\
-YUN53YaIyqSqVU2RmJAIpVIJqVSKpKQkXL92HZ27dEZEeDiGDhoM5wH9kSPPgUt/Z/gFHINFTQsG\
-7j2SCCEEw/D+xcbGYuMPP8D/qB/GjB+HUaNHl4t3uxJR+RURHoG+vXph2vTPMHDQIHy/chX8/fxw\
-4dIlbN2yBQmJCfD+9mVn5aMPhqODoyM+nTZVtb6vz1rExKjvgUdGPEZkZCQcO3XMd/8DXFzQvkMH\
-Hgj2tEveQFd36OnpYvPWrWjh0IIBIaIyz0pmhdU+Pvjqyy+xasVKmJiaYtXq1TCtaorY2FiYVq2q\
-+mydOnWQlJSYa/0mTZuievXqardtY2OLF8kvYG5hrr5HKZGgdu3aPAjsaZcOuVyOA/v2Y62PD5x6\
-OGHa9OmoUaMGA0NEGiEpKQnGxsaqG2937vgZO7Zvw94DB5CTkwMPVzfMmTsXbh7ub91WQkICop48\
-QVpaOkxNTWFuYc4ZzzQ1aWdnZyM1NRX6+vrQ0dGBlpZWge/OLm3Kf9/elZmZCRMTE7X1Tk5OxuaN\
-G7Hn1z0Y9sEwTJoyhbP9EJFGdkTmzJyFoKDTEEoBFzdXeHl7q31MSwiBkPPn4X/UDyHnz0Mul6NK\
-FWOkp6eiqpkZnkY9RbVq1dDdyQkegwaicZMmDLAmJW25XA49PT2NSthCCMjlcqSkpEAIATMzszfW\
-PSoqCt5eXgg5fx4rVn6PPv36sDUSkcbJzs6GRCKBjo6O2uUXQkJQSpreAAADDElEQVTw7TJvSKRS\
-DPtgGLr36AFLS0sE+Pvj5IlA+KzzhVKpROijUJw4fhz79+6FXSM7LFj0JaxknDnyv8rcNW2JRAJt\
-bW1IpVKNSdiv11tPTw9KpfKNn42NjcW2rVtx5fIV9HPujxYteY2biDSTrq5uvsu+XrIEQaeDsHjJ\
-V+jWvXu+53SpVIoGDRugQcMGmDh5Ev5v504MGTgQ361cge5OnMa0TCdtqVSq+qdppFIptLW1803a\
-CQkJ2LplC/bu2QNXNzccCzzB69pEpJGEEFAoFHjx4gXu37sHCwsL2Nja5vpMx06dMXPWbBgaGRbq\
-j4DRY8eiu1MPKBQ5DLQmJG1N6mGra8jqTJwwAVcuXcaQYcNw/ORJVKtWja2PiDSWRCKBlpYWKlWq\
-BMvatWFomDcxF+VlHzJrGYOsLkeWxYag6Q1ZnaZNm8LIyAhPn0YhNSWVLY+IykXi1tXVhUwm46hh\
-RU3ami6/2c0+nTYNQefOwt6+Ofr17o297zD9KRFRWZOeno6LIRfead0/fv+dAWTSLl05Oflfg9HT\
-08OEiZ/AyMgQiQmJDBYRaTx9fX20bN3qndaNiYlhAJm0S5e29ttvE9D0SwBERKokIpWqXiBSGAYG\
-hgwekzYREWmCotykxqRNxUYIAc4MS0RETNplnFKphFwuf+vkKkREREzaZYCWlhaTNhERvRd8NWcx\
-ejX/7tvmTDc3t0DtOnzlHBERMWmXatLW0tLK91ntV6pVrwZjY2MGjIiICoXD40REREzaRERExKRN\
-RERUAUkEHyp+r7p16ownT54U6LO1a9fG2QshDBoRVdhzIc+DTNplzsYNG+Ds7Iy6VlYMBhERMWkT\
-ERGVN7ymTUREpCH4nHYJedP1HF7DISKeB3keLAgOjxMREWkIDo8TERExaZM63Tp1hq3MGrYya3Tr\
-1JkBIaIKfS7kebBwODxORETEnjYRERExaRMRETFpExEREZM2ERERMWkTERExaRMRERGTNhERETFp\
-ExERMWkTERERkzYRERExaRMRETFpExERUQn6f+KzFiXRKjBcAAAAAElFTkSuQmCC'
+IMGDIR=os.path.join(os.path.dirname(os.path.abspath(__file__)),'img')
 
-StepDown='iVBORw0KGgoAAAANSUhEUgAAAe4AAAGOCAYAAABR4+AMAAAAw3pUWHRSYXcgcHJvZmlsZSB0eXBl\
-IGV4aWYAAHjabVBbDsMgDPvPKXYEiMPrOHRl0m6w4y8QmEo1S9hp3Loh1D7vFz062AtJSDmWGJ1C\
-ihSuWmRnqIO9k8EDrc3K733Ky2BVqMKMHE396s8PlvqqVbgGPadx7EYRU863oPkj9IlYi3MGlRkE\
-NsPPgGrXcrHkdL3C0dyObIc6IY3sX8j9WZJu7wzaBHODh1MGxAZAPyDUbgwu/UXVijA6AWsSXci/\
-PS3QF8+HWbkif/QUAAABhGlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw0AYht+maqVUHNpBxCFDdbJL\
-FXGsVShChVArtOpgcv2FJg1Jiouj4Fpw8Gex6uDirKuDqyAI/oC4ujgpukiJ3yWFFjHecdzDe9/7\
-cvcdILRqTDX7EoCqWUYmlRRz+VUx8IogwjTjGJCZqc9JUhqe4+sePr7fxXiWd92fY6hQNBngE4kT\
-TDcs4g3imU1L57xPHGEVuUB8Tjxp0AWJH7muuPzGueywwDMjRjYzTxwhFss9rPQwqxgq8TRxtKBq\
-lC/kXC5w3uKs1hqsc0/+wlBRW1nmOq0xpLCIJUgQoaCBKmqwEKNdI8VEhs6THv5Rxy+RSyFXFYwc\
-C6hDhez4wf/gd2/N0lTcTQolgf4X2/4YBwK7QLtp29/Htt0+AfzPwJXW9ddbwOwn6c2uFj0ChreB\
-i+uupuwBlzvAyJMuG7Ij+WkJpRLwfkbflAfCt0Bwze1b5xynD0CWepW+AQ4OgYkyZa97vHuwt2//\
-1nT69wOfXnK4D7J/fQAADltpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdp\
-bj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+Cjx4OnhtcG1ldGEgeG1sbnM6\
-eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDQuNC4wLUV4aXYyIj4KIDxyZGY6\
-UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5z\
-IyI+CiAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgIHhtbG5zOnhtcE1NPSJodHRw\
-Oi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5h\
-ZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOmRjPSJodHRw\
-Oi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgIHhtbG5zOkdJTVA9Imh0dHA6Ly93d3cu\
-Z2ltcC5vcmcveG1wLyIKICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8x\
-LjAvIgogICAgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIgogICB4bXBN\
-TTpEb2N1bWVudElEPSJnaW1wOmRvY2lkOmdpbXA6NGEwNjMzYWUtYzdkYy00NWJjLTg5NzAtNjgy\
-YTJhOWQzODJkIgogICB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOmQ5MWQzY2I4LTY3N2ItNDE2\
-OS1hYzgxLTRlYTdhMThiNjc0ZSIKICAgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlk\
-OmQ4OWM5NzMxLWE0N2EtNDdkMS05ZmU5LTdmODI5MWIzMWQ5NiIKICAgZGM6Rm9ybWF0PSJpbWFn\
-ZS9wbmciCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IkxpbnV4IgogICBHSU1Q\
-OlRpbWVTdGFtcD0iMTY5Nzc0NTA1NjEyNzM0MiIKICAgR0lNUDpWZXJzaW9uPSIyLjEwLjM0Igog\
-ICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCIKICAg\
-eG1wOk1ldGFkYXRhRGF0ZT0iMjAyMzoxMDoxOVQyMTo1MDo1NCswMjowMCIKICAgeG1wOk1vZGlm\
-eURhdGU9IjIwMjM6MTA6MTlUMjE6NTA6NTQrMDI6MDAiPgogICA8eG1wTU06SGlzdG9yeT4KICAg\
-IDxyZGY6U2VxPgogICAgIDxyZGY6bGkKICAgICAgc3RFdnQ6YWN0aW9uPSJzYXZlZCIKICAgICAg\
-c3RFdnQ6Y2hhbmdlZD0iLyIKICAgICAgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDo1ZWJlZDBh\
-OC1jYTU4LTQyYjEtYmI1Zi03ZWU2NTU4ZThjMWUiCiAgICAgIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9\
-IkdpbXAgMi4xMCAoTGludXgpIgogICAgICBzdEV2dDp3aGVuPSIyMDIzLTEwLTE5VDIxOjQ5OjUx\
-KzAyOjAwIi8+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBz\
-dEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjM3NjM2MGRh\
-LWQ0ZGQtNGQxZi05OGQwLWUxZmMxYzI5MTQ1MyIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0i\
-R2ltcCAyLjEwIChMaW51eCkiCiAgICAgIHN0RXZ0OndoZW49IjIwMjMtMTAtMTlUMjE6NTA6NTYr\
-MDI6MDAiLz4KICAgIDwvcmRmOlNlcT4KICAgPC94bXBNTTpIaXN0b3J5PgogIDwvcmRmOkRlc2Ny\
-aXB0aW9uPgogPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAog\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-CiAgICAgICAgICAgICAgICAgICAgICAgICAgIAo8P3hwYWNrZXQgZW5kPSJ3Ij8+2Do8AgAAAAZi\
-S0dEAAAAAAAA+UO7fwAAAAlwSFlzAAALEwAACxMBAJqcGAAAAAd0SU1FB+cKExMyOBSbkIwAACAA\
-SURBVHja7N13VFRHGwbwZ3fpHQMoBAui2MAO9ogiIKioKLHX2HtU7GDHhopiR7FX7B2xJsbesItd\
-iYBK77Dl+8PIFwKoSHF3eX7n5Jx46973DvvuzJ07I5DJZDIQERGRQhAyBEREREzcRERExMRNRETE\
-xE1ERERM3ERERMTETURExMRNRCVVZmYmMjMzs/4tk8nAt0SJ5JeA73ETERGxxk1ERERM3EREREzc\
-RERExMRNRERETNxERERM3ERERMTETUREREzcREREJZUKQ0CkGF69fIW///67WM5lYmKMylZWDDoR\
-EzcRfa8zp0Pwx4ULxXKuuvXqYTQTN5Fc4pCnRERECoTPuImIiBQIm8qJFMR8Hx8EnwwulnPZ2tpi\
-4WJfBp1IDrGpnEhBpCSnIDr6Y7Gcy7BUKejo6DDoREzcREREVBB8xk2kgN69e4f4+PgcyyViMd6+\
-eYO0tLQc61JTUhD+9i0kEkmOdXGxsQgPD4dELGZwiZi4iaiw3Lt7D21at0bnju5waG6P3j16IiIi\
-AgBw/OgxNG3UGL2690BjuwaYPHESUlNTIRGLsdJ/BRo3aIie3bqjQX1brFuzFjKZDAkJCRg/diwc\
-7FugZ9duaNqoMc6dPctAE8kxdk4jUhDhb99iYP/+mDlnNpxbt4ZEIsGWzZvR7dcumDBpIhYtXIgN\
-mzaieo0aSE1JwXQvb/w+ajQqVa6M0Dt3cOrsGRgbGyMyIhIjhg2DVCrFxT//hGWlSrh07SrU1dUR\
-GhqK4UOGwHfJEjRs1IhBJ5JDfMZNpCDGjh4Daxtr9B8wINvycWN+xx8XLmDt+gDUrVcva7lYLIZT\
-SwfEx8fjzPlzMDA0zFr37t07uDg6oVLlSgjavx9C4f8b30JOncK6NWsRtH8fg04kh5S2qTw+Ph7R\
-0dG8w6Q0rly5Atc2bXMsr2dbH6mpqdmSNgCoqKjAsnIllDE1zZa0AcDMzAw6OtqoWat2tqQNAC1b\
-tsTjR4/4vJuKxYsXL8D6Y/4obVN50O49WOnvj8TERN5lUgompUvjQC614NiYWFS0rIjVK1fmWKeu\
-ro7SZcrkus7cvCzS09NyXWdsYowqlSoz6FTkVFVUcOrsGZQtV47B+EZK21S+dvUaJCTEw3PiRN5l\
-IiI55WBvj8BNm1G+QnkG4xuxVzkRERETNxERETFxExERMXETkbJ6+OABhgwchOTkZAaDiImbiOTd\
-x48fcTokBBnpGQwGERM3ERERMXETEREREzcREZEy4CQjRCXA27dvkZCQAAAwLGUIPT09BoWINW4i\
-klfu7dvDwd4eDvb22LF9OwNCxBo3EcmjX5o3x7NXLxkIIta4iYiIiImbiIiImLiJiIiUBZ9xK4mU\
-lBSkpaVBJBJBT08PAoEg1+1SU1ORkVHwUbR0dHQgEolyXZeRkYHU1NQCn0NLSwuqqqq5rhOLxYUy\
-jKeGhgbU1dVzXSeVSgtlPnc1VVVoamnluT4+Pr7gf8gqKtDW1s5zfVJSEiQSSYHOIRAIvtgbPSU5\
-BZnizAJfy5fKb1paGtLT0wtefrW1IVJRKbLyK5FIoKGhAa0v3HciJu4SzrZO3awvtOEjR+D3ceNy\
-bBMXF4dmjZsgNSWlwOdr07Ytlq3wz3VdK/sWePfuXYHPUcPaGoeOHsl1Xf8+fXHpr78KfA4DAwNc\
-uXEdKrl8ic/w8i6UHtiqqqo4c+E8zMzMcqwLXL8ePnPmFvgcAoEAO3bvgq2dXY51Z0JOY/DAgYVS\
-zuYvWojOHh45loc9CUM7V9cC/zgAgKHDh2Oc5/hcf+A0a9wYKckFL78ubVzhv3JlruucWjogPDy8\
-UH4U3n/8iF9OxMRNeTMpXRotHVrCvkWLXNfr6uqiX//+iImJLvC58joHAPT7rT+eP39e4HPY2NTM\
-c10nj84oV75cgc9hZmaWa9IGAKfWrSGVSQt8Dl1dXRgZGeW6rlHjxujWvTtkkBWsVq+mBstKlXJd\
-V926Bnr06gWJRFygcwgFQtSrXz/XdT+b/4zeffogNa3gLS0tWrbIs5WnX//+iI4uePltbm+f57o+\
-/fvh+bNnBTr+lcuXkZGeyS8lKhICmUwmU8YLW7t6DRIS4uE5cWKJuJG1rW1Qw9oa23ftZKkm+sGk\
-UimkUmmePwrp/xzs7RG4aTPKVyjPYLDGTUT0YwiFQgiF7PtLRVS+GAIiIiImbiIiKgD/Zcsxb64P\
-A0FM3IpIKpVi+9atGDxwINasXl0ovcKJSD6lp6djud8yLPfzw4tC6ORJTNz0A5w8fgIL5y9AOzc3\
-7Nm1GxsDAxkUIiUVeucOnj4NQ8tWDgwGMXErKj19faipq8Hc3BzaWlrQNzBgUIjk2JPHT3D92rXv\
-2re+rS38V66EibEJA0m5Yq9yBWDXwA7m5ubo4uEBA30DODo5MShEcmzOrFkIe/IEV2/eyH9tir3R\
-iTVuxbd54yZkZmTizt27aNCoIebOms2gEMkxsTgTYrGYgSDWuEuqhIQEZIrFkMk+dVRLTkpmUIiI\
-WOOm3EilUpw4cSLXdbdu3cLff/+dY7lEIsHJEycL7TP06t0LQqEQdWrWxLUrVzFqzGjeGCIlN9tn\
-LgICNyjt9UVHR2PksOF4+zYcw4YMQWhoKG96SU7cb9+8wc0bN3EvNLTAY2YfP3YMY0aMQkRERI6E\
-PmzQYMyeMTPHPocOHsSYkSMRFRlZKNdjUro0jgefxOXr13D5+jXUqVuXJZeIFNqAfv1wOuQ0pBIJ\
-noaFoWfXbngfFcXAfAOlayo/E3IaI4cPh1QqAwQytG3tgnkLFqCDe8d8H0smk2HtqtVwdGqFDQEB\
-mObtnbXuyKHD+NncHDdu3MD7qCiYlC6dVdteu2o1HJ2dsWH9BkyZNrVQrksgEKBUqVIssURFwK5u\
-XTi1bl1ox3v16hVSU1MxbcoUBjcXqSkpuH/vPj5PlSGVfprM58KFC/D49VcGqKQl7kkTJ+SYb9pr\
-6lS0a++W5/zReTkVHAyRigqmz5oFFydnDB0+HD/99BPEYjGW+flh3oL5CDl1Cps2bsSESZMAAPv3\
-7kXpMmXgPWM6XJycMWTYUCZcIjkXExMLa2ubQjvelcuXkZSYVKjHVKrEnZqKw4cO51jO+cu/sSKn\
-TLODZWZmonqVKpBJC+eSREIR1gWuR3N7e8zwng5dXV2M8xyPnTt24NTJYGzcshmREZFo6+KCkLNn\
-oaOrA8eWDli6zA916taF99RpKPVTKYwZOxangoMxYtgwSCVSljqib6lViFTw+PnTYjlXpQoWePbq\
-ZaEdr9uvvyLsSRhuht7hjcyD57hxOHHsONLS0qCqqgoTExOcPB0CTU1NBqck1bhVVVVhZ9cAt27e\
-RGbmp7lwVVRUYFWlCg4fO5rv42VkZEBNTQ0AMHjoELi1aYPefftglf8KrFi9CgBQxrQMnFo7Y+uW\
-LdDX10eVqlWynkEPGjIYHdzao1efPlgwbx42b92KRo0bF8m1c1pPUjaVKlgwCEps/sKFqF2nDub7\
-zEOHjh0xznM8k/Y3UrrOactW+MOuYQMIBIJPCa1ObaxdH/Bdx/qctAHA1NQULVq0xOQJE1CzVi3U\
-ql07a92QoUOxbcsWrFm1CmN+/z1ruXnZsrBvYY9JEybCslKlIkvaAGBsbAxjY2OWaCJSCCKRCD16\
-9oSJiTEGDBwIA44IWTJr3ABgZGSEzVu3YsVyfyTEx2OK17RCO/bgYUPh6uiEoyezvx5Wrnx5mJuX\
-hUAgQ7Xq1bOtGzpsGFydW+PI8eNFet0Hjx7J9kODiIiYuBWKqqoqVNVUC/WYlpaWOHD0CCpbWeVY\
-t3ZDAIS5NGBYVqqEA0cOw6qKVZFer7a2NkszERETN/1X9f/UqD/7UjN1XvsQERHlF0dOIyIiYuIm\
-IiIiJm4iIiImblIGD+7fx9s3bxgIIiImblIE/fv0xXQvbwaCiEjJsVe5kkhPT0d6ejoDQSQHnFu7\
-5BjTgYiJuxj5L1uOpKQkTJ46BVKpFDu3b8cff/yBOnXrok+fPtDU0sL2rVsRcuoU6tarh+EjR+aY\
-0OTRw4f4+++/YWZmhipVqkKkImJgiZRU3/79GAQqMmwq/0otdrnfMiz388OLf+b1Pnn8BBbOX4B2\
-bm7Ys2s3NgYGIjQ0FLNmzoSjszO2bNqMI/+a9UYilmD4kKF4+eIlWjo4QCKRYvjQoYiOjmaAiYiI\
-ibswhd65g6dPw9CylUPWMj19faipq8Hc3BzaWlrQNzDAnxf+QJUqVdGjZ0/80rw5/rhwIWv7/fv3\
-QU1NDa5t20AoFMKmpg3sGthh3Zq1DDARETFxF6b6trbwX7kSJsYmWcvsGtjB3NwcXTw88P79ezg6\
-OeHDhw9ZQ47q6uri48ePWdu/fPEC5cqXy3bccuXL48H9+wwwUS6io6MxyXMCVEQqSEpKYkCImLjz\
-ERxhzvBs3rgJmRmZuHP3Lho0aoi5s2ZDR0cbYrEYAJCRmQkdHZ1/JX87PHn8JNsxwp48Qd169Rhg\
-on+RSqU4sG8/2rZ2gbaONm6E3s72t0REn7BzWj4lJCQgUyyGTPbpiyY5KRlWVapg146diIuNxf27\
-d+Ho7PSvxF0fGRnpOHb0KNq0bYtbN29CU1MTHl26MJhyLCoqCu7tO8DUtEyhTODy4vlzaGppoXlz\
-e1hVsYKjkxMMDA2/+3gL5y/AujVrij0uAgFw+fp1GBkZfXE7+6bNcP7in9983Ht372GGlxfU1NWx\
-edu2Ip+Uh4iJuwTp1bsXToeEoE7NmtDX18fa9QGoYW2NfUF7Ub9OXVhaWqJ7z55Z20/ynIDY2Fjo\
-6euhTdu2OHP6NG7fuo2d23fg1NkzDKicenD/PqIiIxEfFwd1dfUCHy85ORlisRgvnr8AAHhNnYYW\
-LVvCc9JEVKxYMd/H+9n8Z9S3tcWixb7FFpP09HS0dnSCVCr96rbh4eHfdMy4uDj4L1uGkydOYryn\
-Jzq4d4RAIFD48nNw/wFERLzD0OHD+cdETNw/wmyfuVn/b1K6NI4Hn0RsbCz09fWzXvvasn0bkpKS\
-cjTtrVqbvVbkOXEiA6oADP+pDY8YNRJDhg0rlGNmZGQgKjISV69exZFDh3A6JAQXzp/H4KFDMHL0\
-6FwfzeRd8xVAQ0MDZcuVK7aYpKWlFdqxpFIpDh04iIXz58O1bRsEnw5Rqmbx3bt24mnYUyZuYuKW\
-FwKBAKVKlcqxnM/j6EvU1NRQtlw5lC1XDp09PHD92jVM9/KC/7LlePXyFRYtWQwVFeX/k7x/7x6m\
-T/vULL5p61ZUqVpFKa9TJpOx0BMTN5EysbWzw/5DhzBqxAgcOXwYEqkEy1esUNrrVdZmcSImblII\
-L1++RNfOHko7kIyJiUmxnEdDQwOr16zB8KHDcPzoMdjZ2aFn795KFUtlbxYnYuImhXA3NBRNmzXD\
-Yr+lSnl9t2/dgod7p2I5l0hFBQsX+8LNtQ3mzfWBfYsWMC9bVinieP/ePUz38oaamppSN4sTFSe+\
-x00kB/T09DDbZy7S09OxetUqpbim2TNnYvDAQejZqxd27N7FpE3ExE2kXJr98gtq1a6N/Xv3ISoy\
-UuGvRyRSQfDpEHTs5M5n2URM3ETKqU+/vsjMzMSZM4r/jv+UaVO/61l2eHg4PMeNQzvXNujXuw9C\
-Tp0CAEgkEmzZtBkD+vXH9GleiIuLY4EhJm4i+rF+ad4cIpEIf5y/UCKvPyEhAZ3ad0D423AMHDwI\
-lSpXxrDBQ3AqOBhBu/dgia8vHJ2ccOXyZSyYN58Fhkokdk5TEg6tWqGyVWUGQsEZGBigarVquH3r\
-1ncfY9uWLTh65AjS0tLRtGlTjBk39pvfDw8PD8eypUvx+NFjGBkZoXvPHnB0ciq26z988CCSk5Ox\
-JmAd9PX14da+Pd6+eYONGzbAZ8ECBAQGwtbOFlevXEFcbCwLDLHGTYprsd/SQhvhi34sc3NzxMTE\
-ICMjI9/7Xr50CXNmzYZbhw7o0q0r1gcEYNuWrQWu7RaX16/fwMzMDPr6+lnLqlWvhtev38DCwgK2\
-drY4e+YsThw/jh69erGwEGvcRPTjmZQ2gUwmw8ePH2FmZpavfVNTUiGVShEXGwvn1q1x6OhR6Orp\
-Fri26+TsXCzXbmRkhJiYGEgkEsTFxUFPTw9RUVEwNjYGAJw9fQYjhg3DVK9paNqsKQsLMXETkfz4\
-pXGTL67XUNfIsayFQ0sMGDQQ69asxRLfxahWrRr8/JcXqLa7e9fubNs1tmtQZNfcyskRSxcvxtLF\
-S2BiYoJNGzfiw/v3GDx0KB4/fowRw4ahnZsbatWugxcvXnzXBC1ETNxEVKhiomMAAPcfP4KGhkau\
-2+zYvh2nTuZswn775g2cnJ3x+7hxuHnjBqZ7eWPxIt8ck918T233s0vXrn51ZLlKFSy+69otLS3h\
-578cc2bNQmREJLS0tSAQCvD48SO8eP4cGRkZ2Ld3L/bt3Yt69etj994gFhhi4iaiHysq6lPCyitp\
-f8nJEyexbOlSbNyyGWZmZtDW1vrmd6i/VNstTq1dXNDaxQWJiYnQ1tbGxw8fELQnCMNHjsCSZX4s\
-IMTEzRAQyY/U1FTcDb0LWzvb79q/V5/euH7tGrp36fqp5lu5Mn4fN7bAtd2U5BQIRcXbl1VX99Oz\
-eZPSpTF85AgWDiImbuWyeeMmmP1sVqyv7lDhu37tGjIyMtCoSZPv2l9TUxMBgRuQmpICsUSSlfwK\
-WtvV0tYq1Pm4iej78XUwJeG3ZAk2b9zEQCi47du2QSAQwNHRsUDH0dTSynfS/m9tVygUFqi2G7Rn\
-DyQSiVzHWyaT4cC+/RCJRHjz+nXhfbEKRcXeQkFM3KRgZDIZZDIZA6HAwp6E4ezpM2jRsgUsK1VS\
-+Os5uP8AXJ1b41RwcK5l8+aNG2jasBGkUukP+XyPHj5Et19/xeZNm7AraA/KlS9faMceM3YsZs+Z\
-y0JNTNxEykoiFmPyxIkAgKHDhytH68GunfCeMQMr/Vegc4eOuHzpUta69PR0jB09Bu/fv8fhQ4eK\
-9XPFx8dj9syZ6NurN1q7uGLfwQOoU7duoZ7D1s4WrV1dWLCJiZtIWS1ZvBihd+6gb//+hZ5EfqQm\
-TZvg4JHDGDBoELymTEWfnj3x4P59rFjuj48fP0IqlcJn9pzvGiXuM/umzb5pu8/N4s4OrRAfH4+T\
-ISHo278fRCIRC+AP9C78bwYhn9g5jZRWVcvKEEvEcv85Fy/yxdrVa1C9Rg2Mn+CpdPdBIBDApY0r\
-HJ2dsHdPEPr37Yfo6I+AFIAASEpOQuCGDRjyna+dhYeHf3Wb+/fuYYb3dKiqqmLTtq2oWrUq/0Dk\
-RKZYzCAwcRN9IpaI8ezVy+/a9/atW/Bw71Skny8qMhLeXl44E3Ia1jY22LRlM9TV1ZX3y0ZFBR5d\
-fsX2bVsRHxcHsezTF3ZGegZWLFuObt27Zxu1rTDExcbCf/lynDxxEuM9PdHBvSPnBv9BGtra4eOH\
-D7muc7C3z3V5GdMyuHj5MoP3H2wqJypGErEYd0PvYob3dDg5tMKZkNNo7eqCrTu2w8DQUOmvf+OG\
-QDx5/ATi/9Sy0tPT4FOInbkkYjF27dgJF6dPY6wHnw5Bx07uTNo/UCVLy3xtb2BoiB49ezJwrHET\
-fZvU1FQAwN49e7J1qvpeEe8iEB39EcnJKVlJy9LSEp6TJqJVAV/9UiSbNgbm2otcJgMO7N2HihUr\
-ok+/vt81atxn169dw0zv6TAwNMSW7dtQ2cqKBVoOLF+1Eo3q20LyDW8RCIVCaGlq4reBA7/p2Nu3\
-b0fPf5K8rq4uLCwsULVqVdSuXRvNmjWDnZ0d1NTUmLiJlJmhoSFURCp4/+EDYmPjCny89PR0CIUC\
-NPvlF1hWsoSLqytq1a6ttPEzNzfPdfmXmj2fP38OvyVL4NiiJYaPHAmPXz0gUvn2r6j3UVFYuGAB\
-rly+jHHjPdGxk/sPu/5ZM2bg+bNn2LxtG/+Y/lGqVCl4dO2CXTt2fnVbHR0dzPaZ+13JNiwsDMbG\
-xoiIiEBAQACaNWuGgQMHYv78+ShVqhQTN5Gyqla9Oh4/f8pAfKfzF//M9z6WlpbwX7kSd27fxsL5\
-CzBr+nRcv3Mb2traX9133Zq1CFi3Fj169kTI2bPQ1NT8odf/6OFDhD0JY0H4j+kzZ+LggYNI+6dF\
-Kzeamlpo2LgRmufx3PtbiEQimJubY+rUqXjx4gUCAgKgoaEBPz8/CIWK/4SYz7iJSK7UrlMHO3bv\
-QkZm5jcn4Du3b2P/wYMYM3bsD0/alDdVVVWM+f13CAR5px6BUICpXl6Fcj41NTX06dMHAODv749H\
-jx4pRRyZuIlIfr+gvrF2tGrtGpQtV67A5wsPD4fnuHFo59oG/Xr3QcipUzm28V+2HPPm+vDmfKf+\
-A35DqZ9yb7LW1dXFiJEj8fPPPxfa+cr9q1w8efIkx/r/juqXmpqao/MkEzcRkRxKSEhAp/YdEP42\
-HAMHD0KlypUxbPAQnAr+NO95eno6lvstw3I/P7x4/pwBK8CPsTk+c6GqogLg/0lTIBBA38AA/Qf8\
-Vqjn+/crlgkJCTnWZ2ZmZnVG/by9iop8P0Vm4iYiufLhwwdM/6epdMjAQbgberdYznv44EEkJydj\
-TcA6uLVvj6le0+DQqhU2btgAAAi9cwdPn4ahZSsH3qQCcnRygoWlJYD/v56npaWNeQvmF3rSTE9P\
-z/p/PT29HOvV1NSyPV75UivPjxpXn4mbiORWUlISOrRzQ9DuPQCAs2dOo4uHB+7cvl3k5379+g3M\
-zMyyDQJTrXo1vH79BgBQ39YW/itXwsTYhDeqEMxfuBBqap9qw6qqqmjarCkaNW4M4NMwtpUqWKCq\
-ZeVCuK//n/WtSpUq330cqVQqNxM5MXETkdw4e+YMEhISssYul0plEGdmIvCfWm9RMjIyQkxMDCQS\
-CaKjo5GZmYmoqCgYGxt/tSZG+VezVk00bNwQwKde4NNnzcxad/7in3j26mWBhyzOyMjAli1bAAAj\
-RoxAtWrVvus4mZmZEAqFcjOuPV8HIyK5kVuNRiaT4fjRYzh+9FiRnruVkyOWLl6MpYuXwMTEBJs2\
-bsSH9+8x+DvHUKf/+1xzzpGIZQAEQFpaGhrbNciZoETfl6IkEgkiIyMREBCAbdu2YdCgQZg5c+Z3\
-//hSVVWVq3gycSsJoVDIGgEpvJYODtDRmQexOBOZGZkQCIVQUVHB9p07ULdevVz3qVTBolDObWlp\
-CT//5ZgzaxYiIyKhpa0FgVCAx48fISU5BVraWrxB3+lL8wZUqmCBkDNnYGFZsVDOZWpqiurVq8Pa\
-2hq1a9fGxYsXYWtry5HTSP5Mm+4NE5PSDAQpNF1dXRw6chjLlvhh9+5dsLe3x7ARw4ttqtPWLi5o\
-7eKCxMREaGtr4+OHDwjaE5Qtac/2mcsbVdgVjwI2Qffo0QM9evQoOfFikVEO7p06oWmzpgwEKTyT\
-0qUxd8E8AEBA4IYfMj+5rq4uhEIhTEqXxvCRI3hTClpDFKmgUgWLb547nVjjJlJoMpkMD+7fx7On\
-z2BVxQrVqlfPc9sb129gia/vp1/lQiH09fXRs3evrN66RD8Chw9m4iZSWOFv3+LA/gOIi41Fg0YN\
-4ejk9MWpJhMSEjB6xEi8e/cO1jbWWL1yJczLlkWTPFpXYmNjcO3qVcyYNRMqKqo4d+4s+vfpi5t3\
-7ij1M9qgPXvg7u6er0lJSD6o8p4xcRPJqzu3b6N7126ATAaxOBM7d+6Eq6srfJcuyXOfubNmo2zZ\
-sli/MRAikQgSiQTTpkzFmZAQqKrm3dnGvVNnaGlrwcDAAOfPnkNaeppSJ+4jhw5j/dp1GDfBE07O\
-zjnWR0ZEouuvv+LshfPsxClnzMx/ZhDyiSWYqJj4zJmDzIwMZGRkQCqVISM9HUePHsXzZ89y3V4i\
-FiP45ElMmjIl6/1RkUiEyVOn4N7de18cDKJVy5ZoZGsH72nTMM7TU2mmM8zLlu3b4D1zJlYs90en\
-9h1w7erVbOvnz/PB3+HhOHTgIAsiscZNJLeF+58OMfJMnJkJ51aOea5XV1eHplb22a60tbUhFotx\
-88aNPPdbuswP27ZuxcMHD9CmXdsScb+bNG2CQ0eP4OTxE5joOQHlypXF5GnTIJNKceLYcchkMsyb\
-Oxdt2rVVqleDiImbFNSwwUNgVcUKY8aOZTD+IW8dYlYsX47VK1YhPePT2MlCoQg/Gf2Ec39cgIaG\
-Rq77tG3tggvnz8O+RYusZWfPnIGpmSnKls17Niwbm5pYtHgx2rm44vdRo7EraE+JaCIWCARwaeOK\
-Vk6O2Be0F/169UamOBMy6afWiaSkJASuX48hw4bxD4QUFpvKlcSlv/7C9WvXGQg5NnT4cAwcMgja\
-2toQCASoV78etu/amWfSBoDps2ZhkucEbNywATeu38D6dQHwmjIVzq1bf/V8GhoaWOC7CHdu38aW\
-TZtLVKxVVVXRtXs3TPX2RnxcPKSyT5NDZGRkYMVyf8THxxfp+XV1daGrq8tCT6xxEykykUiEMWPH\
-om69etgUuBGBmzd9dR9bO1ts27kDG9ZvQPDJk7CsVAk79uzGlcuX8fDBwxzbOzo5ZRuhqm69egh7\
-UTKnoBSLxZg/d26OvgBp6elYMG8+fObPK7JzL1y8GBn/mpWKiImbqASpVLky5i2Yn23ZlcuXGZiv\
-OHr4CCIjI3OukMmwd/ce1KxZE7927VIkjxAMDAx4A6jIsKmciOSSupo6fObMxcePH7+4nbm5ea7L\
-Wzk54tqtm3j26mWO/3bvC8LBA/vR1sUF586eZbCJiZuIqKDO//UnZFIpWjs6YbqXN978a17lbNtd\
-/DPX5To6Onm+Blenbl3s3LMHI0aOwpxZs9ChrVu2eZuJmLiJiPLJ2NgYA4cMhmsbV+wNCsLWLVsL\
-9fgCgQCubdsg+PRppKal4mlYGINOCoHPuIkUlEQiKfLe0f+WXoydrf7++28EG/YXtwAAIABJREFU\
-rl+Pw4cOwa19e5w5dw5lTMsUzZegigqMjY2ho6PDQkVM3ERUNF69eInLly6hXq3axX7uL42tXlAP\
-HzxA4IYN+OP8BXTr0R2nTp+BYSlDhbs/sTGxSE5JzvP5OxETN1EJM2nqFAwcMrjYRwCTSCRFOnxq\
-ty5dUbp0aSxZ5oemzRR3CsgJ48cj7MkTXPjrIgsrMXET0acpO42NjZXuum7euY0jhw5j1vQZMCxV\
-CoOHDEELh5ZFWssvCklJiUhKSmJBpaL5+2cIiEhuahIqKujYyR0nT4dg8JAhWL5sGdxc2+DAvv2Q\
-SCQMEBETNxHJa4tCy1YOOHD4EJxat8Z0by9MGO/JwBCBTeVEJKfu3L6NxYt88T4qCgsWLkJrVxcG\
-hYiJm4jkTdiTMPgvX4a7d0IxdPhwePzqAZEKv6qImLiJSO64ubZFZFQkRo8ZjSV+flBVVWVQiP6D\
-z7iJSG40btoYmhoaOBUcjJs3bjAgREzcRCTPJk2ZgnN//oGu3bpjupc33Nq0xYljx3NMzUnExE0K\
-T0tLC5qamgwEKf6XklAIlzauOHEqGMOGD8fqVavQ8pfm2L9vH4NDBD7jVhrbdu2EjrY2A0FKlcAN\
-SxlCQ0MDiQkJUGEHNSImbmVSsWJFBoGURmhoKFYuX46wJ2EYMmwYPLr8CpFIxMAQMXETkTy5f+8e\
-VvqvwIP79zFi1CisXruWr4IRMXETkbzq0bU7TEobY+ac2bBv0ULhxignKg7snEZEcuPGnVsYNnwE\
-Fi9chOqVrZCcnMygEDFxE5G8UlVVRcdO7jhy4jgyxeIS+aaERCLBlk2bMaBff0yf5oW4uDgWDGLi\
-VkbR0dFISU5hIEgpfG4iFwpL3ldU0O49WOLrC0cnJ1y5fBkL5s1ngaBs+IxbIf6Qd+Pinxez/m1e\
-1hyeEydm26ZTh46wtrbGitWrGDAiBdagUUMEBAbC1s4WV69cQVxsLINCTNyKRldPD2VMTQEAhw8e\
-hLq6eo5t4mJjEcs/cCK5UMPaGurqGt+1r4WFBSwsLHD2zFmcOH4cAYGBDCgxcSua1i4uaO3igvv3\
-7uHk8ePwmjGdQSGSY9O8vQu0/9nTZzBi2DBM9ZqGps2aMqCUDZ9xK5C5s2ej/4AB0NXVZTCIlNTj\
-x48xYtgwtHNzQ63adfDixQsGhZi4FdHtW7dw7+49dHDvyGAQKbFtW7YgIyMD+/buRUc3N0yeMJFB\
-oWyUsqk87EkYLl+6hLS0NNy/dw/WNjYKf01//vEnrG2soa+vz1JLVIhuXL+BN2/eIORUCGrWrAUt\
-ba0f+nnm+Phgjo8PbwyVnBr30SNH0L5tW1y+fAm3b92Ch3sn7Ny+Q+Gv682b16hQwYIllqgQ7dy+\
-A726d8e7d++wc/t2uDo787VKYuIubtOneSEzMxMSsQQSiQSZmZmYM3sWJGKxQl+X75IlmL9oIUss\
-USGaP88HmZmZgEyGjIwMfIyOxv59exkYkmsCmRLNUJ+ZmYkaVapCKpXyzirzr02hECdPhyjsjGh/\
-XLiATYEbEbh5E2/mF9g3bQYACA8PL8KzyABwPPTcaGho4PS5cyhjWqZIz+Ngb4/ATZtRvkJ5Bv0b\
-KdUzblVVVTRt1gxXLl9GRkbGpwtUUYW1jTX2Htiv1DeytrUNalhbY/uuncVyvkMHD+KP8xew2G9p\
-sV9rK/sWEArYr1LZnb/4Z5Gfo3uXrrh16ybEmeKs75Adu3ehTt26BTpuj67dEBb2BNdv3VLY+Du3\
-ckRychILojxWXpTtgpYs84NDq1YQiUQQCoVo9kszrF63lneaiHLwW74M9erVh0AogK6uLmbOnlXg\
-pA0AUqkEUglb/og17m9iYGAA/1UrsXrlKiQmxGPC5Mm8y0SUK5PSpbF9105kZGRATU2NASHWuH/o\
-hQmFEAjZnEpEX8ekTUzcRERExMRNRETExE1ERERM3ERERMTETURExMRNiq+ChQUqWFRgIIiIlJwK\
-Q6AcDh45zCAQEbHGTUREREzcRERExMRNRETExE1ERERM3ERERMTEXWJdOH8eD+7fZyCIiJScUr8O\
-tmPbdnhOnFgibuS4Mb+jhnUNbN62jaWaSA4IBAKF+Jzvo6LQrUsXSKWybMsjIyLQt1dvqKiqZls+\
-cvQouHfqxBvMxF00EhMTS8yNFIvFEIslCvWZl/ouxr59+2BkZJSv/SIiIjBsyBCFnYoxMTEJMdHR\
-6NDO7Zv3+fttODZt3YIaNtb81lIAXbt1R0TEO4X4rCalS2Prjh2QiMXZluc2R7lAIEAZU1PeYCZu\
-Ksl+NvsZffv3y9c+0TExKGVoqDA1mv+SSqVITEiAvoHBN+8zedJEZIgzWWAURPuOHRTq85qZmfGm\
-MXETfZ2GpgZMzUzh0saVwfgKb69pEArZJYWKTmREJIYPHQqJJPeWuwGDBqJtu3YMFBM3ERHJA5PS\
-Jpg1ZzZkMlmu68uWK8cgMXETEZG8EAqFqGHNPhRM3D9QSeqYpuwu/nkRq1aswI7duxgMoiIWFRmJ\
-uXPmZNW827m5wcnZmYGRpx9ZynphTZo2gUgkxJiRo/D2zRveaQUW/fEjrl29ykAQFQMDQ0O4urbJ\
-+q9atWoMCmvcxaNR48a4c/8+1q9bhzatXdCmTVvMW7Qg2zY3rt/AEl/fT79ghELo6+ujZ+9eaNS4\
-MUsGEX23jRs24PXrN5gxa6bCfXZ1dXW0dnXhTWSNu/ilp6cjaPce7N61C7Z2dmjbIec7s7GxMbh2\
-9Spc27iibbt2EEvE6N+nL1KSU1gyFMSN6zdw8c+LDATJlVPBwThy6BADQaxxf4vMzEzsC9oL/+XL\
-UamSJVavXQebmjZf3Me9U2doaWvBwMAA58+eQ1p6GrS0tVg65JhELIFIRYSrV64gNjYGTZs1ZVCI\
-iIlb0axbswYBa9ehvq0t1gduQLXq1b9pv1YtW0ImlUIikWCcpydKlSqFo0eO4OGDB6hc2Qod3Dtm\
-Dfbx8uVLHDl0GGpqqvDo0gU//fQTS1ExWrN6NYJPnEBCQgIMDUvBvkULAMDkiZMAmQw+C+Yr7MAs\
-RETfQqmaysuVKw8jYyO8j4rKV6/ypcv8UN/OFrp6umjTri3279uHgLXr8LO5OZb5+eHM6dMAgDev\
-X8PDvROSk5Px6OEj9OnRE1KplKWomGvaJqVL48z580hLTUVERAQOHTyIC+fOYY6PD5M2ETFxK5LW\
-ri44HhyMAYMGYfLEiejTsyceP3781f1sbGpi0eLFEAqE+H3UaAgFQryPikJ8XBx8lyxBg4YNAQBB\
-e4Lg6OSEyVOnYImfH3z9ljJRFIP2HTvg2auXWf8WZ34aU1koEmX9YCtjWganT4cwWETExK1oBAIB\
-XNq44mRICFq0dEDfnr0w0dMTz54+++J+GhoaWOC7CHdu30ZcXBy8Z8zAw4cP0a93b5w8fhzAp85s\
-pUoZAgBEKiJUrVqVifsHePnyJRzs7QEApqamqFO3DrymT8d8n3nIyMhggIhIqSnt62Cqqqro1qM7\
-MjMzscJ/OeJi47F2/bps2zg6OWWrydWtVw9hL55j44YNePToEVasWoXlfn64+OdFeHTpAhubmti9\
-aycSExPxNCwMM7yn48ChQxCpiFiSilFLh5YYP2ECNDQ0si0/98cFBocUnkQiQcDatbhy+TLq1quH\
-4SNHQiTidwwpeeL+b8/ybTt2frVnebaE7uyMMSNHYe+ePZDJZPBftQoA0NnDA9euXkWzRo2hq6sL\
-z0kTmbSLma2dLVJSUnIkbSJlceTQYWzcEIjxEzzhM2curKyq8L1qUt7EnZKSgqDdexCwbi1sbGrm\
-q2f5v5mbm2Pvgf1ITU2FpqZm1nKRigiL/ZYiPT0dampqbCb/AewaNGAQSKm1c3ND01+a4cOHDxAI\
-BOwAS8qduCeMG4eLFy9i3Pjx6NWnT4GP9++k/W/q6upyd+3denRH+fIVWKKJFJxIRQQjIyN0/7UL\
-DAwNUa9+PQaFslGqzmkrVq/GytVrsGfXbvzaqTNu3rhRYm7kxMmT0bV7N5ZoIiVx6uwZ1K5dG7Nn\
-zmIwSHkTN/BpcpFDx46iX//+GPf7WIwcPhyvX73mnSYihbBv71706t4DcbGxiI2NRVpaGoNCyp24\
-gU8Thri0ccWJU8GoXLky2rm6YrLnRN5tkhsRERHwHDcO7VxcMWTgIDx88IBBIQCAk7MzoqM/on6d\
-unj54gU8J/K7i0pA4gb+P8nInt2785xk5PN8s0TFKTUlBR7u7oiJjsFvAwciKSmJk9tQFl1dXRwP\
-DsbN0Ds4f/FPVKlahUGhbEr0JCMSiQQqKiosBVSsjh07hpjoGCxb4Q8dHR00t7fHrZs3IRDyLQX6\
-P319fQaBlD9x53eSkZSUFOjq6n7xtS6ZTAapVJo1AIJY/Gm4TZFIxNfB6Lu8fvUaJiYm0NHRAQAY\
-ljKEg2MrAMCuHTsRHR2dta2tnS1fgSMi5U3c+Z1kRCKRfDX5CgSCbKMWyWsN3XfBQpS3qACPX39l\
-qZZzpX4qhbi4OEgkEohEIiQmJuLSX3/BvkULaGpqIj4+Hrt37sSYcWOhqqoKAEiIT0Cn9h0YPAVT\
-qYKFwn52NTU1nD5/DmZmZryRTNxFp7WrC5xdWuPY0aMYO+Z3pCQn49bd0Dy3NzAwUJpr37Z1K2pY\
-WzNxKwAHBwcsmr8Aq1asRCePzljp7499QXvxx6W/0L5jB1S0tMThgwfRr3//rH309PWwfuNG1KpV\
-iwFUAL179ETYkye4cuO6wl6DcytHpKaw3wUTdzEQCARo264dwt+8he+iRV/dlqi4lStfHn7+yzF9\
-mheWLV0KAwMDLFzsCxMTEwZHSXhN90ZcXDwDQUzc+UrgQiHvLsktJ2dnODk7Iy4uDnp6ehCyvCqV\
-ylZWDAIxcRMpI2V6XENExYM/84nkjE1NG4V+NkpETNxERETExE1ERMTELVd0dXV5h4mo2EkkEmRm\
-ZjIQxMSdX9179uAdJqJiN2H8eLhzwBxi4iYiUgzv/v4b7/7+m4Eg+Uzco0aMQOD69Vn/vn3rFnp0\
-7Yb3798zukRERPKWuI2MjBC4YUPWFJkH9x9AfFwcR4EqZH9cuIBBAwZg7qzZiIuNZUCIqEglJiQg\
-LTWNgZBDBR6ApX3HjtiyaTNu3byJOnXrIvjkSfQfMICRLUSvXr7CwP6/4fdxY3Hm9BkEbgjE2PHj\
-FP66oqOj8fjRIyxasIA3+SvSUlORnpbOQFCxUdfQgFDEp6lKmbhr1aoFCwsLHDt6FGKxGNHR0WjX\
-3g03rt9AQnw8WrZyQGhoKJ6GhaGzhweSk5Oxe+dOJvd8CD55EhUtLVGrdm3Uq18ftnZ2SnFdVatX\
-x7NnzxAfzzGdvxqratVhambKQFCxUVNTg5qaGgOhjIkbANw6dMCObdsgzhTDrkEDmJqaYv/efXj9\
-6hVatnLArZs3MXfWbJQrVw7lypXHqpWrmLjz4cOH93j54gXWrl6DBw/uY9DgIRg4eJDCX1fnzp3R\
-uXNn3mAionwolHaQDh074MOHD9izezfad8j9FQiT0qXhNXUaxGK+25hfWlra0NHRwcYtm/HbwIHY\
-u2cPg0JExMT9/cqWK4c6detCKBSitatLrts4ODigdOnSCFgXwKjnk7WNNRISEvD82TO8C/8bevr6\
-DAoRUQlVaLODBe3f99VtZs6ZjXYurtDQ1Myx7sOHDzh04CBevnyBmjVroWMndz5f+fyjp1UrOLu0\
-houTM/QNDLB67ZqcN1JFBSoqIgaLqISKiIjAEl9fPH74CD+bm2PUmNGoXqMGA8Mad8FYWFhg0JAh\
-OZaHPQlDRzc3vH37FjY2NXH+3Dl4uHdCUlJSvs8hk8mwc/sObNm0EUG7gxC4fgOkUqlC3ySRSAT/\
-lStx5/49XL1xPdfOaQsXL8Y4zwks0UQlUGpKCjzc3RETHYPfBg5EUlIS+vfpi5TkFAZHGcnkgId7\
-J9neoKBsy7ymTJXNmTU738datWKFrHrlKjLL8hVkluUryGpUqSLzmTNHVpKNHD5ctiEgIOvft27e\
-lHXv0lUWFRX13cc8eOCAbOzoMTIiyqmrh4esbs1axXa+oD17ZNUqW8kSExNlMplMFhMdIzt9KkSW\
-kpLy3cd0cmgle/b0aZF/9pbNm8tevXzFQpMPKj/6h0NsTCxevnwB906dsi0fMGgg+vbug6le0/J1\
-vNWrViM94//vu6alpWPzxk3wnDgRKioqJfLH2edBcvr99hsEAgEHySFSMq9fvYaJiQl0dHQAAIal\
-DOHg2Aq7duxEdHR01na2drawa9AAAHD29BksX7Ysz2P+HR6OkcNGQE0990eW6urq2LF7F0QiPqIr\
-bj8+ccfFwtDAEAKBINtyw1KlEBkRgUoVLAp8DrFYjKqVKiv1jTQ3N8f5i3/muo6D5BApt1I/lUJc\
-XBwkEglEIhESExNx6a+/oKqqivj4eOzeuRNjxo2Fqqpq1j6NmzaBSem8f7wnJiZ+cYZFHR1dJu2S\
-lrgzMzOhqqqK8uXLIzo6Gu/evYOZmVnW+suXLqFO3brYvmtnvo7r3r4D7t+/D6lEAgAQCIWwsLDA\
-qTOnS+xNzmuQHAB4+fIljhw6DDU1VXh06YKffvrpi8uJSP44ODhg0fwFWLViJTp5dMZKf3/sC9qL\
-Py79BasqVXD44EH0698/2z4aGhqwtrHJcSyZTIaYmBjEP3wIIyMjGBsbQ1RCWyvl1Q8bz+7zLz+R\
-SIRBQ4ZgzMhRiIyIBACEhoZi9oyZGDVmdL6Pu8TPD2VKl4ZIRQUqIhGMfvoJy1euKPE32q1DB5w4\
-dhzHjhzNGiTnzevX8HDvhOTkZDx6+Ah9evSEVCrNczkRyady5cvDz385dmzbhl8aN0HwiZNYuNj3\
-mx+HvXv3DmtWr0ZXDw/UtrZBG+fWGND/N7Rv2w421WvArU1bzJvrg0cPHzLYJbnG/W8DBw+CDDK0\
-dXUFAGhracF75gw0aNgw38eqYFEBIefOYvbMWUhOToLP/PnQzOX1s5KmQ8cOWLZ0Kfbs3o1Zc+YA\
-AIL2BMHRyQmTp06BRCzB02dPIRAI8lxORPLLydkZTs7OiIuLg56eHoTCr9fLIiMisdh3Ec6dPYc2\
-bdtixKjRqFW7FnR1deHcyhGr1qxGufLl8eD+fVw4fx5DBg6CRcWKmDh5EqpVr86gK0PilvzTPJ3f\
-5x5CoRBDhg7F4CFDEB8XBwNDwwJ9DnV1dZQtWxYJCfElJml36tAR1tbWmDlndq7rPw+S8+D+/axB\
-cmJjY1Cq1KdYi1REqFq16heXE5H8MzAw+KbtThw7jhne3ujRqyfO/XEhz+fZqqqqqF2nDmrXqYPh\
-I0ciaM8e9O3VG4OHDmFfmR+kUJvKRSJRgTorCASCAiftkur5s2d49uzZF7cJ2r8PD8OeQE9PDwBg\
-Y1MTly9dQmJiIm7dvAm3Nm0hEUvyXE5E3+YnIyMYGRnJxWexqWmDKzeu51guk8mwdccOjBoz5oud\
-0LLV9FRU0K17dxw8egQJCQm80cpQ4ybF0tnDA9euXkWzRo2hq6sLz0kTIVIR5bmcSjaxWIwG9Wxh\
-bv4zBEJO9wgAEqkEURFRuHbrRrbli5cuhVgszvfxZDJZoT6WkslkWZWi/3Jt2+a7j2tqaooxY8ey\
-ADBxU3ETqYiw2G8p0tPToaamlvXHnddyYuKOj4+D58QJ0Od4+QA+zSk/w9s7R8JVV1eHurp6vo9X\
-2H9r/Ntl4iYlldcXzPd88ZDya9nKgYP3/CP87VulvbaIiAhEvHsHy0qVeKPlDNu7iIgoB3Fm5nc1\
-9xMTNxERFZLPz7y/haqqGrS0tBg0Jm4iIvpR8vPMu4xpGfwkJz3jiYmbiOSQ/7LlmDfXJ8dyiUSC\
-LZs2Y0C//pg+zQtxcXFZ6+b7+GD0iJEYPWIktm3Zkm2/USNGIHD9+qx/3751Cz26dsP79++L/FrC\
-377lKGPExE1Eyik9PR3L/ZZhuZ8fXjx/nmN90O49WOLrC0cnJ1y5fBkL5s3PSuhbN2+BhoYGypia\
-Qv8/A498nhXvc/Nwcc6KN23KFPzWtx9vLjFxE5HyCb1zB0+fhqFlK4dc1zdo1BABgYHo0q0ralhb\
-Iy42FgDw4vlzpKeno6KlJapWrQrXNtnfS27fsSMiIyJx6+ZNSKVSBJ88CbcOHYrtx0h6ejpvLhUJ\
-vg5GRD9UfdtPc0R7TZmKyMjIHOstLCxgYWGBs2fO4sTx4wgIDAQAvHn9BlraWgh78gSB69cjNDQU\
-EydNRFJyMgCgZs2aec6KR8TETUT0nb5lMoyzp89gxLBhmOo1DU2bNQUAODi2wt0HDwAAa1avxpZN\
-m1HGtAx8FywEANy6Gwq3Dh2wY9s2iDPFWbPiETFxExEVgQ8fPuDhgwcoXaYMRgwbhnZubqhVuw5e\
-vHiBihUr4uyZs9i4YQPWBgTg2dOnsLaugU6dO6NJk0+JXVtbO9dZ8Si71JQUbN+2PWuSqM9iY2Ox\
-e9du/PTTT9mWN29hz4mHmLiJiHK6ef0Gxo4ZA/fOnZCRkYF9e/di3969qFe/PnbvDULjJo2xdfNm\
-1K9TBwaGhlgbEABjY2MYGxtnHSO3WfEoO7FEgri4OMhk0mzLa9WuBUCGhIT4bMvTUlMZNCZuoh8r\
-+mM0bt28BUdnRwbjB5rtMzfbv1u7umQl2zk+OV8T09DQwMYtm5GakgLNLwwUErR/H4P7Bbq6uhg/\
-wZOBYOImkn9SqRT7goIwe+YspKQk4+LlKyhjWoaBUTCaHN2rUGRkZODs6TN5jq5mU9MG5mXLMlBM\
-3EQ/xrWrVzFn1mw8fPDgn8lUBOBESlSSJSQk4OSJE5BIJTnWCQQCaOtoM3EzcRetpKREJCUm5rl+\
-hvd0tO/QHnXq1lWK69XX1+dUi98gIiICixctwqEDByESidC1ezdkZmZiX9BeBodKNCMjI/j5L2cg\
-mLh/4Bf0uwjE/6dTxb9dungRDRs2VJrr3XvwADQ1NVmi85CakoKAdeuwdvUapKeno0nTJpjq5Q2r\
-KlaYPs2LASL6h0Qsxo0bNyAWf6p5V69eHYalDBkYJu6iV9nKKkdvSACYNWMGDuzbj+TkZHiOG4fJ\
-Eyfi9PlzOV55UDT/7klL/yeVSnHowEEsnD8fHz58QMWKFTF52lS0aNmSwSkmN67fwBJfXwCf3tnW\
-19dHz9690Khx4zzv2bQpU3Av9C68ZkyHXYMGDGIxioyKwuqVK7Oedbt37oz2xTTiHJXwxJ2Xbt27\
-w75FC0yZNAnunTqjvm196OnpsSQooSuXL2Pu7Dl49PAhDAwMMM3bG71694JIhV07ilNsbAyuXb2K\
-GbNmQkVFFefOnUX/Pn1x884daGnn7Fj2d3g49uzajbUBAbC2tmEAi9nPP/+MTVu3MhByrMSNVV7Z\
-ygq/NG8OLU0tVK9eHb80bw5VVVWWBCXy7t07jB87Fj27dcfTsDB07d4NIWfPom//fkzaP5B7p87o\
-2r0bOnZ0h1QqRUxMNIYNHoKaNWqg269dEBnxabjTYUOGAvg0UUd8QnyObU4cO47OHd3RzsUVs2bM\
-QEpySo5tzp87hw7t3DBqxAjUtrbB5ImTAABisRie48ahtrUNOrq54dbNm7nuT8TELYeOBZ+EU2tn\
-lgAlkpKcguV+fnBs0RIH9x9Ak6ZNcOT4Mczx8eEzOjnQqmVLNLK1g/e0aRjn6YlDBw/h8ePHOHX6\
-DPT09bB08WIAwOSpUwAAq9etxd49QTm2SUlNwZ3btzFo6BD06dsPGwMDc2yTlpqG+/fuoXuPHpjt\
-MxdBu3cjLi4Oe/cE4dTJYOw9sB+ubdri0l+Xct2fSJ6V2OoHa9nK4/Nz7AXz5uHjx4+wtLTE5GlT\
-Yd+iRY5tle1tAkWydJkftm3diocPHqBNu7ZYNH8BEhISMHzoUCQmJMCkdGkAgJHRp/4aZcqY4vmz\
-Z7luo62tjXZunyYMeRoWlus26urqaNioER7+M555WmoawsKeoLKVFSpVroxKlSsDAMaMHJXr/kRM\
-3FSkXr18BW0d7RLXSe3K5cuYO2s2Hj169E3PsZXtbQJFYmNTE4sWL0Y7F1f8Pmo0nJydERb2BLuC\
-9uBUcDD09Q1y7FOzVs0c20RFRWZ7gyK3bZISEyEUiQB8egf5s7LlymFvUBDev3+PY0ePIuxJWK77\
-EzFxU5Hr3rUrrK1rYN2GDSXiel+/eg3fRQtx4thxqKiooE+/vhj9++95djT8lrcJmjRsxIJUxDQ0\
-NLDAdxG6evwKuwYNoKamjvq168DQ0BCr1q7Jsb1bhw44fOhwtm2ioiK/uk1eYzh07doVp0+FoGnD\
-RjA1NcWsuXNQw9o6x/5ETNxFQCwWw2fOHGRkZOS6/tHDR8jISEd8fN7vcnfp2g02NXP2WvVfthxJ\
-SUlZz9q2b92KkFOnULdePQwfORIikSjXZV9y+9YtLPpnusHPxo4fj/q29QslHinJyUhOTlH6ApuS\
-nIL1AeuwZtVqZGRkoEnTJvCaPj2r2TMv3/I2wV9XLqN0GQ55mpe0tDRYV62W7/0cnZzw7NXLrH/X\
-rVcPYS+eAwDGT/BEcnIytLW1s9ZbVbHKtv3BI4ezbVO9xqdZwD4zMjLKdZvP45xXq1492/G279qZ\
-45z/3b+gGjdpCjOzn1loiIn730QiEWxsaiI9PT3X9ebmZSEWi2FkZJTnMf7brJyeno61q9fAf9my\
-rOejoaGhmDVzJrxnzMBS38UoV648LCwr5ljWwb3jFz9vbGxc1isxamrqAABTM84N/K3y8xw7N5Wt\
-rFDZyirb2wQkH74lWRbWNl/atrCSNgCMHD2KN5aYuP9LIBCgYyf3Qj1m6J07ePo0DC1bOUAq+TTF\
-3Z8X/kCVKlXRo2dP3Lx+A39cuIDw8PAcy/6duNPT0/E+Kgply5VDTEwMBPj/Mzb3Tp1zfXeV8nb5\
-0iXMnTUbjx8/hoGhYYHexz4WfPKrrSNEREzcxeDN69cIOXUKt2/dxrNU9L/HAAAgAElEQVRnz/Dh\
-/XtIJBKYmpmhYsWKqFe/Hlq7usLMzCzPY9S3tYVdgwbwmjIVkZGfnqN9+PAh65e4rq4uXr58CV09\
-vRzL/i08PBzr1wVg3oL5OH0qBOrq6tD9p1m2Zo0aAIBy5cvj7IXzLIFf8OrlKyz2XZTtOfaYsWOh\
-q6v73cfk2wRExMT9g926eROrVqzE/Xv30MrJES5tXFG5shWOHjmCpKREdO3WHU+ePMa1K1fRvm1b\
-1KlTB7+PG4dq1avnOJZQmPO1dh0dbYjFYgBARmYmdHR0cl32rY6ePAFNDU2oqjGB5CUhIQFrV6/G\
-xg2B+XqOXZQiIiKwxNcXjx8+ws/m5hg1ZjSq//MjTF6cPX0Gze3tIVJhiwKRMlPYAVhSU1Iw3csb\
-o0eMhJOzM/649Bfm+PigTdu2sKpiBW1tbWhqasKqihXaublhts9c/HXlCn5p3hy/9e2HxYt8Ifkn\
-+X6JVZUqePH8OeJiY3H/7l1UrVY112X/9e9j/3t+23Jly6F8hfJfrPmXVFKpFAf27Ydji5ZYu3oN\
-ypYrhw2bNmLztm0/NGmnpqTAw90dMdEx+G3gQCQlJaF/n75IkaPOgNeuXsWgAQMglojl8t7euH4D\
-3bt0RfcuXdGzW3cMHzIUly9dKrRr79ur11d/1EjEEv6REWvcP1LY06cQiYQ4fir4m5tO1dTU0LN3\
-b7i0aYNZ02fg3r17qF2nzhf3cXF1xb6gvahfpy4sLS3RvWdP6Onp5Vj2bzKpFJcvXULg+vWQSKS4\
-ezcUrRydlOsXn1CIkJBTqFTBotCPraurizk+PvDo8qtcPI8+duwYYqJjsGyFP3R0dNDc3h63bt6E\
-QPip74LvwkXYFxQEFRUVjPp9DIRCIfbuCYJIJMKjhw/Rt39/nA4JQVRkJObM80ErR0ecCg7GmlWr\
-YGRsjOtXr6Fr924YNmIERg4bhju378DExAQLF/uidp06OHHsODasX4/0tDRUrV4NH96/z7HNvLlz\
-AQAd3dxwPDg4x2fS0dbJOoZtAzt4z5hRrDHM73jl+RETHYNrV6999UfNgyeP2RpBykGmpNasWi1b\
-OH9+oR0vMTHxm5bJZDLZtatXZadPhchSU1NlMplMlpyUXOTXW6uGtax7l67FFt/ExETZ8+fPC/WY\
-Ez09ZVUrVZJZlq8g692jhyzsyZNiuRbvqdNkluUryCIjInJd77twkax5k6a5rjt86JCsaqXKsuvX\
-rst2bN8uq2xRUeY9dZqsimUl2bOnT2XTvbxl1lWryf7X3n2HRXGtfwD/7rJUaRJFvRZAIyYiYgEL\
-IiDFgoKARhOv3ZjYE0X03sTYYrhEQbFgjMaGJLFExYZgi1jASrH8IipFQQENTRAEdnd+fxiJhCUB\
-QWDh+3ken8edmZ05+84w7zlnZs4kJyULM6dPF6ZOniwIgiCEHDgodDAyFo4cPiwcPnRI6GBkLOz+\
-6Wfhu8BAITc3Vxjh7iH8Z8FCQRAE4Zd9+4QORsbC4UOHhOOhoQqXebWO+/fvKyyTr49P6TqSk5Lf\
-KE6FhYVCByNjISMjo8rfPREeLnQwMi79Wzh+LFQwbd9BSHn4UJj+yaeCeefOwocfjBLSHr/cBwUF\
-BcLUKVOEbl3Mhf94LxCse/cRdmzbLgxychYEQRB+++03wbp3HyEzM1M4fixUeL+jqSAIgvDs2TNh\
-wtixgoVZF8F5gIMQEx0tuLu6Ch2MjIUhAwcKgiAIq75dKfSxtBJs+vQV9u7ZIwiCIIQePSaMcPcQ\
-hg0eIixbsqTSvyvl4UOhg5GxIJfLy/3e4KAggf6Zg53dGx+TjZWYVZfKUXQdu6Jr22lpaSiRlkBD\
-QwMAGuRd5Nra2mjfvn2NrtN35UpEXLgAd08PRF6MxDAXFyz64gtkZWXV6W81eMcAOTk5kMledrXm\
-5eUhPCwMRUVFiIuNhVmXLrC0ssSoUaMhFotx69YtvNOsGTq8+y5atmqJ1m3awMjYCEZGRsjPf/5n\
-d5dEApehQ+EydCgkEgkyMtIRExODUSNGIj09DSUlf45R8GqITzMzM4XLGBi8HEimTZs2Cst0+9bt\
-0nUYGRvVWSwrO1753t17EBUZhf2HQtCiZQtkpKcjPz8fGX/cNFpSXIKM9PTSffJKamoq+vTti3OR\
-F6Grp4c9u/dg8scfAwDWb9yII4cPY+uWLVi/cSNmzJ6FL//zX9y/d6/c+OfVte2HrVjjv5onTno7\
-PZ4N9YclJCQgISGhTrbtNnw4Bg8ZwqPrDRi2aAG/1auxPyQE5uZdsfunn+E8wAE7tm2v1D0Jb4Oj\
-oyOKi4uxcUMgHj9+DF8fH3w2azZyc3NhatoJ8XfuIOXhQ0ScPQupVApTU1NIXuviV63gsTWpVIqo\
-yCjExsRAKpXiRFg4nuU+Q9jJE2jfvkOZeyNeDfG59YetCpeR/NEFXFhYqLBMHU07lhkmtK6sWRsA\
-y15W0NHVwVDXYWXGGU9KSMSjR49eJuCUFJiamqJ9+/ZwHlj+MpNckCuuUDZpUq5iU5lKzeuVo5qp\
-2Ahl9h8RE3clZD79HZm//849rKS6WnTFvgP7scrfH6qqqlixfDlcBg3GuYiIWi9LOyMjBKxfh5+C\
-g2Fr3Q/hx8Ow0t8PhoaG8Bw5AoNdhmCw80DMnD4d3gsXVvpuc00tLaz09cWY0R9iuLs7/vPlF7h3\
-9y4c7e1RUFCAx38ksTItVmcnhcsYGxu/vP7ez6ZaZXrbXo1XLhaJMXfOZ+hibg5Dw+bYvW8vPps3\
-F9NmzAAAWHTvhvg7d3D71i0cPnS4tOeqoLAA+fn5uBsfr3D9iio2lanUvF45IqrvGuxY5WKJuMzL\
-BUj5vBpkZ/CQwdiy+eUwp5MnTISDowO+WrIEbdu1q7WyDBw0CAMHDUJOTg50dXVLHx2USCRY5e+P\
-r7/5BhKJBJI/WtfjJowHAEybPh3Tpr98v7T3woVl1qmuro5DR4+UGWrz0rWrEAShzPPmI0aOLB3i\
-06Z/f4XLtGjZEleir/+RqBSX6fVhQutSZcYrd3RygnU/a4wb828McHQAAFhZWaFt27aw6dMXfa2t\
-Fa7bydkJRw8fhqO9PZo2NcDjR4/KVGqux8Xi6tUrGOw8EHK5vLRS89tvv/EPjpi461qPHj2Rk5PN\
-PdwAaGppYc7nn8NtuHvpgCznz53HmLH/xrz582t0qMp/oq+vX2Eyqoom2k3Qrl3bl/9/rfySSowG\
-V9Eyampq1SrT21TV8crjYmNhZGSMZStWIC42FkcPH0FHU1OcPHMGLwoLoan1530jg12GlI5LXlHF\
-pjKVmvpSsSH6x4Zpg/1hYnGlToKkPIxNjLE+MBA7g4NhbGKCndt3wNnBEQf3H1C664lOzs44cOgQ\
-d+qrisxfKl+mnTohPj4eg52csXzpMnyxaBHU1dUhEonKJO2KKjZ/HSFPTU0N6urqZSo1PD8QEzdR\
-Leln0w9HQo9h0eLFKCwogLeXF0a4uyMmOprBaSAMDAwQ9GMw4m7fQuTlS5gwaSKDQsTETcpMIpFg\
-4uRJ+PVcBCZMmojbt25j1IiRmD9vHp4+fVpm2WfPnmHIwEHl/l2/dq1aZWBFgYjq5PzHEJAy02/a\
-FF8tWYIRI0fi62XLEHLgIMLDwjH1k6mYNmMG1NTUoKuri+Mnwv+5Jd+nb5W2LRKJcDv+Trlry0RE\
-TNz/4MWLF+Xey/1qWm5ubpnpampqDfKxj56Wlnj//fcb7YHc2cwMP+/dizOnTmP50qVYF7AWh0JC\
-MN97AYYMdanUOi5eikKLli0rvU2zTu/xWV0iYuJ+E95eXoi8cLHMtJKSEgiCgIP7D5SZbtGtG7bt\
-3NHgduTWHdt5NANwcHJE337WCNqxE4Eb1mP2zJmw/qkfFi1eDNNOpgxQNbx6vHKk5wioiOvuKlva\
-o8do1bp+vKRHJpPxsVNi4n4T6wMDuSeplKamJj6dPg3D3d3ht2olDh0MgdvQoRg56gPM9/aGftOm\
-DNIbUFdXx/rAQOjq6dVpOSaMHYsVPj71Ji75ec+YvImJm6gmtGzVEn6rV2PU6NH4euky7P7pZ4SF\
-HsesOXMwbsL4evHmMWVT2csOb1s/m37cGcTE3RCs8fdHYmKi4pN4y1b48qtF3OONUK/evXHo2FEc\
-OhgCXx8frFi+HAf278dXSxbDqlcvBoiImLjriqOTM95LTVU4z7CFIfd2IyYWi+ExwhOOzk74/rvv\
-sO2Hrfho1Gg4ODpAR1ePASIiJu660NWiK7padOVepQrp6urCe+FCeHh6YsXyr3Hm9BmOoEVETNx1\
-bcv3m/HgQTIAoHXr1pg+c2aD35EhBw6iRcsWFb58gcp6t2NH7NgVhNMnT2HBfC/k5j6DSMTxiIiI\
-ibuOTsrvQkdHBwDQ1KBx3EG8fOlSmHXpwsRdRY7OTrh4+TLi4+N5OYVqjEgkhkjMiiAxcVfaAAeH\
-Rrcj5XI55HI5j+g3oKGhAQsLCwaCaswn0z7Fk4wn1VrHg+QHmD9vHlYHrKnVV9gSEzfVEF8fH6Q9\
-TgMAWPWywtjx4xkUonrKfsCAalfEF8yfj5joaBQWvmBAqQz25SgBmUyGXTuDoKGhgZatWkGvgndC\
-E1HD8MPmLZBKpQwEMXErq8SEBBQVFaF9hw5477334DJ0KINC1EDdu3sXW7dsgY+vL4NBTNzK6uGD\
-h9BqooW78fHw9fHB18uWMyhEDdTypctgZGyMw4dCAAA/7trF+1eIiVvZODo74cbt2/APWINJH0/B\
-ifBwBoWogbKwsEDbtm2RkpICAEhLe8ygUBm8OU0JnDl9Btu3bsX3W7bg/r176NLFjEEhaqDmL1wA\
-AHj27BlCjx7D/AULIeajZcQWt3Kx7mcNiUQCy+7dEXkxErM/+5xBIarH1vj7Y86sWdVah66uLu4n\
-J/F1tMQWtzLS0NDA9qCdKCwogKaWFgNCVM9duXwZd+PvMhDEFndjx6RNRERM3EREREqEXeW1rKSk\
-BBPHjYdJe5MaXW9RURGSkpKw6IsvGORaIpXKIAgCA1HbJy0VCd41NlGKsipLOf9KT18f12KiIRKJ\
-eMAxcdOLFy9wIy4Orm5uNbreg/sPoImWFrp0MWeQa4mOri40NDQYiFp2J+FevS/jR6NG4W78XVyP\
-i1XKGJt1eg/FxcVQV1fnAcfETQAgkUjw4ZiPanSdvj4+MGzRosbXS0RE9QuvcRMRETFxExERERM3\
-VUgkEvFGEiKiRoDXuBuIGbNmoW3btgwEERETNymDqZ9+wiAQETUC7ConIiJi4iYiIiImbiIiIiZu\
-IiIiYuImIiKiGse7yhuIT6d+AlUVCWxs+1drPaadTNGjZ0+F8xISEnD18pVql7XVv1rBzt5e4byM\
-9HREnI2AXC6v1jZ0dXUx2GUIxOLyddO8vDyEh4VBWiKt1jbU1dUxZKiLwvHKS0pKEHr0GAoLC6u1\
-DRWJCpydnaHftGm5eYIgIDwsDDnZOdXahkgkgo1tf7Ru3Vrh/IsXLiLl4cNq7/cePXvCtJOpwnlx\
-cXH47fb/VXsbHU07oqelpcJ5iYmJuHLpcrW30bJVS9gPGKBw3pOMDJz99SyePn0KqVTKExMxcVPF\
-zp4+A5lchrCw49VazzvvvIPL168pnLd8yRJcvHCx2mUViUS4FhsDPT29cvM2bgjEj8HBNRKTkCOH\
-0cW8/EtXftm7F998vaJGtqGqpophrq7lpp+POAevuXNrZBsZ8zIwa85shYlo1vQZNbINd08P+K1e\
-XW56cXExJk+cAJlUVu1tdOveHb8cPKBw3mezZiM1JaXa22hq0BRXo6MrOH6X4sL58zVy/F6NiYa+\
-vn754zdwI4KDgv6odPH0Sm+HSOB7CWtVXl4ebK37IebmjRpdb/jxcGRlZkK/qX611mNsYoz3O3dW\
-OC81NRU346pf7uaGhrC0Utwqys7KxqWoqGpvo4l2E/S3tVU4mlxhQQHOnTsHuax6rXpVNVXY2dtD\
-VVW13DyZVIqIsxEoKiqq3h+oWASb/v2hra2tcP6F8xeQ9+xZteNl2csKzZs3VzgvNiYGaY/Tqr2N\
-zmZmMDI2UjjvbvxdJNy/X+1tGBkbobOZ2Vs9fps1bw6rXlZ/e/zm5OSgWbPmcB7krJTnKbNO7yH6\
-RlytvB3M0d4e23bsrPDYICbuBpu4iYiYuBsH3pxGRESkRHgRhoiokcpIT8euoF0QhLKXjWQyGVb7\
-+UHy2nV6kUiMUaNHoZ0RW8ZM3EREVCdEIhF0dHTKTR80eAgMDN5RuDwxcRMRUR0xbNECn06fxkAw\
-cRMRkTLJysrCibDwCucPcBiAFi1bMlBM3EREVB/k5OTg1q2bFc636GbBxM3ETURE9UX79u2xwseH\
-gWDiJiIiZZKfn4+42LjSz2ZdzBSOEEdM3KQkrl29htV+fgAAsVgMPT09jB0/Dn2trSGTyfDjrmCc\
-i4hA69atMXe+F//giZRMclIStny/CYIgQCQSY+bs2RWOEkd1hwOwUKVlZ2fhyuXLcBnqgmGurpDK\
-pJg8YSIKnhdg3569WO3nB+eBA3EpKgrf/s+XASNSMl3MzbFj1y7sDA7Gjl1BTNpscVND4TliJLSa\
-aEFfXx9nz/yKF0Uv0LtvH2zZtg1Wvaxw+dIl5GRnM1BEREzcVB84OThAkMshk8ng5e0NAwMDGBgY\
-wMTEBGdOn8Hx0FBs2baNgSIiegvYVU5VtmZtACx7WUFHVwdDXYeVTj9z6jRmTZ+OL79aBJv+NgwU\
-ERETN9UH5uZdscrfH2KRGHPnfAa5XI47d+5g1owZcHVzg0W37khMTGSgiIiYuKm+0NDQwLd+qxAb\
-E4OgHTsRHBSE4uJi7P/lF3i4ueG/CxYySETUYMyZNQvbfvih9HNMdDT+/eFHePLkSa2Xhde4qdKc\
-Bw7E/eSk0s89evbE3cSE0s8cwIGIGqpmzZph29atmDRlCkQiEUIOHERuTg4MDQ3Z4iYiIqpvhnt4\
-ID0tHdHXr0MulyM8LAxu7u51Uha2uImIiP6BhYUFTExMcOzoUUilUmRmZsJ1uBsA4P69ewgPC4cg\
-CHB1c4ORsRFiY2Lw5MkTDBw0CL///jsOh4Rg8scfY/dPPyMzM7N0vVa9rNCrd2+2uKlmfPs/X9yI\
-iys3PTUlBYu++FLhd3x9/oebN24weERUKYIgVOv7crkcu3YGYeK4cZg0fgJ+3LWr2uusiJu7O44f\
-C8WxI0fRq3dvtGrVCvF34jHSwxMZ6el4+vQpPNzckJyUjGtXr+HYkaMAgKdPnmBj4EYAgKamJnJz\
-c7F50yZoNdGCqqpqlcvBxF2LTp88hcFOzsjLy4OzgyOuX7tWb8uakZ6O4F1B2LJ5c7l5mzd9j5AD\
-B/Eg+UGZ6elp6fgxeBd+2LyFO5uI/taTjAx8+MEoPHzwEGNGj8aVy5ffaD3e87xw8sQJTJk6FZM/\
-noLQY6FYMH/+Wymzu4c7nj59ir179mD4H93kRw4fRq8+vbH8mxVY9vVydOveHfv27qlwHcM93OHq\
-5gZNTU1MmjwZ3Xv0YOKur27dvIlZM2ciIyMDwMsxgSeMHYe0tLR6Wd6A1Wswdtx4XL18pcyjXSkP\
-HyI8LAwTJk3Cxg0bynxnjb8/xo0fj6jISCQlJXGnE1GFpn86DXExMS+T+JMnmDJxUpku5MqIiozE\
-7du3sW3nDvS3tUV/W1vs2BWEG7FxuHrlSo2XuW27dujeowfEYjEGuwwBAGRmZsKonVHpMm3atEF2\
-djZUJCoQIJT2KohFohorB69x15KDBw5CLpWVfhYEAVKpFEsWLUZPy551Uqb43+4gNze33PTnBQW4\
-f+8ufj1/Dtra2tgUuBEr/V++XGTlt99i0sdTMHbcODjY2iEpKQkmJiaIvxOPcxEROPnrGWhqauH7\
-jd/Bd9XKlzVir/nIfPo7RAoOXGMTYxi2aMEDhKgRKSgoQFxsbJnzISDC+YhzcPf0qPR6LkVFwdXN\
-DRLJn6lMVVUVQ12HISoyCla9etV42fcd2F/ms3lXc2z5fjM+nTEdgiDg7K+/Yubs2VBXV8eD5AeQ\
-y+V49OgRdPV0mbiVTXFxcbnrLgKAgoLnePYst07KlJWdiefPn5eb/uLFC4yfOBE6OjqYNHkyHOzs\
-kJiYiLy8PMRER2Olnx80NTUxfuJEbArciG/9VmGlry9mzp4FbW1tTJoyuTSpP8vNxcmwMLzbyRSK\
-6puZWZnQ0NTgAULUiDzPz4dIJCpzTiwsLMD8efMwf968yicwiQRz5n6ucPqLF0W18ltGj/4QMdHR\
-GGBrBwAYPGQwRn7wAZ4XPMeuoCD06tETxSXF+GrJkhrbpkh4W1fxqVzNcNL4CSgpKfmzZqimhtDw\
-MJiYmNTrsgeu34AHyclIS0vDcA93jPzgAwAv393rYGuHLxd/hYDVa3Di9KnSGy3Wr12HR6mpSE1N\
-hefIEfAcMYIHARGVGuTkjKTEBMjlQun58PTZX/Gvf/2r0us4c/oMAtetw76DByAWv7zyK5fL4Tnc\
-HXO95sHO3r7Wfs+rc/tfbzYrLCiAmro6VFRUmLiV0Y/BwfD5egWKioqgo6ODb/1WYeCgQfW+3Pn5\
-+ejf1xrNmjVD2KmTZQ7ADevWY+f27Vi+YgWGDHUpnZ6XlwfbvtYwNDTE8VMnS/+oiIgAIOH+fUye\
-OAmPUlOhrq4Ov9Wry5xDKkMQBEwcNw7NmjXHjFkzIQgCAtdvQE5ODrYH7WywsWPirmU52dmws7FF\
-zM04pUpmXy9dBtNO72H0R6PLTM/Ozsa0qVOxe9++ctewly9eivfN3scHo0dzxxORQvY2Nti+Mwgm\
-Hdq/0feLioqwLiAAp06egkgkgpOzM+Z8/hnU1NSYuKlm5OXlwda6H2Ju8llnIiJHe3ts27ETRsZG\
-dbL9V/f5qKurl7nJrb7au3sPb04jIqLGq0mTJkpV3lEfjuZz3EREVHdysnOgq6v4Uamli5cgJjqa\
-QfoLJu5aVlJSgsLCQgaCiAhAbm4umho0VTgv8sIFZKRnMEhM3HWrqKgIMpmsUf52mUzWaH87kbJL\
-S0uDt5cXXIe4YNrUT/B/t2+/tW0tX7oU3c27Ijk5Gd5eXuhu3rXKo6oxcRPVABUVlRp9lpGIakdh\
-QQE+8PREVmYWpkydivz8fEyeMBEFzwveyvY+GjMGazesh2ELQ0yaMgVrN6yvsDu9MeLNaURE9LeO\
-HTuGrMwsrN2wHtra2rCzt0f09esQiUVvZXsdTU3R0dQUWppa6Ny5M2zt7LgTmLiJiKiyHiQ/gKGh\
-IbS1tQEATQ2awtHZqXS+ovdR10iFITyMvXQKsKuciIj+lsE7BsjJySm9RyUvLw/hYWEoKiqq8H3U\
-NUFVVZWjLjJx1x8c94aIlIWjoyOKi4uxcUMgHj9+DF8fH3w2azZyc3Or/D5qYuJWOvp6ejAwMIDn\
-8OG4FBXFgBBRvdfOyAgB69fhp+Bg2Fr3Q/jxMKz094OhoWGF76Omt4dDntZRazss9Dj+5/MNVFXV\
-EH7qpFIMtUdElJPzcsCUV13YP/34I7Z8vxn7DuyHIAgYMdwdM2fPxuiPPiz9jr1Nf6Smpr7R9tq0\
-aYOzF84z8K9htqgDiQkJOHniBIqLimFnZ8ekTURKQ19fv8znit5H/TomXra468S1q9ew2s8PACAW\
-i6Gnp4ex48ehr7V16TLr165Dfn4+/vvlFwrXkfLwIb7ftAmnTpzEmLH/xuSPPy69S5OISJlV9D7q\
-v8rPz8f5iHOIi4vF/Xv3ERV5EV3Mu6JZs2Yw7WSKnpaW6Nu3L1TYoKkQr3FXUnZ2Fq5cvgyXoS4Y\
-5uoKqUxaOgDBy9fKrcW6gAAkJiSU+25WVhZGuHtgpIcn2rUzwpmICMz5/HMmbSJqMFRVVf82aScm\
-JuK/CxbCpk9fHNi/HwYG72DM2LEoKiqG98KFcHVzg1wux9o1AbDu3QfrAgKQl5fHwCrAKk0VeY4Y\
-Ca0mWtDX18fZM7/iRdEL3L91D/fu3YWDkyPkMnn52pFYDLGKGHK5HCUlJZALcgaSiBpNS3zDunXY\
-8/NujJswAREXL0BPT6/MMpZWlgCAwS5DMNfLCw+SH+C7wEAMcnLGim++gYOTIwPJxP3mnBwcIMjl\
-kMlk8PL2hoGBASytrNCrd2989cWXSE9PL/cdfX197Nu/H6kpKdj03Xew62eDD8d8hE+nT+cwfkTU\
-oJ0ID0dSUhKOHA9F8+bNK/UdI2Mj+K5aievXrsFv5UrY2vNeoDKNQYagatasDYBlLyvo6OpgqOuw\
-0hZ1ZbRp2xYrfHzwS8hBZGRkwMl+AOZ7eTGoRKR0ZDIZpFJpmTEp5PLyvYlDhw3Dug0bKp20X9fT\
-0hI/793LpM3EXT3m5l2xyt8fYpEYc+d8pvBA/SfGxsawtbODmro6bsbdgFQqZWCJSKmoqKhAIpFA\
-JPpzvPLX/09M3HXu9RvJNDQ08K3fKsTGxCBox84qrSfy4kV4uA3Hzm3bsTpgDZ/hJqIG400Td05O\
-DoNXlTjzcbDakXD/PgLWrMGN2Dh8Pm8e3D09WDslololCEK9O++8a2yC02fP1tiLSRoDNvVqwYOk\
-JAwZNBjOA50RduokNDU1GRQiUpoW8dukyh7HKmNXeS0wMjHB8RPhEIvFGOTohN0//fxG18aJiBqa\
-f7VpzSAwcddPHTp0wPrAQKwL3ICQgwfgOdwdUZGRDAwREVUJ+yhqWbfu3fHz3r0ICz2Ohd7efMkI\
-ERGxxV1Vcrm8Vt+P/fpLRqyt+zJpExERW9xVSdpA7dy08deXjCz/ZgXHKyciIibuqqjsqGfVkZWV\
-hamTpyA1JQVTpk7FmYgIaDXR4tFHRERVz1sMQc2RyWQVVg5EAFQkEujr60NdQ53BIiIiJu762nrX\
-19fHLyEHsfmHLTgUEoKeFt0YLCIiYuKury3uV7qYm8NvzWo8f/6cwSIiIibuusa7w4mI6K3nGoaA\
-iIhqg71Nf6Smppab7mhvX25amzZtcPbCeQaNiZuIiOoKE3HNYJklEg8AAAFjSURBVFc5ERERW9xE\
-RESKVdRlDrCLnIm7HtLU0ICqqioDQUSNFhNz9bCrvJapSCRQV+cALERExBY3EREpkde7zNlFzsRN\
-RET1HBP1m2FXORERERM3ERERMXETERExcRMREZGyEAmCIDAMb8eF8xeweNEivB5iQRDw+PFjtG7d\
-usyyEhUVBG7aBNNOpgwcERExcdeFkpISpKellZuel5cHHR2dctNbt2lT4Tu9iYiImLiJiIiUDJ/j\
-rgWXoqLwXWBghfMXLV6MjqbsIiciIra464Xc3Fzcunmrwvk9LXtCQ0ODgSIiIiZuIiKihoRd5bXo\
-yZMnuH71WulnG9v+Cm9SIyIiYuKuB5KTkhAaeqz0c0fTjkzcRERUJewqJyIiUiJ8aJiIiIiJm4iI\
-iJi4iYiImLiJiIiIiZuIiIiYuImIiJi4iYiIiImbiIiImLiJiIiYuImIiIiJm4iIiJi4iYiIGqf/\
-By278fu+DnPqAAAAAElFTkSuQmCC'
-
-Inverting='iVBORw0KGgoAAAANSUhEUgAAAhQAAAGZCAYAAADRvKh+AAAAxXpUWHRSYXcgcHJvZmlsZSB0eXBl\
-IGV4aWYAAHjabVBRDsMgCP3nFDuC8qjKcezaJbvBjj8suLTNSHggT58A7Z/3ix7DOAvJUlvRUpKZ\
-qCh3S1py6wfmJAf6QRJH9VIn1UjZIizCiVbi4azHg59gt2w5CbVnEOuVUPHI7SYUH2F0NHrbZkch\
-BHYih0D3sVLRVs8jrHu6WnOnAag+9xS5n6Xa9rbFimDekZEMAfEGMByEPogDi13MEMthVDfX6MQW\
-8m9P0+gL/GVZKzpua0kAAAGEaUNDUElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlUioqdhARyVCd\
-7KIijrUKRagQaoVWHUwu/YImDUmKi6PgWnDwY7Hq4OKsq4OrIAh+gLi6OCm6SIn/SwotYj047se7\
-e4+7d4BQLzPN6ooBmm6bqURczGRXxcArguhHCKMYkJllzElSEh3H1z18fL2L8qzO5/4cvWrOYoBP\
-JI4xw7SJN4hnNm2D8z5xmBVllficeMKkCxI/cl3x+I1zwWWBZ4bNdGqeOEwsFtpYaWNWNDXiaeKI\
-qumUL2Q8VjlvcdbKVda8J39hKKevLHOd5ggSWMQSJIhQUEUJZdiI0qqTYiFF+/EO/mHXL5FLIVcJ\
-jBwLqECD7PrB/+B3t1Z+atJLCsWB7hfH+RgDArtAo+Y438eO0zgB/M/Ald7yV+rA7CfptZYWOQL6\
-toGL65am7AGXO8DQkyGbsiv5aQr5PPB+Rt+UBQZvgeCa11tzH6cPQJq6St4AB4fAeIGy1zu8u6e9\
-t3/PNPv7AW/BcqXD0M4bAAAOW2lUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJl\
-Z2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxu\
-czp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJk\
-ZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgt\
-bnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6eG1wTU09Imh0\
-dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iCiAgICB4bWxuczpzdEV2dD0iaHR0cDovL25z\
-LmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIgogICAgeG1sbnM6ZGM9Imh0\
-dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvIgogICAgeG1sbnM6R0lNUD0iaHR0cDovL3d3\
-dy5naW1wLm9yZy94bXAvIgogICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZm\
-LzEuMC8iCiAgICB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iCiAgIHht\
-cE1NOkRvY3VtZW50SUQ9ImdpbXA6ZG9jaWQ6Z2ltcDo3MWNhODQ2NC1kNjQzLTRiMjEtYTUzZS1k\
-MmI5NmQxNDdjOWUiCiAgIHhtcE1NOkluc3RhbmNlSUQ9InhtcC5paWQ6OTQyNTc4OTEtZThkZi00\
-ZTc4LTliYWUtZWIyYjljN2U2ZjNhIgogICB4bXBNTTpPcmlnaW5hbERvY3VtZW50SUQ9InhtcC5k\
-aWQ6YTg3MjdkMTktYTkzZi00ZTM3LWI2YzktMmNjODk1NmIxYjM4IgogICBkYzpGb3JtYXQ9Imlt\
-YWdlL3BuZyIKICAgR0lNUDpBUEk9IjIuMCIKICAgR0lNUDpQbGF0Zm9ybT0iTGludXgiCiAgIEdJ\
-TVA6VGltZVN0YW1wPSIxNjk3NDU5NTUxMTQyNTYwIgogICBHSU1QOlZlcnNpb249IjIuMTAuMzQi\
-CiAgIHRpZmY6T3JpZW50YXRpb249IjEiCiAgIHhtcDpDcmVhdG9yVG9vbD0iR0lNUCAyLjEwIgog\
-ICB4bXA6TWV0YWRhdGFEYXRlPSIyMDIzOjEwOjE2VDE0OjMyOjI5KzAyOjAwIgogICB4bXA6TW9k\
-aWZ5RGF0ZT0iMjAyMzoxMDoxNlQxNDozMjoyOSswMjowMCI+CiAgIDx4bXBNTTpIaXN0b3J5Pgog\
-ICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAg\
-ICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOmY5MTg5\
-Y2M0LTY1NzMtNDZiOC04YzEwLTkzMDAxMTk5MzM3OCIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2Vu\
-dD0iR2ltcCAyLjEwIChMaW51eCkiCiAgICAgIHN0RXZ0OndoZW49IjIwMjMtMTAtMTZUMTQ6MjI6\
-NDMrMDI6MDAiLz4KICAgICA8cmRmOmxpCiAgICAgIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiCiAgICAg\
-IHN0RXZ0OmNoYW5nZWQ9Ii8iCiAgICAgIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6MzFiMzQy\
-ODMtNDU0OC00ZDYwLTg0MjEtMzNmYTE0MWUxNWIyIgogICAgICBzdEV2dDpzb2Z0d2FyZUFnZW50\
-PSJHaW1wIDIuMTAgKExpbnV4KSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyMy0xMC0xNlQxNDozMjoz\
-MSswMjowMCIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgPC9yZGY6RGVz\
-Y3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAg\
-ICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz6fN8sCAAAA\
-BmJLR0QAAAAAAAD5Q7t/AAAACXBIWXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH5woQDCAfzKoelwAA\
-IABJREFUeNrs3XdYFFfbBvB7d4EFREFUbNgV7MaoUWPDjhWwYI8tNsSCHWussXdfK2jsFbsI0lSK\
-SuyCoCgYka4UgaVs+f4w8kkARVzq3r/ryhWZmZ3yzJnZZ8+cOQcgIiIiIiIiIipsgv9OUCgUCoaF\
-iIiIvoeQISAiIiImFERERMSEgoiIiJhQEBERETGhICIiIiYURERExISCiIiImFAQERERMaEgIiIi\
-ZVBT5YOPjo5Gp1/bIS09nSWBiKi4fYGJRAh4FcRAMKEofFKpFOXKl8dtH2+WBCKiYkSSnIxfWrZi\
-IIoQPvIgIiIiJhRERETEhIKIiIiYUBARERExoSAiIiImFERERMSEgoiIiJhQEBERETGhICIiIiYU\
-RERExISCiIiImFAQERERMaEgIiIiJhRERETEhIKIiIiYUBARERF9psYQkLubGx7cf4CqVasCABo0\
-bIBmP/2U4/I3PTwQHhautO3/3KIFjIyNsp2nUCjgdP064mLjlLItgUCAX9v9imrVq2c7XyqV4trV\
-q0hOSlZOxi4UwqRLZxgYGGQ7X5KcDEdHR6SlpinnglZXQ4+ePVGmTJls58fFxeGGszNkUplSticW\
-i2Hauxe0tLSynR8ZEYGbHjchl8uVsr1SOqXQu3dviNSyv3W9CXkDH29vpZVN/XL66NGzZ47zAwIC\
-8OjBQ6Vtr6phVXTo2DHH+Q8fPEBgQKBStvXh/XuU1dfHsBHDeRMkJhSkHNOnWkMikWT8rauri/uP\
-H2W7bHh4OMaPGavU7RsZG+Gak1O28x4/egTrKVZK3V6Hjh1x8PBf2c5zuXEDs2bMVOr2Bg0ejLUb\
-1mc77/Sp01i5fLlSt/f2n39gM3t2tvP27dmDfXv2KnV7yZJkjBg5Mtt569euw8ULF5S6PW0tbXTt\
-3i3beYtsbXHHx0ep27tw+RIaN2mS7bxpU6wQHBys1O1537ubYwI6etQopSW7n5lZmENbW5s3QmJC\
-QT9OV08XEokEc+fPBwDUMzLKcdnKlStj7Yb1eB/zXmnbb/5z8xznNWnSBMtXrkBiYpLStteufbsc\
-53UyMcGipUuUVmMAAD1Mc/6Fa2ZuBqk0HVIl1RgIhUL0N+uf4/xRo0dDT68sFAqFcm4gaiL06ds3\
-x/lW1lNhZGystFiKxWK069A+x/nzFixQag1F6TKl0aBhwxznr1i9Ck8eP1Ha9ioYVMgxmQCALVu3\
-ISgoSCnbcrlxA9HR0RCLxbwJklII/jtBoaw7TTEQHh4OywEDcdvHW6ULQVcTE7wJeYOgkGBeEURU\
-LEiSk/FLy1Z46u/HYBQRbJRJRERETCiIiIiICQURERUzkREROPLXYaSnpzMYlIGNMlXk4vf28kbp\
-MqVh0rkz1NR42okobyQSCWZOnw7fe74wszCHuro6g0JMKFRBWFgYevfoiYoVKyImJgbNfvoJ9n8d\
-YmCI6LuFh4djoLkFoDpt9+k78JFHCff44SMkJSXB4dJFzLe1hY+3t9I6GSIi1SKTybB02TLMt7Vl\
-MIgJhapp07Ytatepg9kzbWC3fz+GjxwBoZCnnUjVbduyBeNGj/muPkkMDQ1h2rsXg0fZ4iOPEi5d\
-mg4NdXVER0cjKTlJ6b3sEVHx5ObqBr9nz5CUlAQdHR0GhH4Yf6qWcA5nzyIqKgpnzztg+86dOHP6\
-NF4EvmBgiIiICQXlnoaGBuLi4+Dv54eHDx4AANQ12CqbiIiUi488Srhhw4fD3c0dZn37QSgUwsra\
-GrVq1WJgiCjPzCzMYWZhzkAQEwrgUz/wri4uSEpKwk0PD3Ts1AkCgaDEHaeWtjaOHD+GDx8+QEtT\
-E1ocVZCIiJhQKEdIcAiGWVoiLi4O6elSTPx9Apo0aYwjx49DS0urRB6zvr4+SztRMRAWFobLFy/l\
-+3ZiYmIAAAft7KGhoVH8AqWQQ8H+MJhQFLb5c+fiw4cPkMk+DRktk0rh7+ePvbt3Y+asWSwVRFRo\
-JBIJ9uz+H4aPGJGv25FJpQCAhIT44plQAJhiNYUFpghRyeHLGxoZIy0tjWefiL7+i0ukhoBXLwt8\
-u3Vr1kJQSHC+bsOsbz/4PXuGR8+e8rVRUs71oooHXb1GDbx+FQS5/P9zJ3V1DVgOtcTylStVLh5d\
-TUzwJuRNvt/AiIqbujXZgJkot1TytdEVq1ZCKBRlvD6poaGBMrqlYT19ukoWAgEE7D2TiIiYUHyv\
-X1q3hpOLC4YMGQotLS3MsLGBi7s7KlSooJKF4PeJEzFtxgxeDURElGcq+9pojZo1MMlqClxdXDBp\
-ymSVLgRDhw/jlUBERD+E9dxERETEhIKIiIiYUBARERETCiIiIiImFERERMSEgpRBIpHg48ePDAQR\
-ETGhoLwbN3oMTLv3YCCIiIgJBeVdVFQkIiMiGAgiFVK+fHmULl0ampqaDAYphRpDQESkenbs2oXE\
-pESoqfFrgJhQEBFRHmmX0oZ2KW0GgpSGjzyIiIiICQURUX6IioxkEIiYUBAR5Y1UKoXd/v3o06sX\
-dHV1GRCiXGIbCiL6qjfBwdixfQfq1q0LgbDgf4Mo5HIEBQVh2vRpqFGrVr5u697du/hj6VKUK1ce\
-J0+fRp26dVkAiJhQEBVdgyws8PafUFSuUllp64yKioIkORmt27RFrdo10aFjR7Ru0wYikeiH1rt4\
-0SL4ePsUeswiIsJx9MSJby5n0r4DPDxvf3fs1q9dizs+Ppg9Zy4sBg5gISViQkFU9Pk980d6ehre\
-v49R+rpdbjgDAPbv3QcDAwNYDh2CSVOmQEtLK0/rMzI2ho+3D4aNGIFGjRoVeKz8/fxw/NgxGBkb\
-52r50NDQXK9bJpXiyOEj2LljB8zMzeDs4qoybz5cvXIFL1+8wMxZs3hBEhMKouKqTJnSSElJwS1v\
-L6WtU6FQIDk5GTHRMQh+/RrXrl3FLY+b2Ll9B86fc8AfK1egc5cu371esVgMAGjfoT16mpoWeKyc\
-nZxw/NixjP1QFt9797BsyRKUK1cep86o3uONA/v24emTp5g4aTJfHyUmFETFmUAgUHqjPz09PVSp\
-UgVNmzWFmYU5oqOjse7PP3Hx/AVM+n0CFi9dit/GjFbpuPPxxidyueLT/xVyXoykFHzLg6gEq1Ch\
-AjZu3gy7QwehqaWJFX/8gf/t3KmSsZBJpThkfxC9e5pCV1cXzi6ubCtBxISCSsxNXiaDVCplIPJZ\
-x06dcOT4cejp6WHLps3wcHdXqeP3vXcP/fr0gauLC06dOY0ly5axmp9IyfjIgwrVyePHsXH9BpUa\
-Pt3Q0LBQttusWTNs3rYV48eMxbzZc3DF8RoMKlYs0bHm4w0iJhSkIlJTUzF4yBAsXLxIpY67dYuW\
-hbLdjp06YfyE33Fg337s2LYdK9esLpHxVeW3N4gKCx95EKmYGTNnoqx+WZw5fRrv3r0rkcfYt3cf\
-3Lp5E2cdHPh4g4gJBRHlBy1tbYwZOw5SqRTHjx4tkcdoM3sW7P86hJq1aubp88+fP8fRw4dxyP4g\
-Hj9+nGmeRCKBm4srrjs6Ii0tjQWKiAkFkeqyHDoEAoEAri6uJfL4evTsmefP7tqxE2Z9+sLugB2O\
-HTmCgWbmWL1yFQAgJDgEbVv9gmVLlmDenDkYMmgQZFIZCxQR2IaCSCVVqFABDRo2hL+fH969e4eq\
-VavmeV1xsbFwc3NDZEQEatWqje49ekCk9v3dfT9//hz3fX0hlcrQvMXPaNasWYHHJTAgENu2bMGY\
-ceMy2vXs2LYd27ZsQU9TUwQHv0alypVx8cpl3L51C5MnTERw8GvUrVePhYpYQ8EQUCcTE3Tt3o2B\
-UDHt2rcDADx88CDP60hISIBZ335Ys2o1nJ2cMGP6NIwfO1aptQIF6e6dO5DL5Zg4eVLGtAmTJkIg\
-EOCOjw8GW1ri+g1niMVi+Pv5QSwWo1LlyixMRKyhIABY+scfDIIK+vz6alRkZJ7Xcf/vv/Hu3Ttc\
-uHwJjZs0wfFjx3D18hUkJCSgTJkySqkVKEixsR8AfOpx9DNNTU1oamoiLi42Y9rF8xewa8dOzJ0/\
-Hzo6OixMRKyhIFJdn/ugiIqKyvM6GjVqhNKlS2PksOGYYT0NWppaOHDQPtfJRG5qBQpS9eo1AAAv\
-AgORlpaGG87OeP36NSQSCapVq56RTMydPRtW1lPx+8QJLEhErKEgUm1aWp9epTx57AQO7Nuf56Tk\
-7HkHHLS3x013D1y9cgV2+/fj9LlzuX5VM7e1Avv37sP+vfvyNSbde/aAwToDLLK1xaQpU/DnqtWI\
-j4+Hjo4OevXpjcCAQCyYNw9NmjaFsXF9XL/miDa/ts2070RMKIhIpXz+Ih8zfuxXh7Bev3Yt9u3Z\
-m2Ptwv2//8aKVasgFApx8cIFzJ5pA1/fe+hkYvLdtQJ169XDTQ8P1KlbN1OtwOdai/m2tt9cX92a\
-tfIcEx0dHdgdOojFtgsxfao1AKBSpUqIjY2Fw7lziImORnp6Oh4/egRrKysAwNnzDvipeXMWKGJC\
-wRAQqWhC8SH235qBsnleR0REBDZv3ISkpCT06t0bDx88zKi5UFatwKOHDws0Lg0aNsS5ixeQkpIC\
-uUwO7VLacLx6DYlJiZg8ZQoWL13KwkPEhIKIPnv+/PmnGoIaNfK8jv5mZnhw/wEO7NuPvbv3oFSp\
-Upg9dw4aNGigtFqB2rVrF0p8NDU1M/7dq09vFhgiJhRElB0fb2+I1ERo9UurPK9DIBBg+coVWLRk\
-MeLi4lChQgUIBAKl1goQUfHAtzwItvPmY8TQYQyECnn54gVC375F48ZNULp06R9en4aGBgwMDPKU\
-TPy3VuBzY85efXpjsKWlyp2bxEQmUcSEgoqpe/fu4u6dOwyECrE/YAcAMDM3L5HHt8jWFpEREcVq\
-nxUKBRzOnUOPrt1QtmzZfN+epqYmRCIR1NXVeUEQEwoi+n5hYWG4eOECyuqXxeAhJbMGoKxeWfTp\
-1Rvr165FXFxctsvc8fHBz82aFYkBvp77+2PoYEscPvQX/rdnN3wfPsj3ba5Z+ycOHTkMsVjMi4KY\
-UBDR9/8KXjB3HtLS0jBu/HhoaWmVyOOcM38enF1dIBAI0K1zF2xYtw5JSUkZ8+VyORYvXITEj4nY\
-87/dhbaf8fHxWLl8OcaM+g29eveGw8ULBfYKap26ddH21195URATCiL6fvv37oO3lxeaNG2CCZMm\
-lehj1dfXx9z583Hh8iXEx8ejaycT7N29B2lpabh44QJCQ0Mhl8uxf99ehL59+8PbM2nfIdfLyuVy\
-nD/ngF7deyA1NRVOLjcwZtxYCIW8JVPxxbc8iL5T/Tr1IJVJf2gdIqEQWtraBbrfB+3tsWHdOmhp\
-a2PT1q1QU1ONy9/Q0BCr1qzBb6PHYMf2bejeuQs+fIiFND3905e7TI4/li7DgYP2P7Sd0NDQXC33\
-9MlTLF+2DOrq6rA//Bfq16/Pi4qYUBCpIqlMiqCQ4B9aR+sWLZGamlog+ytJTsbGDRvw18FDKFWq\
-FA4ctC+0vh0Kk5GxEXbs2oU5NrNw8cL5jOmpqam4//ffuOnhkevePfMiLjYWO7Zvh9P165g9Zy7M\
-B1j88FsxREUJ69eISiiJRIILDufRq6cp/jp4CPr6+vjr6BG0+uUXlY1JWFgYrly5AoUi8/SkpCQs\
-WbQoX5I8mVSKQ/YH0b1rVwDA9Rs3YDFwAJMJYg0FESnhS0Ymg1QqhePVa0pbZ2pqKl6+eAE1dTW8\
-fv0at2/eyujTwMzCHIuXLEVZ/bIqHXfbufMhl8myTJfL5YiJisba1X9i2Yo/lLa9e3fvYvmyZdDX\
-L4fjJ0+inpERCz8xoSAi5fmYmAiZVIppU6fm2zZKlSqFwZaWsBw6BM1//lllYmtoaJjjPP/nfpDL\
-5dnOS0tPx/FjRxHzPhrzbW2/up5viYqMxPp163DX5w5mzZkDi4EDilyc/P38EBYWhm7du/OCJCYU\
-RMXVhIkT8OplEGrXraO0dSYlJSEk+A36mfVD3bp1YWRsXGJfC/0aD8/bOc7zffDgmzE8evgIzPv1\
-h2kvU9jMno1y5crlettSqRRHDx/B7l27MMhyMJxcXHI9jHtBW7ZkKR4/eoQn/n6Zxi0hYkJBVIzM\
-mTePQSiCSpUqhUlTJsNigAV2bt8Bk/Yd8PS5f64/36t7D9SpWxfnLpyHYbVqRfpY09LSIJfLIZVK\
-eeKJCQURUX4wqFgRK1avwvFjx77rc0v+WIaOnTopdV+eP3+O+76+kEplaN7iZzRr1izT/MiICDg7\
-OWPo8GHsRpsKFd/yICJSEmUnE7t27IRZn76wO2CHY0eOYKCZOVavXJUxXyKRYOb06Vi+bBkkEglP\
-ADGhICKizAIDArFtyxaMGTcO7rdu4oa7G2bY2OCgnR3+9v0b4eHh6GrSGW9C3jBYxISCiKgo8r3n\
-ixnW0wAAy5ctK5SRS+/euQO5XI6Jk/+/i/QJkyZCIBDgjo8PZDIZli5bhvm2tjxhxISCiKiouXL5\
-MkYMHQrHa5/6CDl5/CR6du+Bd+/eFeh+xMZ+AADo6ellTNPU1ISmpibi4mJhaGgI0969eMKICQUR\
-UVG0ZtVqyOXyjP4q0tPTkCKRYN+evQW6H9Wr1wAAvAgMRFpaGm44O+P169eQSCSoVq06TxQVOXzL\
-g4joXzKZDO9jYrJMl0qlOHbkCI4dOVJg+9K9Zw8YrDPAIltbTJoyBX+uWo34+Hjo6OigV5/ePFlU\
-5LCGgojoXyKRCC1btYK6eubfWurq6liybBmCQoJz/E/ZdHR0YHfoIIQCIaZPtUZ4eDjKlCkDmUwG\
-h3PneLKoyGENBcHQ0BAyqYyBIAKwYfMmjBk5CsHBwVD8O4pYz16mGPnbqALflwYNG+LcxQtISUmB\
-XCaHdiltOF69hsSkxIxlzCzMYWZhzhNHTCio8NkdOpTj+AZEqqZKlSpwdHbC/fv3MXzIUDg6OxX6\
-oF5fdo3Nxx3EhIKKbiFQYzGg7xcVFQUPN3cAgEAAaGiIYWRshAYNGxb7YxOpqeGX1q0BgCOEEjGh\
-IKLvFRoaihtOTvjnn3/QsFEj9OnTN8dlg1+/xsIFC2BQsSI0NTWRkJCA+Lg4bNi0CeYDLBhMIhXD\
-RplEJUx8fDw2rluPQRYDMHH877h65UquPud0/ToGmpkjNDQUtWrVxq2bN9G/Tx/Exyd89XNbtm2F\
-200P3PX1Re3atXHhvIPKxv7MqVOQydgeiVQTayiISpDExET0790H0dHRSEtLAwDcunkTLwIDYTN7\
-do6fi4qMxLLFS/DXsaOoX78+AOC3MaNx7MgRHNi3/6vbfPb0KdLTpXgfE4PIyEiV7mzpvMN52B2w\
-w9x589C1e7dsl7nu6IjNGzfB2dWFBZZYQ0FERdO5M2czJRPApz4U/rdrFyTJyTl+7ubNmzDp3Dkj\
-mfhs+MiR3xx0ase27Rj722+YN2cOps+cgSlTp6ps/I+fOokly5Zh65YtGGQxAL737mWan5qaisUL\
-bBH27h0+fvzIAkusoSBS6YtGpIa6NWsVq31WyBVo0qARIMh+vkAgwKQpU7KdXrpMGcRk09nTZ3sP\
-7Ieunh6GDBwEz9ueGD12rEqXj3bt2+HilctwcryOubPnoEaN6li4eAmM6xvj0MGD+Jj4EYAAO7dv\
-h+2iRbygiAkFlRwH7e0RFRnJQYZyKeDVyyK7b563PTF+9GjIvngNWCgQwqBSRdz29oJAkH1G4eHu\
-jl07dkKhUGRaJiYmJlcDY9WvXx+Lly2F7bz5sNt/INOAVqpIKBSiV5/e6NajO44dOYpRw4ejS7eu\
-uHLxEmSyT+fm6OEjmDJ1aqaxOoiKdblnCOjY4W8/J6fioX2H9pg6bRoEQgGEAgGEQiHKlS+HPfv2\
-5phMAEDHTp0gEgmxZtXqjMclUZGRmGY1FY2bNMnVtgdbWsKkc2ds37oVoW/f8mTgUw+bY8aNxQ13\
-Nzx98gQpqakZ89LS0rBm1epC2zeR6NPtXyTk1wAxoSAlUUCR0SMgFX/TbWbipqcnGjVpgukzZ8D9\
-9q1vJgVCoRC79+5DdFQUWjX/Gd1MOqNnt+7oZNIJzX5qlu1nWrdpg6CQYLRu0yZj2oGD9ngW8ByG\
-1arxRHwhPDwcLwJfZL7uFApcunjhq4+T8tNU62lYsHAhtLS1eYJIKfjIg6gEqlKlCgwqGqBBg4aZ\
-eln8mrL6ZbF1x3ZIJBJERkSiWvVqEIlEWL92LQP6A+RyOWZMtc42aZemSzF65G+4fO0KhAVcU5DT\
-WyhErKEgIqXQ0tJCzVo1IRKJVD4R+FyTkBuGhobZTo+Pi0d4eHiOn3v1KggDzc3h4+3NwkfFGmso\
-iIiyIZFIoKGhAfN+/TF9xgx06db1q+1QPDxvZzu9rH5ZPPH3y/FzCoUC1685YvHChTA0NMSChQtL\
-RPflpHpYQ0FElI1SpUrBLzAA02ZMx/Zt29C9Szc4nFN+L6ACgQC9+vTG9Rs30KVrN4wcNhxzbGbx\
-BFCxwxoKIqKvfNlraGhAW1sL0VFRSIiPy7dtqaurY/TYMVBAAf9nfgw+MaEgopIl9d9XHT1veyL2\
-Q2yBb9/fzy/TfhQEuVwODzd37NqxAympKfh9wkT0N+sPUQGMzCsWiyEWi1nwiAkFEZUsLwIDAQAn\
-jh0rEvuR34mEk+N1bN2yBWKxGFOsrGDau9dX204UV/Hx8UhKSkKVKlVYyIkJBRHlv5Wr1mD7tq0w\
-MjKCoBA6QVLI5Xj5MgjTpk/P923ZTJ8ONzd3jB4zBjazbAqkRqKwzLC2xv37D/Dg8SOoq6uzoBMT\
-CiLKXzVr18TmbVtV4li37dyJv33/xr49u9HVpDPGjBuHocOH5bovj+IkNjYOkuRkpKamMqEgpeBb\
-HkREX2jZqiX22dnhf3v34P79v2HSvgO2b93K0UGJmFAQEX2/ho0aYceuXTh09AheBb1C+7ZtsXnj\
-RgaGiAkFEdH3kcvlCPB/jidPnqBhw0b4pXUbBoUoB2xDQUSUDS9PL6xdswaampr4c91atGnblkEh\
-YkJBRJT7RGLThvVITU2F9bTp6NWnN4NCxISCiCj3Zk6bBjdXd0yaMhlW1lNLZP8TRPmFbSiIiP61\
-dv16LF66GOfPncPwIUNx6+ZNBoWICQUR0ffR1NKC5dChcHZzxYSJE7Fl0yb069Ub5885QCaTMUBE\
-TCjoa0qV0kGpUqUYCKLPN0ahEF26dYXDxYuwmT0bx44eRecOHXH86FEGhygHbENB2LX7f0hKTmYg\
-iP5DIBCgjK4u1NXVIBAKocYeJYmYUFDOqlWvziAQ/UdgQCB27tiOJ48eY8rUqRg8xBIikYiBIWJC\
-QUT0ba9evcLuXbvgddsTY8aNw6YtW6ChocHAEDGhICLKncULF+GCgwNGjx0D99u3SuSgYERMKIiI\
-8tlkqynQ09PD2dOn8frVa0yeaoVmzZoxMES5wLc8iIj+ZWhoiDnz5sLD8zY6dOoIywEDGRQiJhRE\
-RHmjqamJ4SNGsO+JbEgkEri5uOK6oyPS0tIYEMrARx4lXNDLl/jnn7eZpv3U/Cfo6+tn/O15+zZi\
-Y2PRr39/BoyIchQSHALzfv1QunRpxCfEo06dOjjrcB4iNb79QkwoSryTJ07gkP3BTNOOnTyB1m3+\
-fxjmlctX4E1ICBMKIvoqX997qFS5Mi5euYzbt25h8oSJCA5+jbr16jE4xISipFu4eDFsFy4CACxe\
-tAgfExIyJRMAIJWmQyqVMlhEKqRP376oUbPGd/WSO9jSEoMtLQEA/n5+EIvFqFS5MoNJTChUgVAo\
-BITAi8AXuHL5MtxvcbAjIgImTp6U589ePH8Bu3bsxNz586Gjo8Ng0qfvG4ZANaxZtQo9TXuifPny\
-DAYR/VAyMXf2bFhZT8XvEycwIMSEQpWEhYXB8/ZtDBk6jMEgojwLDAjEgnnz0KRpUxgb18f1a46I\
-i4tjYEi1Ewq5XI5nT58iRZKCoJcvS/Sxenl6QigUotlP7KCHqChLTU1F0MsghL17h/j4+CK3f2dO\
-n0J6ejoeP3oEaysrWFtZISQ4uND2JyQ4BNevOcL3ni/bgRUBKtmGIjo6GmNGjUJgYCAEEMC0ew/0\
-6dsXm7dugUit5IXkXWgoqlStyvEIiIqw0LdvMXLYcISFhQEATNp3wD67A2j1yy9FZh8XL12KxUuX\
-Fvp+KBQKLF64CKdPnoS6ujrS09NRvUYNHPzrEKrXqMHCxBqKgmM7bz6CX78GFJ8KJgA4OznB3s6+\
-RB7vzFmz4HH7Fks7URG2ZPFiREZGQC6XQy6XIzExEdOnWkMulzM4/+Fw7hzOnTkDhUKBtLQ0KBQK\
-hIW+w8zp0xkc1lAULB9vb6SlpWealp6ejuNHj6jkxRsf96lqde/uPQW+7b/v3cPHxKRC2faXgl+/\
-wtoNG3hHoELz9z1fpKdLM/0Kj46ORujbt/zV/R+3PG5m6cU0XZqOp0+eQpKcDC1tbQaJCUXBqGBg\
-gHehoRm1EwAgFAihVUoHCQnxKhcPBT7FoTCOPSUtFWlpKYUed4dz57D6zz9L5CMvyjtDQ0OYtO+A\
-0NDQQtuHLp1MeCJyey9TKNCkYaP8/+IUqSHg1UsGnAkFsGChLaZNnQqhQAi5XA51dXWoiUT43+7d\
-qFmrpsrF47qjI+Lj4jF3/vwC37b9gQOIiIgslG1/6cD+/bwbUBYenrcLbFsXHM5j3pw5GbWkGhoa\
-GDZiBJYsy582C2Z9+8Hv2TM8eva02PUlERUZid49TZGUlIT09HQIhEJAocCqNWswZNjQfN9+3Zq1\
-eHFkQyXbUJj26oUTp06jk4kJ1NU1MGjwYDjecFbJZIKIigbzARbYvXcvOpp0QqtfWmHRksVYtGQx\
-A5MNg4oVcc3ZCcNGDAcAdO/RHQcP/1UgyQSxhiKLlq1aoqrhKlgOGIiVa1azJBBRoevavRu6du/G\
-QOQmqTAwwNI//sDhQ3/hf3v2MCBFADu2IiIiIiYURERExISCiIiImFAQERERMaGLGTttAAAgAElE\
-QVQgIiIiJhRERKSq/J49YxCYUFBRoiZSg0hNxEAQUbGhUCiweeMm6JfTh2n3Hrh182aWZUzad/jq\
-36Tk7xKGgBYvW4rY2FgGgoiKDYFAALtDBwEAnrdvw3befKxYvQqdu3TJWOa/XaYXZhfqTChIJXTo\
-2JFBIKJiq32HDti1Zw8mjh+P2z7eUFdXZ1AKAR95EBFRsde0WVOUL18eQS85aBcTCiIioh+QmpoK\
-DQ0NBoIJBRERUd7ccHaGmro6atepw2AUErahICKiYksmleLsmbPYvHEj9tvbQyAQMChMKIiISFXF\
-x8fDx8sbLX9phfLly387kZDJ0PKn5pCkSFC9eg0cPXEc9YyMGMhCxEcehNC3bxEYEMhAEFGh+efN\
-P7C2soK/n1+ulheJRNj+v11Y/eefqF69OmZOn464uDgGkglF4YmOilb5QjB1ihWGDBrEq4GIipUO\
-HTpg4KBBOHDQHl26dsMcm1kMSiFS+UceUplU5QtBYuJHJCYmFutjCAgIwNDBlihfvjx0dHS++/My\
-mQwDzS2AEvT89Z9/3uBl4Evs2L49159JTkpCVHQU9uzdiza//so7ZAlmZGyEhIQEaGlplYjjmTnL\
-Bu3btEVYWBiqVKnCE8yEgihvnjx+jMSPH5H48WOe1/GsBI4LkBCfkKfP+fr+zYSihNuwaVOJOh6R\
-SIQqVaogOjqaCQUTCqK8MzAwAACMHjsGS5YtY0DyaPvWbdi+dSuqVavGYFCxEh0djeDgYNSuXZvB\
-YEJBRESqLuB5AMRiccbfrdu0+eZnEhISMHfWLIyfMAGlS5dmEJlQEBGRqlu/dm2mv4NCgnNcds3q\
-1Yj98AE+Xt7o1acPJk+ZzAAyoSAiIlXWpGmTryYP/yWXy+Ht6YWEhHikpqaiTp06EKnxK40JRSGR\
-SqUQCoVITEzM05sBVHyFh4fj9s1b6N6jB8rql2VAiIoZoVCIK47XAACvgoJgbTUVQqEQlkOHMDiF\
-dU5U+eArV66MQZaD0c2kM/46eAjp6eksESriuf9zLFywAKGhoQwGUTFXp25d7N2/D+vXroVEImFA\
-mFAUPDU1NaxZuxZHjh+Dq4sLWrdsBd+7d7MsFxUVhdMnT+H0yVM4c+oULp6/gOf+/iw9RFRs7duz\
-FzOsp0GhUOR5HQqFAikpKUhKSsq0HoVCAblc/l3rVigUkEqlmT4jl8tz/fnqNWrAsFo1BL0M4skt\
-rO9UVQ9AVFQUTp08CX9/f5iYmKB27bpZlgl+/RoLFyyAQcWK0NTUREJCAuLj4rBh0yaYD7BgKSKi\
-YufqlSvwe/YMq9f++UOPfMVicbYDcgkEgu8aqEsul0Mmk0EgEEAkEmUkGQqFIlfrUSgUiP3wAWXK\
-lOHJZQ1Fwfrw4QM2rFuHPqamUCgUuOZ0HZu3bUW5CuVy/MyWbVvhdtMDd319Ubt2bVw478ASVAId\
-tLfH2N9GMxBEXyGTyTISh/9+sX9OJhQKRa4fJQuFQojF4oxkAgBSUlJyXctx6sRJVKpcGTVq1uDJ\
-YQ1FwQgJCYHdvn1wdLyOAQMHwtHZOVcj2wHAs6dPkZ4uxfuYGERGRsK0d6+MeR8/foS2ljZEaqIs\
-F51EImGjzyIqLCwMaWmpiI2NhVwuR4+ePTPdzJyuX8cvrVujcuXKDBbRfxIAuVyeKQH4nGB8mVSo\
-q6tnW5vwORH5ctn/KlWq1Df34/379zhkfxDnzp7FsZMneGKYUBSckydO4LyDA8aMG4ep06Z9Vz/2\
-O7ZtR1JSEoRCIebbLsDwkSMRFRWF8WPGIvj1aygUCsxbsACjx47JWH7v7t1Il6ajRYuW2Gd3gIlF\
-EfPowUOcOH4MZubmcHV1QfDrYGiINaBQyD8NNCQA+vbrx0ARZSOnRxHfekTx5XxBHsfPkclkaGxc\
-H3KFAvXqGeHE6VOoUYO1E4WaZKraAS+wtcUNd3fExcWhc4eOOGR/EDJp7gYI23tgPy47XoOmpiY8\
-b3tCXV0dN5ycIJfL8OjZU2zdsR1eXp4AAC9PL9jt349jp07i3v37UCgU8PL0ZIkrgmrUrInlq1Zi\
-zNhxcHdzBQD4ePvguqMjplpbZ/kFRkSfXrvP7nFHQRGJRPC+dxfnLpxHi1YtMXLoMISFhfHEMKEo\
-WJUrV8aqNWtw4KA9XF1c0LunKRyvXsvVZ+vXr4/Fy5bi1s2bsNt/AG3atkXYuzB07tAR3l5eWLBw\
-IQDA28sTrdu2QbNmzaCrq4sTp0+hp6kpS1wR0aVrFwSFBKNK1SqIjIhAWloaoqKiULr0pwZd1atX\
-x4RJE7F+7ToGi+gHayxy43MDzO9RVl8fjZs0wfKVKzBpymRMs5rKk8CEonA0btIER44fw8Ili7F9\
-21Z0NekM/1y8DjrY0hImnTtj+9atEIvFcHJ1gc2c2QgJDsFgiwFITU3N8spUXGwsS1sRpaGhgZ7d\
-uuPMqVOYNGUKAMCwWjVMnzkTgYGB8HB3Z5CI/iO7thF5TSQ+vx7634REmsvaYwAYMWoUoqOiEBIc\
-wpNTSFT+tdGUlBS8fv0a8fEJqFSpEjQ1NbMs07pNmyxdwh44aA8A2PO//8HN1Q2HDh9GrVq1MHjA\
-QMTHx+PXdu1w/OgxPHzwANWqV8eA/mawmT0bFgMHsNQVMXXq1sV+e7tPF4SaGlq2aomx48YBALzv\
-3mGAiL5RI5HbVztzWkdOn1X7jq60BQIB9MuVw8ePH3limFAUrLS0NDicPYcd27ejUaOG2HdgPxo3\
-afLd6xk+ciQuX7qEn5s1g0gkwqQpk2FgYAADAwOMnzABo4aPgEgkQtdu3WBmYc4SV8TUql0LrZPb\
-fNeNi4iyTyxyWyPxI49GchISHILQ0FDUM6rHE8KEomAkJyXhxIkTsNu3Hz81b44DB+3RoEGDPK+v\
-TJkyuHr9OuLj46Gjo5OpAd/0mTMwdZo15HK50qoH8+VmAEG+XODFQfsOHdC+QwfeCYiKYPKRW6Gh\
-oZgxbRpmz52TbS0zMaHIF2tWr8bF8xdgZW2NSVMmQyhUTjMSXV3dbKeLRKIi/5bAiFEjERERyauB\
-iIoNhUKBvXv2IPB5ALy9vGBlbY2hw4ZlWsbQ0PCrfxMTih+yas0aDLa0xNo1f+LSxYuYO38+unTt\
-otKFYOz48bwSiKjY0RRr4vKlS7jzt2+2HRR6eN7+6t+kXCr5lkezn37CidOnsHjpUmxcvw6jR46E\
-v5/fVz+TkpKCkOBgREZEZDtfKpUiIjwcYWFhGV3SfiksLAwxMTEscURESiAQCDBm3FgAyHVvx5S/\
-VLolWrv27XDp6lWcOnkSv48dh7pG9fDnunWoWrVqpuXkcjk+fvwIg4oVoaGhAblcnuVRiUgkQsVK\
-lXLc1te6bv7vu9eq2p6B8sfz589x785dCAQCdDIx4VgHRMQaivwgEolQsWJF6Jcrh1dBrxAVFZVl\
-mbS0NJQtWxba2tpQU1PLtt3F51efcnoF6muvRn3rs0R5Zbd/P8z69MWJ48exdfNm9OrRAz7e3gwM\
-ETGhUCYvTy8MMDPD1k2bMdXaGp4+3mjevHmW5bJ7hEFU1L0JeYMN69ZjspUVrt9who/vPdQzMoLL\
-jRsMDhEpnUo+8vDy9MLG9euQnpaOqdOmwbR3r6/WDBRk//REynL3zh1IpVIMHf6p5btYLMbFK5cZ\
-GCJiQqEMc2xmw9npOqynT8OESZNy9YhBWa+WFlUyqRQyuRwaGhq8IkqQDx/eAwBKly6dZV6/Xr3x\
-/PnzjL+1tLXx1N+PQSMiJhS5tX7TBnTo1AFbNm7Co4ePMGf+PNSuXfvrQSrhvSiOHzsWISFv4HH7\
-Fq+IEqR69U+NL1+/fo1mzZoBAPbt2YsKFSrgsuM1pKamopFxfVy+dhUNGjbMnHjPmoU5s2YxiJ/v\
-ASI1BLx6yUAUooN2dtmOq6OpKcbokSOzTNfQEGP3vr3sBZcJRf4RCoUwMzdHr969sX/vXvTp0RPP\
-g75+o9DQ0IBMJsu3LmML29u3bxH69i2vhhKmc5fOqFS5ElYs+wOLly7B8+fPsXH9egweYvnNMWU2\
-bt4M8wEWDOK/6tasVeKOqWxZPWhpa0MsFheL/e1hagoj4/q5Xl5HpxSTCSYUBUNDQwMDBg3Clk2b\
-c7V8Ue/tkpTj2dOnePTwIWQyOVq2aolGjRt/9zqioqLg4eaOXn16QyKRZPvv7B5DAJ9eUU5NTYWW\
-ltYPH4uWtjb229tj3uw5GDxgIAQCAbp264aFixfzRBO27dyJpKSkIj0swJeqVq2a5ZV+YkJBVCTt\
-2LYd27ZsQbXq1aGhro5VK1Zg4uRJmDt//net5+0//2D9unVo3aYNIiLCsXDBArRo1RIx0dEZ/84u\
-oXj//j3GjPoNy5YvR8tWLZVyTA0aNMDla1fx8eNHqKmpKSVRoZJBV1c3xyEDijKFQoGEhIScE2kt\
-LbYHY0JBVHgCAgKwfetWjPv9dyxcvAgAsGf3bmxctx5dunZFi5Yt8bfv33j29ClKlymN7j16oEyZ\
-MoiLjYWrqyvEYjHatWuPsvplUaNmTSxZuhTlypdDRER4jtv09/OD7z1f6Orq4tf27eDkeB3P/f3h\
-efsW6tarCz09PSQlJcHH2xvR0dFo164dqteogYjwCNy9cwfGDerD79kz9Dcz++avzJxqRIiKm7On\
-T2Ptmj9znG9cvz6OnzrJQDGhICocDx88gEKhwMTJkzKmjR03DpvWb4CXpxciIiKwcP4CmJmb4969\
-ezh/zgE7du1CH1NTiDU1oaOjg3Vr/oSTiwteBQVhto0NnFxdctzeq1evMMhiADp06oigly+xacMG\
-GBkbAwCuO15HPzMziEQijBg6DO9CQ2FQsSJWLV+BvQcOQCJJxmwbG1SpUgWly5SGxYABeTpmsViM\
-oJBgnnwqVgYPGYLBQ4YwEEwoiIqmqMhPo63q6ell+sLV1NTEhw8foPGPOuRyOTS1tDDTxgZtfm2L\
-8w4OiI6Oxr379yEWi3H50iUkS5Jztb0qlSvjjMM5CEUinDh6DMePHcPaDRtw08MDq9asQZ06dXDy\
-+An4+/nBw/M2DA0NYTlwELZs3IjJU60AACvXrEYnExOePCJiQkFUVHx+xdLv2TM0++knAJ9et5RI\
-JKhRswaGDhuG2Ng4ODk6wv7AAdStVw9dunaBrp4eyuqXBQAMshwMkUiEV0FB39xecHAwJk+YiGrV\
-q6N8hU8DG/23A7V3796hVKlSqFKlCgCgnlE93PTwyJhfz8iIJ45U1qtXr3DQzi7j76ZNm8FyKGsu\
-CpPKj+WhJmJORUD3nj1gYGCA+XPnwdvLC773fDHHxgZlypRBfzMzuLq4ICE+Hjfc3bB+00YEvXwJ\
-dXV1xMXG4rqjI+7euYOmDRvh0cOHudre5UuXIJPJcOT4MRgZGWeaFxMdjdTUVLRo2QJJSUk4eeIE\
-nvv7w8PdA61a/ZKxXHFpnU+UH8qVK4emTZuhceMmaNy4CYzrGzMorKEoXBUMKrAUEHR0dGB36CAW\
-2dpi9MhRAABjY2PY/3UI5cqVQ8uWrWB/4AB+btoMqampGDxkCKbPnImI8AhMs5oKbW1tWA4dgp+a\
-N8fdO3e+ub0+ffvi0sVLaN60Kdr++uu/UxUwqFgR1lZWOHH6FEw6d8b0mTOx/s+1SExMROs2bbB4\
-2VI8uH+fJ4x+mJuLK4KDX2P8hAnFcv/19PRYI8GEgqhoatCwIRwuXoQkORlyhQKlSpXKmFepciU4\
-XLyIpKQkCAUCaGlrAwDWbdyAP1Ysh5q6ekaNQes2bTIaO9apUyfbfwPAbW8vSCSSTNu57eWFZEly\
-xlsZ02fOwNRp1khO/v9p3Xv0YGNK+mE7d2zHk8dPMHzEiIzyTMSEgkiJvnZz/fLLPzfLf41QKMyy\
-PpGaKMsrniKRiK99ktLJZPJP/5fLGQxSCiFDQERERD+KNRSq8EtEKoOn523I5XK079CBjfmIiIgJ\
-BX0fhUKBcWNG49HDR9ApXRrVq1fDidOnS9xxvn//aajuE8eP44LDeZ74PEpNTQUARIRHMBiUSVRk\
-JHx8fFCuXHm079CeASEmFKrG8/ZteHl64ZqTEzQ1xbh44SISExOho6NToo6zVu3aEKmpQU3IIv0j\
-RCIRhCIR6tSty2BQhrCwMPTv0xe6umUQER6BQYMHY/mqlQwMMaFQJf5+/tDQ0MCpkyfwKigIY8aN\
-K3HJBAD8/PPPCPzGMPRElDcR4eHo3KUz1q5bj3Vr1+LKpUtMKCgLNsos4eLj45CWlgahQIh69Yxg\
-NWkywsLCGBgiyn3C3qIFNmzahHNnz+LShQv4bcxoBoUKJqE4f84B3l5emaa5ubrhhrMzI17Aypf/\
-1K3zhEkTMXmqFdLS0vDk0WMGhoi+W0JCAnRK6+Dt27cMBhVMQuF47Spmz7SB/N/3myUSCWZYW+Pe\
-3Xs/tN6Q4BC8CgrKMuYB5ax1mzYAgIsXLsLz9m0AQLXq1RgYIso1hUKBhIQE/D5xAtasXYtTJ07i\
-ub8/A0OZ5EsbCjMLC7i5uuHe3bto07Ytbrp7QCKRwNzCPE/r8713D3NnzYZAKIRIKISGWANbtm3/\
-ob7b5XI5Hj96BEmyBIEBgSW2H/hGjRvDevo0bNywHgr5p+G5GzVunGmZVq1+QcWKlXg1EFG29u3Z\
-i53bt+P4qVO46eEBoVBYIttiURFMKLp17w4dHR1cuXwZbdq2xbVrV1GnTp0sX2S58fLFC0yzmoqt\
-O7ajTdu2AICrV65gzKhRuOp0Hfr6+t+9zri4OIwfMwZPHz+BHEDfXr0wYNBArF2/HgKBoMSd5Jmz\
-ZmGylRUUcnm2vTqu3bD+q58/f84BFStVxK/t2mVMc3N1g0wmRfcePXgVEZVwv43+DV6enrDo3x8a\
-GhpYtGQJqlWvzsBQJvnyyEMsFqOnqSmuO15HYmIi3N3cYfZv7cSRvw5joLkFzp09i0bG9fHPmzef\
-CuyIkTh98lSWdW3bshXTZs7ISCaATwMrWQwcgP179+Zp/1YvXwF/P3/IFQpAoYBCocDF8xdw5tTp\
-EnuiNTU189xFdH49wiKi4kFLWxuHjx3F/ceP8NjvGUaPHcOgUMHUUACAmYU5zp09i9UrV0GSnIz+\
-ZmZZlklNTcWyJUtx8PBfOa7n8aNHWLR0SZbpnbt0wcTfJ2D/3n1K2V+pVIqFCxZg4YIFKlkQDA0N\
-4eF5O4dzqdxHWERUPOnq6jIIVPAJRZu2bVGxUiWcOXUKLVq2hGG1rA0Bjesb49mzp7h25WqO6xGJ\
-RJDJZFmmy+VyNGrUCEdPHP/ufWvepCk+fvyYZXonExPYHTrIUvEfuXmEJZPJIJFIsjxXzWk6UbG6\
-UYrUULdmrRJ5bD81blKijke/rD6cXF1QVr8sC25JSSiEQiH6m/XH/r370N/cLIdsVw/jfv8dq1as\
-QKXK2TcK/Kl5c7i5uGZ579nVxRXNfmqWp33rYdoTly9dQlpq2v8HQk0Nffr1ZYnIxpePsBYsXAh3\
-N3dMsZqSMX/Htu3Yu3s30qXpaNGiJfbZHYCOjk6O04mKm4BXJa/TNLO+/eD37BkePXtaoq7LwQMG\
-IiQkmAlFIcjXjq3m29oiKCQYI0aOzHGZgYMGoWatWnjy+Em282fMssGuHTtw6+bNjGkO587hyqVL\
-mDBxYp72a9GSJWjSpCkEQgEEgk//WQ4dAosBA1gicrr5WJgjLjY2yyMsL08v2O3fj2OnTuLe/ftQ\
-KBTw8vTMcToREbGGIt+sXL0KfXv1znZerVq1sGf/PsyZNQsAkJ6WDv1y5XDkxHHolc1bBlqmTBmc\
-PHMabq6umD93Ls44OKBWrVosDV+R0yMsby9PtG7bBs2afaotOnH6U8PaDevWZTudiIiYUCjFqNG/\
-YdTo3zJqJwCgTt26eP7yRY6faf7zz7jh5obg4GCoq6mheo0aP7wfAoEADRs1gpamlsonEyuXL8e7\
-0HfYsz/nBq45PcKSy+WZOhqLi42FXtmyOU4nIqKSqdiM5SEUClGnTh2lJBOUmYe7O1xu3Pjmctk9\
-wvq1XTvc9bmDhw8eICYmBv379MX5cw45TieiokFDQwNCoRBqahwj8ns8eviQQSgqNRRUsnTo2BHj\
-J0zAqOEjIBKJ0LVbN5hZmEMoFGY7neh7Pffzw4hhw1GufDmUKsVGvd/y4cMHpKWnwc3DA9pf6Xtm\
-+coVCAsLg6amJoP2PfF9/4FByEtC8faff5CWng5NsSZEaiJUqFABIpEIAJCWlgY1NTUIhf9fyfG5\
-iltZvU1+a31fm5/dPIlEgri4OFSuXJlnXommz5yBqdOsIZfLoa6u/s3pRN/j7t17SEhIQEJCAoPx\
-HULfvoWRcc5DCjRs1AgNGzVioJRk7+498PbyRHR0NMwtLDBx8mQmFF+qVLkyhEJhxpsQX345a2ho\
-ZFle2d1Wf2t9X5uf3Tw1NTUIS2DX2kWBSCTKSDZzM50ot6pUrQIA+G3MaMywsWFAvsF6ihV8vL1Z\
-81DA+vbvh8ZNmuDE8eMZvQozofjPl8GXNRAlQekyZVjyiYohsVjMnhpzc1Nnm4h8lZ6enu30qlWr\
-omrVqrjp4ZHtD26VTig+Z1gKhaJEDJj1+RGIdh7HsyAiopIvJSUFPzVqDGk2PTR/KbueU0UiEeRy\
-+Vf7XlLJhOKzkjT6poCPO4iI6CvkMjk0NMUI8PPLMu/Vq1fo16s30tLSMGbcWCxeupQB+0KOzzOE\
-QmGJe9zBZ/lERPT1X55AakoqzPv1x+ABAyFJTs6YtWj+AqSnSwEAp46fwOvXrxmvL2SpoYiJiYG+\
-vj7kcnmJSypYQ0FEXxMZEQFnJ2cMHT4sy5tJEokEPl7eSEtPQ5euXTOek/s9e4bIyKiM5dq1bwex\
-WJzx9/lzDqhYqSJ+bdcuY5qbqxtkMim69+hRaMf66tUrREVGou2vv/LEf0FbWxtHjh+DtrY21NU1\
-oPXvY3JnJyf4P38OheJTc4C09DQsmDsXp8+d+6HtlZRmBdkmFImJidDT04OamlpGb4cl4WCZTBDR\
-10gkEsycPh2+93xhZmGeKaEICQ6Beb9+KF26NOIT4lGnTh2cdTgPkZoIixcuxNMnTzOW9fTxyTTY\
-oeO1q3j65Cm87t6BUCiERCLBDGtrDB0+vFATioXzF+DRw4d44u+XKQEi4JfWrTP9nZKSgiULFyE5\
-KSljmkwmQ2BAANxcXNGlW9fv3oZMJoNCoShRNedZqh9q1qyZ0Ur48yujREQlWXh4OLqadMabkDfZ\
-zvf1vYdKlSvDxcMdm7duxdMnTxEc/BoyqQwvAl9g09Yt8AsMgF9gQJaRk80sLBAdHY17d+8CAG66\
-e0AikcC8kDt6S0lJgUwmy/GtBfp/u3bsRLIk+b8/U5GUlAzbBQuQmpqap5qJkvYdK2RRISJVJ5PJ\
-sHTZMsy3tc12/mBLS1y/4QyxWAx/v0+/6CtVroygoCCkpqZi57bt6N65C04cO57ls926d4eOjg6u\
-XL4MALh27Srq1KmDRo0bM/DFJNk8aG8HSbIk2/nJSUnYu3v3d6/3y44ht23bltHXU4sWLTBx4kQc\
-PnwYERERTCiIiIoTQ0NDmPbu9c3lLp6/gF07dsJm9mzo6OhALpehb79+WLR0CXr37YNVK1bg2dOn\
-CHr5EqdPnsLpk6cQGRGBnqamuO54HYmJiXB3c2c39MXIogW2kEmlOc6XSCTYt3cv3r1790PbuXDh\
-AhQKBe7du4e1a9eiXLlyaNeuHQICAphQEBGVJBfPX8Dc2bNhZT0Vv0+cAABo0LAhNm/bCpPOnTFu\
-/HgAgN8zP/h4+2DhggVYuGABHj54CDMLc8TFxmL1ylWQJCejv5kZA1oMeHt5wdfXN+PNjpxI02VY\
-tmSJUrYpEomgr6+PPn36YPXq1Vi9ejUTCiKi4iwyIgJH/jqMhIQEBAYEYsG8eWjStCmMjevj+jVH\
-xMXF4fw5BzQ0Msbfvn/D2ckJAFC/YQMMHzkio01FP7P+aNO2LSpWqoQzp06hRcuWMKxWjQEu4mRS\
-KRYtsM302miOCYU0HXfv3MUdHx+l7kObNm1w9OhRfPhQPAYkY0JBRJSNkJAQLF+2DNHR0Thz+hTS\
-09Px+NEjWFtZwdrKCiHBwejdtw86dOyIoYMHY82q1bCZPRvNmjWDSCSCWCyGWCzOeP2+v1l/AEB/\
-c9ZOFAcH7e3x/n1MrpeXJCdj3uw5kEqlStuHz13NJ+ciqSkK2Ok7UT7+wlm5fAVCQ0Nx4KA9A1IM\
-mFmYZ7RvaN2mDYJCggEAi5cuzbFXxP32dkhISICWltZXR9Wdb2ubY6NPKlpiYmKwZdPm7357IyYm\
-Bkf+Ooyx48cpZT/i4+MBFJ8hI5hQEOUDz9ueWLNqJV4EvgAAfIxPQGldDkxXUpXhoIMlSmBAICpX\
-qQJZNuN5pEhSEB0dhWrVq2f7WWU2orxz5w5GjRoFfX19JhQlQXBwMBQKBWrXrs1g0De9fv0aa1ev\
-hpurGwCgdGkdfPyYCAjZnwtRcbmnt2vfDi7ubtnOc3NxxcTff4f7rZv5sn9yuRxxcXHw8fHBokWL\
-cPXq1WITW5VuQyGTyZCa9vUqrZ3btmPb5i0lOg4GBgYwqFiRd5ofEB8fjw3r1qGvaS+4ubqhZs2a\
-2LFrF2pkMyIhEeWfxMTErz6q+NF7uq6ebr7st7m5OQQCAZo3b4558+bh/fv38PLyQv369YtN7NVU\
-veDl1FlJYEAg/vnnDcLDwyGXy3DD2RmG1aqhQYMGJS4O9ocOfXOoXsohKZVKceb0GWzZtAnv379H\
-mTJlMMPGBmPHj4OGhgb27tnDIBEVZHIfF4/379/n2z29RcuWSt/nGTNmYMaMGcU+9iqdUOjq6kJP\
-Ty/beWdOn8Ih+4MZf//t+zeGDR+OlWtWl7g4aBWTBj9FjZenF9asWonAgECI1EQYOnwYbGbPRrly\
-5RicIiIqKgoebu4AAIEA0NAQw8jYCA0aNvzq5/yePYPnbU80bNQQHTp2ZPh1/5QAACAASURBVCCL\
-kaqGVVGlShWVvqczoShiFi5eDNuFizB39mxIZVJs2boNAj4HJ3x6Brt540Y4Xr0GAPi1XTssWrIE\
-xvWNGZyidq5ev8bCBQtgULEiNDU1kZCQgPi4OGzYtAnmAyyy/YxMJsNQyyEwMjKCgYEBg8h7OjGh\
-+DFCoRAQAtqltCGTyiBSEzEoKi4+Ph779uyB/QE7pKeno1atWpg1Zw569enN4BRxW7ZtRes2bSCT\
-ytC7Z09cOO8A8wEWiAiPgLu7G/R09dC9Zw+oqanh0oWLkCQno2mzpmjRsgUAZFkuJjoGd+/cgXGD\
-+vB79gz9zczwPuZ9lnVFR0fD29ML7Tq0h7urK8rq66Nb9+4AgLjYWLi6ukIsFqNdu/Yoq1822219\
-HqyReE9nQlHMrVqzhkFQcZ/bSWzeuBEfPnyArq4uJk6ejHG/j/9qvwNUdDx7+hTp6VK8j4lBZGQk\
-THv3wj9v3sCsbz/UqVsXUZGROHXyJA4dOYwbzs4AAB9vH3Ts1AkAsiw3YtRIzLaxQZUqVVC6TGm0\
-aNESFv37Z1nXi8AXmG1jgyZNm6BcufLwcHfHyjWrYWraC31MTSHW1ISOjg7WrfkTTi4uiImJznaf\
-iPd0JhRExZyXpxdWr1yBF4EvMtpJzJozJ9N74Xy1uOjbsW07kpKSIBQKMd92AYaPHIltW7ZALpdj\
-/aaNCHwegGlTpyIwIBDLV62Es5MTZtrYoHOXLlj3559ZlmvZqhUAYOWa1ehkYpLtMoEBgRnbnzNv\
-Ptq1b4cunUzw7OlTpKSkfBrS/P59iMViXL50CcmSZJw4fjzb9fBxGjGhICqm/tufRLv27bBwcfbt\
-JHZu2w6pVIptO3cwcEXU3gP7oaunhyEDB8HztidGjx2LqKgoyBUK/LHkUw+Yv7Zrh5TUlCyfzXa5\
-lE/L1TMyynmZL9ZVtWpVAEApbW2kp6Xjfcx76OrpZTzmGGQ5GCKRKNf7RFQUcSwPwqkTJ7FzO78M\
-ASAuLg4b1q1Dn56mcHN1Q+3atbHPzg5/HT2aJZkIDAjEDWdnhIeHIzIyAjecnfH8+XMGsYiqX78+\
-Fi9bils3b8Ju/wHUr98A6WlpWLZiOSZNmYJatf6vvfuOiuJ6+wD+3V1gYUFFjQqKgmABFKxRwY4V\
-OyrEbnqM3WDXaGKNHdv7i2JJjCVGBawoSrEbCyYqVrChImBFFli2zPsHQkR2aS5I+X7O8RyZuTt3\
-9tnZu8/M3Lm3JmrXqq3ldVrK1U4rl37LK6dtiUSZO/85ODrg1cuXOBwYiL/PnYOzYz38c/lyrveJ\
-iFcoqEjyXbcODx8+xOixY0ptDFQqFXbnsZ9EXh5Da+TkzAOtCPD08sKRwMNY5eODPQEBuHD+b3Tr\
-3AUymQxff/stZKYyyJPkmV4zeMgQreXyWuZd7t264UT/4xgzchRkMhm8BnyGho0aoU6dunnazged\
-Tb59wkEs4nkl6UeWZ2YEQRBKypsLPnoMq1et0rleqVLibtRd1K2b/f3JocOHoV///lrXxT59iqAj\
-QRgwaCAMDQ2RkJCA42FhKF++PFq1bp1RTtfy7Dx79gwhx4IzLStnXg5dunbVa5w6tGuHB/cfZEyE\
-VJg2bdiAp09jMX3mjI92nJw+dRrz5szBndu3YWBggP5enln6SWij0WggaIQsj6GJxf810H169sK1\
-q1dx+eoVlClThi1OPgQdOYKR343AN999WyCTayXJkyCVSnPs9Z+bcrndVrrkpCQYGBpmSVrzup13\
-fTFsOE6eOIGQ42GoYW2ts9zBAwdw5/ZtjP/hh2zbNCBtXI7Y2LiMMi1btYRCodBbW5fb9i4xMRGf\
-Dx2W7Yye9+5GwcKiKkxkJjrL2NnZYZlP/kfLrGVT86O0l7xC8RG5uLqiikX2Q0q/ePEixx8OXV/K\
-5ORkjB87FhfOX0Bvj7RhU/v27o2UlBS8fvUaQ4cPw+SpU6FSqbQuz8n9e/czPUMPADVr1tR7QlFa\
-RUVF4Zf5CxAa8l8/iRk/zkKdunVyeYbHx9BKgtxeAchNubxeTdA1qFxBXZV4V/cePXJs09ITipnT\
-p+PqlasZ5Y6fOoXhQ4fora3LbXtnZmaGeQsXQKVUZtumly9fPsttpnfpGtCQmFBk++Wu7+RUINuO\
-iYlBvz4ewDsXdI4dPYr79+7j1NmzCDx0EMuXLsPY8eMRFhqqdXn6lyYn6c/Qk368evUKq1euxNY/\
-/oBapYatrS2mzZyB9m5u+doeH0OjkkBbmwYAapUat2/dxjKfFejq7g4ACA0JyVdbF/v0Kc6dPYcW\
-Li0QFhqGmrY10ax58zy1d8VpbgsmFCWYXC7HibDjuHDhPCLvROJZfDyePn0Kq+rVYWFRBfWdnNC8\
-RQt82qxZpsvW2qjVasyaPRsKhQLeEyYASBuVT2Yqg4WlBWrVro3k5GQ8jXmqc7lNTRsAaZc3/9iy\
-Bd99PwKpqanwXbceo8aMzqgrNCQED+4/eHvVxUXntLmUvfR+EsuWLsHLFy9hbm6O0WPHYuiwoZBw\
-8CAq5bS1aQAQGRkJhUKBNStXYdniJfjy66+RnJyUr7YuIuI6vCdMgE1NG5ibl8c/ly9jwS+/wGvA\
-Z/lu76IfPkRIcAgirl3D3bt3Ef3wIUxlMnxSuTJqWNdAgwYN0b6DG6ysrPghM6H4cHfv3oXvuvUI\
-PHgQTZo2TXsevENHAMBk7x+w4JeFiImJwZV/r2D+3Hl4+eIFhn3+OYYOH6bzKoKVlRWsrKyw1z8g\
-Y9mbN29gZGiUFti3P1Bv3rzRuTydQqFASHAwvvt+BFRKFY4GBWVKKPbt3ZexH5UqV2JCkQ/v95MY\
-MGggvCdOynhsj6i009amAYBGo0aPnj3Rp68Hzp09i3lz5sCjX998tXXpJk2Zgi5du2LY4CH4Y8uW\
-TAlFbto7jUaDkOBgrP91HaIfPkSHTh3xafNmGDh4EGbN/BEjRn4PCwsL3L17F5fDw7Fm1SrY2tni\
-+1GjMgYrIyYUeaJQKOCzfDn8du/BkGHDEHbyBMzL//cDEhMTA4nEAPWdnFDfyQmdOneG96SJuHnz\
-JtauXo1O7d2wcPFitGrdKlf1lS9fAcnJabOXps9iWvGTijqX5xZveeRfVFQUFs6bj7DQtAmiWrZq\
-iZmzZmWMH/Ax3bhxA+fP/Q2RSIS27drB2sa6SMdSo9FAoVDAxMSkWB0D+Z0gLL/1uHfvprMDbnGM\
-oYOjI5av9IFYLIajoyM2rPdFsjz5g9q66tWrAwDsHRxw+NChPLV39+/dx5RJk6BQKDBi5Pfo3KVL\
-pivKxsbGqFq1Kho1bowmTZvC08sL6nkqHDl8BAvnL8Bvmzbjl8WLULlKFTaQelainxea7D0RMU9i\
-EHg0CGPGjc2UTGTH3t4eq9euxZLlyzBt8mQEHTmSq9c1bNQQCoUCYaGhCA0JgaWlJapUqaJz+btS\
-UxUAALVGnfb0QMl52OajGeg1AF07dkJYaCjq2tfF71u34vetW4tEMrHR1xe9u/fAju3b4bN8Odw7\
-d8bZM2eKbCyfP3+O3j16IuJaRLE7DtInCPNZsQL/+7//Ye6cOejVvQcC/PwLpJ64uLgSFUP/PX5w\
-rFMXFy9czGgLW7Zple+2DgB2/fUXoh8+xJlTp2DvkPs+EYmJiRjg6YkePXvCf99edHV3z/H2NABI\
-DAzQrUd3HDh0EI0aN8Z333zDBpJXKPJmyfJlMDIyyvfrW7i4ICj4GETi3OVdnzZrBk8vL3zz5Vcw\
-NjbGkuXLIJFIdC7POGsRNIi8E4kF8+ajcZPGUKSkIPjYMZibl/zL8fWdnLDuf79i04YNet+2SCSC\
-IAiQmcowcPBgtHApGld5Htx/gCWLFmPEyJH4YaI3FAoFvPr1x7GjR+Hi6gogrb/P2TNnEB8fj5Yt\
-W6KGtTUeRUfjyr9X4NywAU4cP44GDRqgmpUVgg4fgVV1K7i2bJltp7frERG4cP4CypUrB9dWLVG5\
-cmU8jXmaZZKrO7dvZyl36MBB3Lh+HadOnkCt2rVgaGiYZf8AaN1eUZnvJC8ThAHAkydPEBYaCnt7\
-e6jVGohEItSwroGzp8+gc5fOMJHJEHIsGBUrfYIGDRpkqe/9eB8JPJwphubm5lo/58KKYZI8CYny\
-xBxnVO3WozsOHTyIAZ6eMDIywgRvbwwcNAhX/vk3z21durtRUWjfpi0sLS3hs3pVrvfZzMwMJ86c\
-zne7LjEwwJhxYzFm3Fj++hcGoRR58uSJ0KqFi963++bNG0GpVOZ6eWRkpLD1jz+Ely9eCIIgCImJ\
-iYJGoym0OLi1bSvYWduUuM/3aUyMMGvmTKGOnZ1gZ20jdHbrIJw4frxQ96F3j56CnbWNkJCQkLFs\
-544/BTtrG+Hx48daX5OQkCD07NZdaOzcQOjaqbPgWKeucPLESSHAz1+oa1dL8OjVS+jXx0NwqF1H\
-6NmtuzB00GDBztpGOB4WJgQfCxbsrG2EDu3aCf36eAh21jbCzh1/CpGRkYJD7TrCt19/Lbi1bSu0\
-auEiqFQqIejIEcHO2kZo7eIqdOvSRbhz+7bWct98+aVgZ20jdOnYSfjn8mWt+ycIQpbtqdXqD47h\
-kcOHBTtrG+GXBQvy9fpzZ88KdtY2wob16zPi2KBefWH50qXCg/v3hYb1nYR+fTyE1i6uwvAhQwVB\
-EISYJzFCw/pOQod27YQe7t2Epo0aCWNHjRaOh4UJdtY2QnR0tCAIgtCpvZswc9r0TPVERkZqjfeX\
-wz/PiGFkZKTOz/lDY/j50GGCnbWN8OD+/WzLffX5F0LD+k5a2yRtXr9+LaSmpn5QW5d+fEZHRwuv\
-X78ukHauv0dfIfzSpQL9XpfE9lIfOERaATAzM9M65bCu5XejovAmISHjloypqWm2z1BT7lSxsMDP\
-c+ciMCgIbdu1Q1RUFL4YNhzffvUVoh8+/Gj79eLFcwDQeZ/94P4DuB4Rgb0HDyAw6Ajq1a+PFUuX\
-Akh7UmXhosVYvGwpUlNT8dmAz7Bl21aUKVMGV/69krGNSVOmYLe/H1xbtsQfW7agqqUldvntwfgf\
-fkDLlq0QExODhNcJGeXnLpiPg4cPo1q1alrLTfD2BpD2iOyN6zd07t/72xOLi04Ts3rlKnwxbBgm\
-T5yIsePH4ftRozJNxjVtxgycOnkSt27ewt6AAMjlcuz280PA/n1QKVV5qktbvL/8+uuMGNrZ2WX7\
-ORdGDOPj4/HmzZuMeUlyUrZs2SxXSvLa1r2/PbZzJUupTiji4uIQFxv70fejTdu2GDRkCI/GAmJr\
-a4uNv23G+g0bUL1GDYQEh6Bzh46Y+/PPkMvlhb4/NWqk3R64e/duxrL1v66D/x4/AMDjx49hamqK\
-qlWrAgBq16mN2Lj/jlMLS4uMS77V3j4KJ5VKkZqamlHm3U5vr1+9wr179zDim28x96ef8er1q7Sr\
-kfivn056v5KcyuVm/97dXlGyboMv9gcegrGxMU6dPAVDQ8NMk3Ht2L49YzIuhSIFxibGKFO2LCQS\
-SdYOfG/7OKnUaq11aY2jkLc4FsUYfqh27dsh4tbNjMnSCsLjx4/x+PFjNnxMKEonqVSKsmXLMhAF\
-zK1jBwQFH8PMWbMglUrx++bf0MmtA/z3+BVqJ9j2bu1hYWmBObN/wuXwcGzftg1LFy/GxYsXAABN\
-mjaBXC7Hnzt24Mb16wgLDcOnnzbLeP27Z3W6zl7f7/S2f98+qNVq/LF9G+rUSRtqXv3Oj2H6maeu\
-cmJx2n3wZ/HxqO9UP9v9e3d7RU1uJwhzcXVFkjwJv2/eDL89exAVGQkAGf2a7ty5g6ioKMQ+faq1\
-Hm1xTPcsPh4KhSLHz7moxvCDfnDEYkil0gK9MiFPlEOemMgGjwlF4TKWSjmgUSljaGiIz7/8AkEh\
-wRgwaCCexcdjkrc3+vXpg8vh4YWyDyYyGXw3bUJqaio8+/bD7Jk/wq1DB0yfOfPtWVx7jB0/HosX\
-/oKe3brDxsYGM2fPylMd6Z3eXr9+jclTp6J7jx4QicVo5OyMq1fTbo08fPAgy+t0latRozoqV6mC\
-0SNHokKFCh+8fx+Tp5cX2rVvj1U+PmjTti3atG2Dbp27YPT336NylSqQmcrQpGlTDB46FGtWrcah\
-AwdR174uDAwNYO9gjyZNm+KbL7/CpB9+gK2trdY6tMUREDJieOXff/XyOZMWIvBWSlHBTpmlT0nt\
-lJkbV/69Inj27SfYWdsItWxqCt4TJghxcXEF2inz/Q6YSUlJWtepVCqdr9Mlu05varVaSExMzHEb\
-usqplJn3Jz/79zE6ZeaGPFEuqJSqjL8vh4cLC+fPF+7cvi2kpKQIbVxbCosWLszUQTE/cXw/hgUR\
-x9x2yuzVvYdgZ20jvHnzpkR9p3u4dxMunj/PTpnslElUuJycnbBz9y6sXrsWFhYWCPDzh1vbdljl\
-45OpT0JBKVOmjM5BjiQSyQfNUPp+pzexWAxTU9NcXZbWVk5ikHl/PnT/ihKZqSzT5G7Va9RAWGgY\
-und1R8P6afMBDRg4MFNs8xPH92NY0uJYJK48GxtDLOFEfbzlQfQxrpCKRHDv3g1Bwccwdvw4aNRq\
-rPJZCffOnRF48FCxei+F0emtNKhYsSICg44g7NRJHA0NQcjx49lOBU5EpWxyMKLsmMhkGDt+PPp4\
-eGDJ4sUIPHgIY0aNguv2tOG635/W/MWLF/Do2SvLduo62GO9HgbqUiqVee6Yl97pjfSTaFpaWjIQ\
-REwoiPKnhrU1Vq9di7ODz2DenDk4c/o0enXvjv5enpkmFCtfvjwCg4Ky/qhLsl74a+TknOf9kEql\
-2HfoIOzs7PihEBETCioGZ+bGJsVuwqfC4OLqin0HDmDX2ynP/9y+A4cPBaZNeT58GCQSCWSmslxt\
-6/LVK3m+T96rew8ocjnoEBERE4pCsnTR4owBZtIlJSXhdcJrzJw+PesZZePG6Ne/f6mIzco1qyGX\
-J/HboIXk7VTnXbu5Y/XKldi65Q/MmzMHfnv24MfZs/Bps2YMUgFLH1Pg0MGDuB4RwYDkID1Gah2D\
-bhExofhADvUc8SbhTaZlGo0GFcpXQK3atbOUt3o7AmFpYFerFr8JOTA3N8ePs2dj0ODBmDdnLk6e\
-OIGBXp/BrYMbZv38c6k6Xgpf2i2kx48e4/EjjoCYGwIAww+YGJGICUU2uvfowU+b9JJ8bd7yO0KO\
-BWPOzz8jJDgEZ06fwfAvPseo0WNyfQuEcs+jnwfqOdWDibFxkdmn9m3aIvTE8SIZL41aDYjFTHKJ\
-CQVRceDWsQNat22DbX9sxYply7Duf78iwD8AEydNQp++HhypT8/qFMF5LarXqMEPhqg0JxQTf/gB\
-ly5e0rl+2OfD8cWXX/LIoBylD+PdrXs3LF60CHv9AzDJ2xtbt2zBrJ9/QoOGDRkkImJCUVLNnDUL\
-bxISdK7/5JNPeFRQnlSuUgVLly/HsOGfY85PP+Gfy5fh2bcfevXpDaVKxQAREROKksjc3Bzm5ub8\
-5EnvnBs44689u7Fn1y4sW7IUAX7+kHAIYCJiQlGyXTh/HuGX/ptdsqu7O6xtSufQupcuXsTr1wlw\
-6+DGb8QHEovF8PzsM3Tt1g1rVq3GprcjZkrEHOWeiJhQlEhyuRwJCa8z/lYoFKX2IJgxbToe3L+P\
-G3du8xuhJ2XKlMG0GdPRsVNHRD98BFkuJuUiKk6CjhxB+fLlORYLMaFo17492rVvzyMAgFKZCqVS\
-yUAUgE+bNWODS0WSWwc3VKxYMVcz0L7vwvnzGP39SAwaMoTHNzGhKE0irl1DbGxcxt8tW7XkBFJE\
-pdy4CRPy9bokeRImeU+EmLfxiAlF6TNz+nRcvXI14+9TZ8/CwtKCgSGiPFswfx5q1aqFihUrMhiU\
-CVPMEk6tUuP2rdtY5rMCEbduIuLWTSYTRJQvJ0+cwOFDgVjwy0IGg5hQlDaRkZFQKBRYs3IVOrV3\
-w45t2xkUIsqX1StXwUgqxcQfvBEVGYljR4Pgv8ePgSEAvOVR4mk0avTo2RN9+nrg3NmzmDdnDpp+\
-2hT1nZwYHCLKk94efRD7NBYAEBUVhUqVKvGKJzGhKC0cHB2xfKUPxGIxHB0dsWG9LyKuRTChIKI8\
-GzxkSMb/T586BSdnZ7i4ujIwxISiNPDf44dpU6Zg644duHnjOgDA3tGBgSGiD7InwJ9BICYUpUm3\
-Ht1x6OBBDPD0hJGRESZ4e6NBgwYMDFEp99Os2Qi/dAkB+/fxEVBiQkE5k0ql8N20EQkJCTAxMYGh\
-oSGDQkS4HB6O6xERSEpKgpmZWYl4T4IgQMUJ+T4apqWlRNmyZZlMEFGJpFapsHTxEjg5OOLqlSv4\
-fOgw/Ll9BwPDhIKIiCj3fFaswEZfX6SkpABIm6tp9syZOHTgIINTiHjLo5g4//d5yGQmBbLt1NRU\
-AMC1q1cZ6CJEkZICQRAYCKIc7NzxZ5b5iNQaDXZs345uPbozQEwo6F1DBg2Co4MDIBLpfdvPnz8H\
-AMycPoOBLkIS5YkwMOBXtEg2nBID1LKpWSLeS8P6JfcRcomEF+GZUFDWL4ZYjF3+fgXSD6JDu3Z4\
-cP8BAvbvY6CJcuFm1J1i/x569+iJiGvX8M+1q8W+U+ba1auxZvUaKN9ebQUAsViMIcOG8WBlQkFE\
-RJQ7348aBZFIhA3rfZGQkICKn3yC6TNmoGOnTgxOIeL1ICIiKt4/ZGIxRo4ejfAr/6JBw4b4df06\
-9Pbow8AwoSAiIsp/ckFMKOgjkYglkEgkDAQREeUb+1AQvCdPwosXLxgIIiJiQkH516VrVwaBiIg+\
-CG95EBERERMKIiIiYkJBRERETCiIiIiImFAQEREREwrSh7i4OEQ/fMhAEBFRvvGxUUK/Pn3wLD4e\
-zZo318v2ypQtiyVLl8JEJtO6fumixbh69Yre9r9KFQssXLxI6+BcgiBg5vTpeBQdrbf66tSpixmz\
-ftS6TqFQYMrESXj5Un/jejRv0QIjR4/Wuu7Vy5eYOnkKkpOT9FZfF3d3DBo8WOu6R9HR+GnWbCiV\
-qXqrb+CgwejazV3ruusREViyaDE0GrVe6hKJRBgxciRauLhoXX/2zBms+9//9DZtvFgsweRpU+Hg\
-4KB1feDBQ/hzx3a9xdLISIqf5s5BtWrVtK7ftnUrgg4fBgDcv3+fjR8xoSD9UqSkQqlU4fSp03rZ\
-nomJCV6/TtCZUISFhuLmzZt623/z8uWRqlBorU+tViPkWDDi4+P1Vl909COdCYVcLkdoSAjkcrne\
-6ktNVepMKJ4/f47jYWFQKpV6q69ChYo6E4onT57gxPHj0Gg0eqvP3sFRZ0Jx9+5dnDxxQq/He9t2\
-7XQmFNcjInDq5Cm91ufp5aUzoQgPD9fb9y4tgRHjyeMnOhOK8+f+zlSfWCKBUQHMYEylk0jLGZ3A\
-sBQ9DrXr4Mr1iAKZvjw1JQUJiYl627aRkRFMTEx0rlepVHr9wTU2NoZUKs3mBzkVycnJeqtPJpNl\
-G6uUlBQoFAq91WdmagqJge7cPzkpCal6TCjMzMyyHYpdLpdDpVLprb6yZctCJBLpXJ+YmAi1Wn9X\
-KMqWLZttmYSEBL1doZBIJNlODS4IAhISEvQWS0MDQ8hMZTrXq9VqJCYmZvzfyMio2E9dniWB69sP\
-02fOQKPGjQusjlo2NRF5/x5/mHiFgrIkAMbG+MTYuPAOOgMDlCtXrvDen5ERjIyMCq0+Y2NjGBdi\
-PE1kMpgU4vFiampaqMdnYf/g5ZRw6PWMTiQq1O+CRCIp1PqodGGnTCIiImJCQUREREwoiIiIiAkF\
-ERERERMKIiIiYkJBRERETCiIiIiICQUREREREwoiIiLSC46USYUqLi4OYSGhAACRKG0yozp168DB\
-0TFTudinTxF0JAgDBg0skOHGiYiICQUVY/fu3sX0qVNRuUoVGBsbIyEhAa9fvcKSZcvQp68HACA5\
-ORnjx47FhfMX0NujDxMKIqJigLc86KNYsdIHIcfD8PeFC7C1tUWAvx8AICYmBh3atceD+w8YJCKi\
-YoRXKOijuHb1KpRKFZ4/e4bY2NiM6avVajVmzZ4NhUIB7wkTGCgiIiYURLqtXrkKcrkcYrEYU6ZN\
-xaAhQwAAVlZWsLKywl7/AAaJiKgY4S0P+ijWbfDF/sBDMDY2xqmTp9hPgoioAPjv8cOZ06czLQsJ\
-DsHRoCAmFFRy2NvbY+bsWThx/Dg2+m5gQIiI9Czw0EF4j58AjUYDIK3T+7jRo3H+7/NMKKhk8fTy\
-Qrv27bHKxwePoqMZECIiPert4YH4+Hic//tvAMDx0DAkJyejj0cfvdfFPhRUqJq3aIHI+/cyLduw\
-eZOWL0Ef9C6AA56IqDTp2KkTzMzMcGD/frRwccGhQwdhZ2eHevXrZ5TRaDRISkqCmZnZB9XFKxRE\
-REQllFQqRZeuXXE48DASExMRGhKa6WRt6eIlaFCvPpo3aYoeXd1x48YN/PXnTvR075ZRxr1zl4xl\
-tWxqZvxzcqzHhIKIiEoeQRCQkpKClJSUIrVfCoUCarX6o9Xf26MPXr18iflz5yE5KQm9evcGkNY5\
-c8vvv2G3vz+u3rgOF1dXjB89Rud29gceQsStm2n/P3QQV69HMKEobl6+eAlBAF68eFHs9n3OTz9h\
-wdx5Wtf9tmkTRo8YqXVdaEgIPPv254dPRLkSce0aWrm44sb16xg2eAiWLVkKQRD0Xk96Xy+VSpVj\
-2cg7dzDoswH4tHFjNG3YCGNHj/4o7XgLFxdUsbDArp070aRpU1hVrw4AuHjhPNq0aYu69nUhFosx\
-/MsvEBUVhadPY/JVDxOKIp5tL5w/H82aNIFKpUSrFi6Y/eOPHzXTzYvXr19jX8Be7PX3R3JycqZ1\
-apUKW//YilOnTyH26dMsr920YSPu37uLK/9e4YFARNlKSUnB1198iWdx8Rlt5/p163Bg/3691ZGa\
-morR349Eu9ZtAABtXFviekSEzvLRDx9iyMBB8PTywqV//sHpc+dgzXqoegAADmNJREFUZ2eHAf09\
-oVAoCjU+YrEYvXr3AgD06tM7Y7lSqcKzZ/Hv/ugAAIyMjDIlYxq1GmJJzukCE4oibMf27diy+be3\
-H6wAQRDw186d2LxxY7HY//9bsxbde/ZEM5cW2LFtW5b3Zm1tjYGDBmL9unVZrk7ExcVhzNgxWLtm\
-NQ8EIsrWP5cv48WLF1Br1JlOWvz9/PRWx0ZfXwQHB2f8Hf8sHiO/GwG1jisVy5YsxbcjvoNHv74w\
-NDSEzFSGcRMmoF79+ti6ZUuhx2jKtGmIvH8Pg98OIggAri1dEX4pHFevXIVapYbvel/Y2tqiXv36\
-iI6OxuPHjxEXF4fY2FhUrFgxxzr4lEcRtmvnTigzDlZRWkaZqsTGDRthZlbmo+/fy1cvEXk7Uuu6\
-5OQknDt7FkeCj+HVy5cYPmQoBg4eDBMTEyTJk/B/a9Ziw+ZNsLSsis4dO+Db775DFQsLqNVqLFm0\
-CFOnT0Or1q2xaeMmXPn3CpwbOAMAfvrxR7x5I9dap5GRIZydnSESM08mKk1uXL+eNn3xe6LuROLP\
-7Tv0UsfWLX9AmZr638m8RsCjR49w+84dODg4ZCl//vx5TJ85I8vyHj17Ytdff+Grb7756HFr7+aG\
-0WPHYtCAAVCmpsLWzhY+q1ehbl17tHB1gVvbtoAAtGzVCq3btGFCUZzJ5Ulalye+eYNr165+9P2L\
-j3+G++89AppOqVCgW4/uqFSpEipVqoQmnzbFjm3b8OXXX2P9ul/Ruk0bONZL6yHc39MT69etw4+z\
-Z8Nvzx6UK2eO9m5uAICvv/0Ga9esxjpfX5w7exb+e/xgUa2q1jpFEAEQIDHgYU1UmiQnJUPz3q1g\
-iUSMcuXK6a2tlCdpP5F592mId0mlUkiNjbMsN5GZICkpqcjEbuz4cRgzbixSklNgIjPJWL7O1xdK\
-pRIajQZSqTTT+4rU0e6z5S3C3Dq44VF0NFLfyYqNjIzQp29fzJ0/r1i9l7HjxmH4kKHo4u6O7Vu3\
-IeDAf/c2v/1uBDp37IDhn3+O1T4rsfKd2xyfDRyIDet98e8//2LRwoVYtHRpxkRiRETp7Oxs4bPC\
-BxKJASACKleqhD92bEe5cuX0VIMIfnt2I1XxX3tsamqKcxfOw0Qmy1J62OAhOHv6TJb26szpM6jv\
-VL9IxU4kEmVKJtLldUqELNeIhILoFkv5zLqTMPCzAbh54wZUKhWMDI1gY1sTf+76C2XLli1272fM\
-qFF4GhODZs2bY9KUKZnWLVq4EJcuXoSlZdVMCQUAbN2yBbt27YKBWILdAf4Qabm0SUR05vRpnDp5\
-EpaWVeHRr+8HD9T0rufPn6Nvr96Ij3+G1FQFxGIxlvmsQM9evbSWv3D+PCZO+AGbtvwOOzs7AMCp\
-k6cwccIE7Dt0EJUrVy5x8WdCUcSp1WqEBAdj1IiR8Fm9Ep27dIFBMb2kH3EtAp4eHjh36WKWhOj5\
-8+do1cIFgUFBsKlpk2ldamoqGjs3wOr/W5txK4SIqLDJ5XIcOXwYk70nIjDoCGrXqZNt+QA/fyyY\
-Nw9Ozs5ITk7G40ePsMzHB00/bVoi4iEIQqYTPCYUxYRD7Tq4cj2Cs3ISEX1ktWxq6uxH8L5Xr14h\
-/FI4pFIpmn7aNFN/hJKQUADISCrYh4KIiKiAmJubw61Dybyy+v7tZz5fR0REVESo1WoU1xsFTCiI\
-iIiKCJVKxYSCCv4gKy5DbhMRUf5IpVKIi+ngfEwoiglBEKDRaBgIIiJiQkFERERMKIiIiIiYUBAR\
-ERETCiIiImJCQUREREwo6ON+UGIRdu3cCZVKxWAQERETCsqf3QEBOB52HO6dOuNwYCA45QoRETGh\
-oDxzdnaG76aN6NylK7zHT8CKZcsZFCIiKjI4OZiexcXFISwkFAAgEgFGRlLUqVsHDo6OAIDk5GSc\
-PX0GqcpUuHXoACMjoxy3qdFocCTwMFYsW4byFSpg9dq1cOvYgcEmItLixo0bOH/ub4hEIrRt1w7W\
-NtYMSiHg9OV69ve5cxg8YCAqV6kCY2NjJCQk4PWrV1iybBkaNmqEPj17okyZMnid8Bp2dnbY7ecP\
-iYEkV4nEdyNGMJEgIsrGRl9fLFr4C2zt7BAXG4uUlBRs/G0zXFxd9VZHXqYv5xUK+mArVvqgeYsW\
-UKvU6NalCwL8/aBUKWFhaYm9B/bj5IkTGPHNt7h37y5q1a6d5fXHgoIwbco02NrZYs78eWjh4sKg\
-EhFl48H9B1iyaDFGjByJHyZ6Q6FQwKtffxw7elSvCQUxoShU165ehVKpwvNnzxAbG4uu3dzh6eUF\
-Ty8vAMD1iAhIpVJYWFpqfb2NrS2cnOsj4loELoeHw8nZGaampgwsEZEOf587B5VKhQGDBgJIm2hr\
-74H9mcpoNBokJSXBzMyMAWNCUTysXrkKcrkcYrEYU6ZNxaAhQzLW7fUPwNrVazBpyhSdB3WtWrWw\
-6fff8Sg6Gr/+739wa9MWg4cOwRdffYUyZcowwERE73nx4jkA6Gwjly5egt83b4ZGo0HNmjWxZMVy\
-ODg4MHB6wqc8Csi6Db7YH3gIxsbGOHXyFAwNDTOSiUne3hg5ehS+/vabHLdjVb065i1YgD9378LD\
-hw/RsV17rFi6FC9fvmSQiYjeUaNGWufLu3fvZixb/+s6+O/xQ0hwCLb8/ht2+/vj6o3rcHF1xfjR\
-Y7JsY/2v6+C7bj3UanW+9iE+Ph7eEybg0sWLTChIf+zt7TFz9iycOH4cG3034NbNW5g6eTKcnJ1R\
-t649Dh8KxKtXr3K1rZo1a2LuvHno2bs3fH19sfPPnQwwEdE72ru1h4WlBebM/gmXw8Oxfds2LF28\
-GBcvXsDFC+fRpk1b1LWvC7FYjOFffoGoqCg8jXmaaRs9evXE8bAwfNbfE+fOns113UnyJGzeuBE9\
-urqjWjUrODk7l7r485ZHAfP08sKRwMNY5eODS5cuQqlU4t9//sHokSMBALv9/dCwUaNst6HRaLDX\
-PwBLlyxB4yaNcTgoCDWs+RgUEdG7TGQy+G7ahMneE+HZtx9EIhE6dOyI6TNnwmf5Cjx7Fv9f4bcP\
-NIree9axatWq2LJtK/bv3YeZ06bDxMQEPXr1QrPmzWBvbw8TmSyj7OPHj3E9IgJhoaE4eiQILq6u\
-2LJtG+ra1y2V8edjo0Xc6VOnsXDePFSoWBFTpk1Fvfr1GRQiohy8efMGBgYGMDExAQCEhoTgu6+/\
-wZ6AADg6OmLOzz/j7OnTCAoJzvZk7uKFCzgcGIjL4eG4fes2xBIJFCkpkEgkqPhJRdSpUxet27ZB\
-5y5dUK1atVIdcyYURVR4eDimT5kCA4kBJk+bijZt2zIoREQfYJXPSviuXw9laips7WyxdPlyONar\
-l6dtJMmToFQpYWZqCokBL/K/i9EoopQKBZSpSsjMZZBKpQwIEdEHGjt+HMaMG4uU5BSYyEzytQ2Z\
-qYyB1IFXKNKzzqQkxMXFwdDAAJZVq0IsztxfVaVSIS42FmqNBlWrVoVEknl0y8TERMTHxaN6jeow\
-0GPWGnIsGPPnzYWVlRWmzpjBR5yIiApQu1at8ejRow/ahpWVFcJOnWRCURoTCkEQoNFoMi17N2HI\
-aT2Qdq9NEASIxWKI3unlk/7a9GUajQYSiSRTmZyoVCrs/msXVvn4oMmnTTFl2jRYWVnxm09Exb7t\
-fb+9BJClfdS2XFfZnGg0Gmg0GqhUKiQlJUGemIjqNWrkaRscels7Pjb69oCUSCSZ/uVlPQCIxWKt\
-iUL6a8VicUYZpVKZp+nHDQwMMGDQQASFBKNihYro0qEjNm3YwA+OiIp92/v+39oSBG3LdZXN8Ufv\
-bTtsZGQEU1NTGPGWst6wD8VH+gKlpqbmqW/Eo+horF2zFkeDgjBk2FD06t2HwSQiymc7LBKJIJVK\
-UaVKFQaECUXx9v4tFF0eP36MTRs2YG/AXnw24DMcCw2Bubk5A0hE9AEEQYBKpYIgCDAyMmJAmFAU\
-Xzldnbh/9z4W/bIQFy5cwJChQxAcFopy5coxcEREekooNBoNUlNT9ZZQ3Lt3D4IgwNbWlgkFFTyN\
-RgMDA4Mc+1DcuHUDf587h0+bN0Mfj75MJoiI9EgsFkMqler1sfw1K1dBpVJh5ZrVpTOmPKwKPytW\
-qVRITk7Otpy7uzvOXjiPJk2awqtfP3wxbDiDR0RUBN26eQtHg4IQExOD2NinOBoUhBs3bpS6OPCx\
-0WLg1cuXaNqoMa5cj4BMxkFViIg+pvcfG503Zw5+27Q5U5mBgwZh7oL5TCh4uBTNA5gJBRFR0Uso\
-NBoNBI2ASd7eUKlVWOGzEiKxKMsAiSUd+1AQERF9ALFYDIjThuVWq9SQGEhKZRyYUBAREenBvAUL\
-SndixUOAiIiImFAQEREREwoiIiJiQkGF9UGJJXqdFp2IiIgJRSkkkYjzNbMeEREREwoiIiJiQkFE\
-RERMKIiIiIiYUBAREVHh4FweRczY0aNx9crVLMufPXuGTz75JMvy2rVrYf3GjQwcEZGejf5+JCIi\
-IrIsj3n8BJbVqmZZ/tXXX2HIsGFMKJhQFA0vX7xEYuKbXJc3NTNDhQoVGDgioo/cHn9SqRJMTEyY\
-UDChICIiovziSElFVGJiIl6+eKFzfTlzc5QtW5aBIiIqYHGxsVAoFDrXW1atyoEHwSsURdaKZcuw\
-b+8+neu7de+GSVOmMFBERAWsb+/eePnylfazcokEs+fMQavWrZhQMKEgIiKiD8XHRomIiOiD8aZP\
-EXc0KAhbt2zJ+Lufpyd69e7NwBARFbIF8+bj1s0bAACRSIQFixahatWqDAwTiuKhcZMmkMlMM/6u\
-Xac2g0JE9BH09/REfHz824QCqFK5MoPyDvahICIiog/GPhRERETEhIKIiIiYUBARERETCiIiIiIm\
-FERERMSEgoiIiJhQEBERERMKIiIiIgD4f0dHWShNZtcIAAAAAElFTkSuQmCC'
+@functools.lru_cache(maxsize=None)
+def image(mode):
+    '''png image (bytes) of mode (StepDown|StepUp|Inverting)'''
+    with open(os.path.join(IMGDIR,mode+'.png'),'rb') as f:
+        return f.read()
 
 if __name__ == "__main__":
-    '''Display images base64 StepDown, StepUp and Inverting'''
-    import base64
+    '''Display images StepDown, StepUp and Inverting'''
     import PySimpleGUI as sg
     sg.theme('SystemDefault')
-    ImgStepDown= base64.b64decode(StepDown)
-    ImgStepUp= base64.b64decode(StepUp)
-    ImgInverting= base64.b64decode(Inverting)
     layout=[
         [sg.Button('StepUp'),sg.Button('StepDown'),sg.Button('Invert'),sg.Button('Exit')],
-        [sg.Image(ImgStepUp,key='-IMG-')]
+        [sg.Image(image('StepUp'),key='-IMG-')]
         ]
-    window = sg.Window('Display images base64 StepDown, StepUp and Inverting',layout,finalize=True,font=('Ubuntu','10'))
+    window = sg.Window('Display images StepDown, StepUp and Inverting',layout,finalize=True,font=('Ubuntu','10'))
     window.bind('<Escape>','Escape')
     while True:
         event, values = window.read()
         if event == sg.WIN_CLOSED or event == 'Exit' or event=='Escape':
             break
         elif event=='StepUp':
-            window['-IMG-'].Update(ImgStepUp)
+            window['-IMG-'].Update(image('StepUp'))
         elif event=='StepDown':
-            window['-IMG-'].Update(ImgStepDown)
+            window['-IMG-'].Update(image('StepDown'))
         else:
-            window['-IMG-'].Update(ImgInverting)
+            window['-IMG-'].Update(image('Inverting'))
     window.close()
-
-
-
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+'''
+Memoizing cache of computed and snapped designs, in memory
+(DesignCache) and on disk (DiskCache, a sqlite file shared by
+sessions and processes).
+The key is the input tuple with every value rounded to a number of
+significant digits, plus the series used for the standard values;
+the design is computed from the rounded inputs, so the cached
+result is the same whatever value of the same key asked for it.
+The cache is bounded (least recently used entries are evicted),
+entries may expire after a time to live, and it is thread safe.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import collections
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+import time
+import mc34063eng as eng
+from mc34063ser import E24, E12, E6, _series
+
+def _design(inputs,series):
+    '''compute and snap a design'''
+    d=eng.compute(*inputs)
+    return None if d is None else (d,eng.snap(d,*series))
+
+def quantize(x,digits=6):
+    '''round x to digits significant digits'''
+    if x==0 or not math.isfinite(x):
+        return x
+    return round(x,digits-1-math.floor(math.log10(abs(x))))
+
+def normkey(mode,vin,vout,iout,fmin,vripple,vf,vsat,series,digits=6):
+    '''normalized key of a query: mode, inputs rounded to digits
+    significant digits and names of the series (values for custom
+    lists)'''
+    n=digits
+    series=[_series(s) for s in series]
+    return (mode,quantize(vin,n),quantize(vout,n),quantize(iout,n),
+            quantize(fmin,n),quantize(vripple,n),quantize(vf,n),
+            quantize(vsat,n))+tuple(s.name or tuple(s) for s in series)
+
+class DesignCache:
+    '''bounded LRU/TTL cache of (Design, Snap)
+    input:
+      maxsize= max number of entries
+      ttl= time to live of an entry (s), None for no expiry
+      digits= significant digits of the inputs in the key
+      store= DiskCache used for the misses, or None'''
+
+    def __init__(self,maxsize=1024,ttl=None,digits=6,store=None):
+        self.store=store
+        self.maxsize=maxsize
+        self.ttl=ttl
+        self.digits=digits
+        self.hits=0
+        self.misses=0
+        self.evictions=0
+        self._data=collections.OrderedDict()
+        self._lock=threading.Lock()
+
+    def key(self,mode,vin,vout,iout,fmin,vripple,vf,vsat,series):
+        '''normalized key of a query'''
+        return normkey(mode,vin,vout,iout,fmin,vripple,vf,vsat,series,
+                       self.digits)
+
+    def design(self,mode,vin,vout,iout,fmin,vripple,vf,vsat,
+               sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6):
+        '''computed and snapped design, from the cache if there
+        input:
+          as eng.compute() and eng.snap()
+        output:
+          (Design, Snap) or None if input data are not valid'''
+        series=(sct,srsc,sr,sl,sc)
+        k=self.key(mode,vin,vout,iout,fmin,vripple,vf,vsat,series)
+        now=time.monotonic()
+        with self._lock:
+            if k in self._data:
+                t,v=self._data[k]
+                if self.ttl is None or now-t<self.ttl:
+                    self._data.move_to_end(k)
+                    self.hits+=1
+                    return v
+                del self._data[k]
+                self.evictions+=1
+            self.misses+=1
+        if self.store is not None:
+            v=self.store.design(*k[:8],*series)
+        else:
+            v=_design(k[:8],series)
+        with self._lock:
+            self._data[k]=(now,v)
+            self._data.move_to_end(k)
+            while len(self._data)>self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions+=1
+        return v
+
+    def stats(self):
+        '''counters: hits, misses, evictions, size'''
+        with self._lock:
+            return {'hits':self.hits,'misses':self.misses,
+                    'evictions':self.evictions,'size':len(self._data)}
+
+    def clear(self):
+        '''remove all entries (counters are kept)'''
+        with self._lock:
+            self._data.clear()
+
+class DiskCache:
+    '''persistent cache of (Design, Snap) in a sqlite file
+    The key is a hash of the normalized query (as DesignCache) and
+    of eng.VERSION; the file is in WAL mode so many processes can
+    read and write it at the same time.
+    input:
+      path= sqlite file
+      digits= significant digits of the inputs in the key
+      timeout= max wait (s) for a lock held by another process'''
+
+    def __init__(self,path,digits=6,timeout=30.0):
+        self.path=path
+        self.digits=digits
+        self.timeout=timeout
+        self.hits=0
+        self.misses=0
+        self._local=threading.local()
+        self._lock=threading.Lock()
+        self._db().execute('CREATE TABLE IF NOT EXISTS designs '
+                           '(key TEXT PRIMARY KEY, value TEXT)')
+
+    def _db(self):
+        '''connection of the calling thread'''
+        db=getattr(self._local,'db',None)
+        if db is None:
+            db=sqlite3.connect(self.path,timeout=self.timeout,
+                               isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            self._local.db=db
+        return db
+
+    def key(self,mode,vin,vout,iout,fmin,vripple,vf,vsat,series):
+        '''hash of the normalized query and of the engine version'''
+        k=normkey(mode,vin,vout,iout,fmin,vripple,vf,vsat,series,
+                  self.digits)
+        return hashlib.sha1(repr((eng.VERSION,)+k).encode()).hexdigest()
+
+    def design(self,mode,vin,vout,iout,fmin,vripple,vf,vsat,
+               sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6):
+        '''computed and snapped design, from the file if there
+        input:
+          as eng.compute() and eng.snap()
+        output:
+          (Design, Snap) or None if input data are not valid'''
+        series=(sct,srsc,sr,sl,sc)
+        h=self.key(mode,vin,vout,iout,fmin,vripple,vf,vsat,series)
+        db=self._db()
+        row=db.execute('SELECT value FROM designs WHERE key=?',
+                       (h,)).fetchone()
+        if row is not None:
+            with self._lock:
+                self.hits+=1
+            v=json.loads(row[0])
+            return None if v is None else \
+                (eng.Design(*v[0]),eng.Snap(*v[1]))
+        with self._lock:
+            self.misses+=1
+        k=normkey(mode,vin,vout,iout,fmin,vripple,vf,vsat,series,
+                  self.digits)
+        v=_design(k[:8],series)
+        db.execute('INSERT OR REPLACE INTO designs VALUES (?,?)',
+                   (h,json.dumps(v)))
+        return v
+
+    def stats(self):
+        '''counters: hits, misses, size'''
+        n=self._db().execute('SELECT COUNT(*) FROM designs').fetchone()[0]
+        with self._lock:
+            return {'hits':self.hits,'misses':self.misses,'size':n}
+
+    def clear(self):
+        '''remove all entries'''
+        self._db().execute('DELETE FROM designs')
+
+# shared cache of design()
+CACHE=DesignCache()
+
+def design(*args,**kw):
+    '''computed and snapped design from the shared cache
+    (see DesignCache.design())'''
+    return CACHE.design(*args,**kw)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+'''
+Resistor networks (series and parallel combinations of standard
+values) for the feedback divider R1/R2.
+The networks of one and two resistors of a series are precomputed
+in sorted indexes (cached at first use); networks of three
+resistors are searched meet-in-the-middle, combining a single
+value with the index of pairs, so they are never enumerated.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import bisect
+from collections import namedtuple
+import numpy as np
+from mc34063ser import _series
+
+Net=namedtuple('Net','value desc n')
+Net.__doc__='''resistor network: value, description, number of resistors
+desc uses + for series and // for parallel'''
+
+Divider=namedtuple('Divider','r1 r2 err')
+Divider.__doc__='''feedback divider: networks r1, r2 and ratio error in %'''
+
+_INDEX={}
+_ARRAYS={}
+
+def _fmt(v):
+    '''format a resistor value'''
+    return '%g' % v
+
+def _par(a,b):
+    '''parallel of two resistors'''
+    return a*b/(a+b)
+
+def netindex(s,lo=0,hi=2):
+    '''sorted indexes of the networks of 1 and 2 resistors of s
+    with values from 10**lo to 10**hi (excluded)
+    The indexes are computed at first use and cached
+    output:
+      {n: (sorted values, networks)} for n=1,2'''
+    s=_series(s)
+    key=(s.name or tuple(s),lo,hi)
+    if key in _INDEX:
+        return _INDEX[key]
+    v=s.decades(lo,hi)
+    one=[Net(a,_fmt(a),1) for a in v]
+    two=[]
+    for i,a in enumerate(v):
+        for b in v[i:]:
+            two.append(Net(a+b,_fmt(a)+'+'+_fmt(b),2))
+            two.append(Net(_par(a,b),_fmt(a)+'//'+_fmt(b),2))
+    idx={}
+    for n,nets in ((1,one),(2,two)):
+        nets.sort()
+        idx[n]=([x.value for x in nets],nets)
+    _INDEX[key]=idx
+    return idx
+
+def _near(keys,nets,t):
+    '''networks of a sorted index next to value t'''
+    i=bisect.bisect_left(keys,t)
+    return nets[max(i-1,0):i+1]
+
+def synth(t,s,n=3,lo=0,hi=2):
+    '''networks of exactly n (1..3) resistors of s next to value t
+    output:
+      list of Net, not sorted'''
+    idx=netindex(s,lo,hi)
+    if n<3:
+        return _near(*idx[n],t)
+    keys,nets=idx[2]
+    out=[]
+    for a in idx[1][1]:
+        if a.value<t:
+            for b in _near(keys,nets,t-a.value):
+                out.append(Net(a.value+b.value,a.desc+'+('+b.desc+')',3))
+        elif a.value>t:
+            for b in _near(keys,nets,1/(1/t-1/a.value)):
+                out.append(Net(_par(a.value,b.value),
+                               a.desc+'//('+b.desc+')',3))
+    return out
+
+def _arrays(s,lo,hi):
+    '''values of netindex() as numpy arrays (cached)'''
+    s=_series(s)
+    key=(s.name or tuple(s),lo,hi)
+    if key not in _ARRAYS:
+        idx=netindex(s,lo,hi)
+        _ARRAYS[key]={n:np.array(idx[n][0]) for n in (1,2)}
+    return _ARRAYS[key]
+
+def _nearv(keys,t):
+    '''_near() for an array of values t
+    output:
+      positions in keys of the 2 networks next to t, -1 for none'''
+    i=np.searchsorted(keys,t)
+    return np.where(i>=1,i-1,-1),np.where(i<len(keys),i,-1)
+
+def _arm(keys,t,n):
+    '''networks of n resistors next to values t, as synth()
+    output:
+      arrays (t position, kind, i, j, value) of the candidates; kind
+      1 or 2 is network i of the index of n, 3 is single i + pair j,
+      4 is single i // pair j'''
+    t=np.asarray(t,dtype=float)
+    out=[]
+    if n<3:
+        for i in _nearv(keys[n],t):
+            p=np.flatnonzero(i>=0)
+            out.append((p,np.full(len(p),n),i[p],np.zeros(len(p),dtype=int),
+                        keys[n][i[p]]))
+    else:
+        # meet in the middle: every single value a with the pairs next
+        # to t-a (series) or to 1/(1/t-1/a) (parallel)
+        a=keys[1][None,:]
+        tt=t[:,None]
+        with np.errstate(divide='ignore'):
+            for kind,m,want in ((3,a<tt,tt-a),(4,a>tt,1/(1/tt-1/a))):
+                p,ia=np.nonzero(m)
+                for j in _nearv(keys[2],want[p,ia]):
+                    ok=j>=0
+                    pp,aa,jj=p[ok],ia[ok],j[ok]
+                    av,bv=keys[1][aa],keys[2][jj]
+                    v=av+bv if kind==3 else av*bv/(av+bv)
+                    out.append((pp,np.full(len(pp),kind),aa,jj,v))
+    return [np.concatenate(x) for x in zip(*out)]
+
+def _net(idx,kind,i,j):
+    '''network of a candidate of _arm()'''
+    if kind<3:
+        return idx[kind][1][i]
+    a,b=idx[1][1][i],idx[2][1][j]
+    if kind==3:
+        return Net(a.value+b.value,a.desc+'+('+b.desc+')',3)
+    return Net(_par(a.value,b.value),a.desc+'//('+b.desc+')',3)
+
+def bestnet(alfa,s,n=3,tol=0.1,k=5,lo=0,hi=2):
+    '''search for dividers r2/r1=alfa made of networks of s
+    All the candidates of every combination of arms are generated
+    and scored at once with numpy (the arm with 3 resistors is
+    searched from the other one, meet in the middle)
+    input:
+      alfa=r2/r1
+      s= series to use (E3...E192, or its name)
+      n= max number of resistors of the divider (2..4)
+      tol= wanted error in %
+      k= number of alternatives
+      lo, hi= resistor values from 10**lo to 10**hi
+    out:
+      list of Divider, the ones within tol with less resistors
+      first, then by error'''
+    if alfa<=0:
+        raise ValueError('ratio must be positive')
+    idx=netindex(s,lo,hi)
+    keys=_arrays(s,lo,hi)
+    c=[]
+    for n1 in (1,2,3):
+        for n2 in (1,2,3):
+            if n1+n2>n or n1+n2>4:
+                continue
+            if n1==3:
+                p,k1,i1,j1,v1=_arm(keys,keys[n2]/alfa,3)
+                k2,i2,j2,v2=np.full(len(p),n2),p,np.zeros(len(p),dtype=int), \
+                            keys[n2][p]
+            else:
+                p,k2,i2,j2,v2=_arm(keys,alfa*keys[n1],n2)
+                k1,i1,j1,v1=np.full(len(p),n1),p,np.zeros(len(p),dtype=int), \
+                            keys[n1][p]
+            c.append((k1,i1,j1,v1,k2,i2,j2,v2))
+    k1,i1,j1,v1,k2,i2,j2,v2=[np.concatenate(x) for x in zip(*c)]
+    err=(alfa*v1-v2)/v2*100
+    # key of the order: within tol, less resistors, smaller error
+    ae=np.abs(err)
+    out=(ae>tol).astype(int)
+    nr=np.where(out==0,np.minimum(k1,3)+np.minimum(k2,3),0)
+    order=np.lexsort((ae,nr,out))
+    # the first k and the ones tied with the k-th, ordered as before
+    # (ties by the descriptions of the networks)
+    last=order[min(k,len(order))-1]
+    sel=np.union1d(order[:k],np.flatnonzero((out==out[last])&
+                                             (nr==nr[last])&(ae==ae[last])))
+    best=[]
+    for x in sel.tolist():
+        r1=_net(idx,k1[x],i1[x],j1[x])
+        r2=_net(idx,k2[x],i2[x],j2[x])
+        e=float(err[x])
+        key=(0 if abs(e)<=tol else 1,r1.n+r2.n if abs(e)<=tol else 0,abs(e))
+        best.append((tuple(-y for y in key),r1.desc,r2.desc,Divider(r1,r2,e)))
+    return [x[3] for x in sorted(best,reverse=True)[:k]]
+
+Rsc=namedtuple('Rsc','net err pmax')
+Rsc.__doc__='''current sense network: parallel network, error in %,
+max power (W) dissipated by one of its resistors'''
+
+_RSC={}
+
+def rscindex(s,nmax=8,lo=-2,hi=2):
+    '''sorted table of the parallel networks for Rsc: n (1..nmax)
+    equal resistors and pairs of different values of s, with values
+    from 10**lo to 10**hi (excluded)
+    The table is computed at first use and cached
+    output:
+      sorted values, networks, smallest resistor of the networks'''
+    s=_series(s)
+    key=(s.name or tuple(s),nmax,lo,hi)
+    if key in _RSC:
+        return _RSC[key]
+    v=s.decades(lo,hi)
+    t=[]
+    for a in v:
+        t.append((a,Net(a,_fmt(a),1),a))
+        for n in range(2,nmax+1):
+            t.append((a/n,Net(a/n,'%d//%s' % (n,_fmt(a)),n),a))
+    for i,a in enumerate(v):
+        for b in v[i+1:]:
+            t.append((_par(a,b),Net(_par(a,b),_fmt(a)+'//'+_fmt(b),2),a))
+    t.sort()
+    _RSC[key]=([x[0] for x in t],[x[1] for x in t],[x[2] for x in t])
+    return _RSC[key]
+
+def rscnet(rsc,ipk,s='E12',k=5,prated=None,nmax=8,lo=-2,hi=2):
+    '''search for the best parallel networks for Rsc
+    input:
+      rsc= computed value (Ohm)
+      ipk= peak current (A)
+      s= series to use (E3...E192, or its name)
+      k= number of alternatives
+      prated= power rating (W) of one resistor, None for no limit
+      nmax= max number of equal resistors in parallel
+      lo, hi= resistor values from 10**lo to 10**hi
+    out:
+      list of Rsc, by error then by max power of one resistor'''
+    keys,nets,rmin=rscindex(s,nmax,lo,hi)
+    j=bisect.bisect_left(keys,rsc)
+    i=j-1
+    val=[]
+    last=None
+    while i>=0 or j<len(keys):
+        elo=rsc/keys[i]-1 if i>=0 else float('inf')
+        ehi=1-rsc/keys[j] if j<len(keys) else float('inf')
+        if elo<=ehi:
+            n,err=i,elo
+            i-=1
+        else:
+            n,err=j,-ehi
+            j+=1
+        # keep going while the error is the same as the k-th one,
+        # a network with less power may follow
+        if len(val)>=k and round(abs(err)*100,1)>last:
+            break
+        # all resistors see the same voltage ipk*rsc
+        p=(ipk*keys[n])**2/rmin[n]
+        if prated is None or p<=prated:
+            val.append(Rsc(nets[n],err*100,p))
+            last=round(abs(err)*100,1)
+    val.sort(key=lambda x:(round(abs(x.err),1),x.pmax))
+    return val[:k]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+'''
+Joint choice of the standard values of a mc34063 design.
+Instead of snapping every component by itself, optimize() takes a
+few standard values around every computed one (Ct, R1/R2 pairs
+from bestresk(), Rsc networks from rscnet(), L, Cout), evaluates
+all their combinations at once with mc34063vec.evaluate() and
+returns the one with the smallest weighted as-built error among
+those meeting the constraints (frequency in the fmin range,
+current limit margin, ripple).
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+from collections import namedtuple
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+from mc34063ser import E24, E12, E6, nearest, bestresk
+from mc34063net import rscnet
+
+# default weights of the errors (in %) of the objective
+WEIGHTS={'vout':1.0,'f':0.2,'ilim':0.1,'vripple':0.5}
+
+Choice=namedtuple('Choice','ct rsc rscnet r1 r2 l cout score asbuilt')
+Choice.__doc__='''chosen components (SI units, rscnet is the Rsc
+network), value of the objective and as-built values (vec.EVALS)'''
+
+def candidates(d,sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6,k=2):
+    '''standard values around the computed ones of a design
+    input:
+      d= Design from eng.compute()
+      series (E3...E192) used for Ct, Rsc, R1 and R2, L, Cout
+      k= values taken on each side (2*k+1 alternatives for
+        Ct, L, Cout, 2*k+1 R1/R2 pairs and Rsc networks)
+    output:
+      {'ct','rsc','r1','r2','l','cout': list}, Rsc networks'''
+    n=2*k+1
+    nets=[x.net for x in rscnet(d.rsc,d.ipk,srsc,n)]
+    rr=bestresk(abs(d.vout)/eng.VREF-1.0,sr,n)
+    return {'ct':nearest(d.ct,sct,k),
+            'rsc':[x.value for x in nets],
+            'r1':[x[0]*1e3 for x in rr],
+            'r2':[x[1]*1e3 for x in rr],
+            'l':nearest(d.lmin,sl,k),
+            'cout':nearest(d.cout,sc,k)},nets
+
+def optimize(d,sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6,k=2,weights=None,
+             imargin=1.0,rtol=0.0):
+    '''joint choice of the standard values of a design
+    input:
+      d= Design from eng.compute()
+      series (E3...E192) used for Ct, Rsc, R1 and R2, L, Cout
+      k= values taken on each side of every computed one
+      weights= weights replacing the ones of WEIGHTS
+      imargin= min ratio of the current limit to the needed
+        peak current (the peak current reached with L is
+        always kept under the limit)
+      rtol= allowed excess of the ripple over d.vripple (relative)
+    output:
+      Choice or None if no combination meets the constraints'''
+    w=dict(WEIGHTS)
+    w.update(weights or {})
+    cand,nets=candidates(d,sct,srsc,sr,sl,sc,k)
+    # all the combinations: (ct, rsc, r1/r2 pair, l, cout)
+    ict,irsc,ir,il,ic=[g.ravel() for g in np.meshgrid(
+        *[np.arange(len(cand[x])) for x in ('ct','rsc','r1','l','cout')],
+        indexing='ij')]
+    p={'ct':np.asarray(cand['ct'])[ict],
+       'rsc':np.asarray(cand['rsc'])[irsc],
+       'r1':np.asarray(cand['r1'])[ir],
+       'r2':np.asarray(cand['r2'])[ir],
+       'l':np.asarray(cand['l'])[il],
+       'cout':np.asarray(cand['cout'])[ic]}
+    r,ok=vec.evaluate(d.mode,d.vin,d.iout,d.vf,d.vsat,**p)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        # peak current reached in ton with the chosen l
+        down=d.mode=='StepDown'
+        ipeak=((d.vin-d.vsat-r['vout']) if down else (d.vin-d.vsat))* \
+              r['ton']/p['l']
+        ok=ok&(r['f']>=eng.FMINLO)&(r['f']<=eng.FMINHI)& \
+           (r['ilim']>=r['ipk']*imargin)&(ipeak<=r['ilim'])& \
+           (r['vripple']<=d.vripple*(1+rtol))
+        score=w['vout']*np.abs(r['vout']/d.vout-1)*100+ \
+              w['f']*np.abs(r['f']/d.fmin-1)*100+ \
+              w['ilim']*np.abs(r['ilim']/r['ipk']-1)*100+ \
+              w['vripple']*np.abs(r['vripple']/d.vripple-1)*100
+    score=np.where(ok,score,np.inf)
+    i=int(np.argmin(score))
+    if not np.isfinite(score[i]):
+        return None
+    return Choice(p['ct'][i],p['rsc'][i],nets[irsc[i]],p['r1'][i],
+                  p['r2'][i],p['l'][i],p['cout'][i],float(score[i]),
+                  {x:float(r[x][i]) for x in vec.EVALS})
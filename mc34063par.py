@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+'''
+Pareto front of mc34063 designs over fmin and ripple targets.
+explore() computes a grid of designs (fmin and vripple, and any
+other input, as ranges of mc34063swp), snaps them to standard
+values and evaluates Lmin, Cout, Ct, the efficiency (mc34063eff)
+and the as-built error; pareto() keeps the designs no other one
+beats on all the objectives. The points are sorted once: the front
+is a running minimum with 2 objectives, a staircase sweep with 3
+and Kung's divide and conquer with more, whose merge splits on one
+objective after the other down to those sweeps. check() compares
+pareto() with a brute force search.
+
+Command line:
+  mc34063par.py --vin 12 --vout 5 --iout 0.5 --fmin 24000:42000:200 \\
+                --vripple 0.01:0.1:200 > front.csv
+  mc34063par.py --check
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import argparse
+import bisect
+import sys
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+import mc34063swp as swp
+import mc34063eff as eff
+
+# default objectives: (column, 1 to minimize or -1 to maximize)
+OBJECTIVES=(('lmin_uh',1),('cout_uf',1),('eff',-1),('err',1))
+
+def _front2(p):
+    '''front of distinct points sorted lexicographically (2 columns)'''
+    best=np.minimum.accumulate(p[:,1])
+    keep=np.ones(len(p),dtype=bool)
+    keep[1:]=p[1:,1]<best[:-1]
+    return keep
+
+def _front3(p):
+    '''front of distinct points sorted lexicographically (3 columns)'''
+    keep=np.zeros(len(p),dtype=bool)
+    # staircase of the front so far: y ascending, z descending
+    ys=[]
+    zs=[]
+    for n,(_,y,z) in enumerate(p.tolist()):
+        i=bisect.bisect_right(ys,y)
+        if i and zs[i-1]<=z:
+            continue
+        keep[n]=True
+        j=i
+        while j<len(ys) and zs[j]>=z:
+            j+=1
+        ys[i:j]=[y]
+        zs[i:j]=[z]
+    return keep
+
+def _merge(t,b):
+    '''points of b dominated by some point of t (Kung's merge)
+    Split on the first column: the half of b above can be dominated
+    by the half of t below with that column dropped, so the columns
+    go down to 3 (staircase sweep), 2 (running minimum) or 1
+    input:
+      t, b= arrays (points, columns)
+    output:
+      boolean mask of b'''
+    out=np.zeros(len(b),dtype=bool)
+    if len(t)==0 or len(b)==0:
+        return out
+    d=t.shape[1]
+    if d==1:
+        return b[:,0]>=t[:,0].min()
+    # all the points by the first column, t before b on ties: a point
+    # of t can dominate only the points of b after it
+    x=np.concatenate([t[:,0],b[:,0]])
+    isb=np.arange(len(x))>=len(t)
+    o=np.lexsort((isb,x))
+    if d==2:
+        y=np.concatenate([t[:,1],np.full(len(b),np.inf)])
+        best=np.empty(len(x))
+        best[o]=np.minimum.accumulate(y[o])
+        return best[len(t):]<=b[:,1]
+    if d==3:
+        # staircase of t so far: y ascending, z descending
+        ys=[]
+        zs=[]
+        p=np.concatenate([t,b])
+        for n in o.tolist():
+            _,y,z=p[n].tolist()
+            i=bisect.bisect_right(ys,y)
+            dom=i>0 and zs[i-1]<=z
+            if n>=len(t):
+                out[n-len(t)]=dom
+            elif not dom:
+                j=i
+                while j<len(ys) and zs[j]>=z:
+                    j+=1
+                ys[i:j]=[y]
+                zs[i:j]=[z]
+        return out
+    h=len(o)//2
+    lo=np.zeros(len(x),dtype=bool)
+    lo[o[:h]]=True
+    tl,th=lo[:len(t)],~lo[:len(t)]
+    bl,bh=np.flatnonzero(lo[len(t):]),np.flatnonzero(~lo[len(t):])
+    out[bl]=_merge(t[tl],b[bl])
+    out[bh]=_merge(t[th],b[bh])
+    bh=bh[~out[bh]]
+    out[bh]=_merge(t[tl][:,1:],b[bh][:,1:])
+    return out
+
+def _frontk(p):
+    '''front of distinct points sorted lexicographically (Kung)'''
+    if len(p)==1:
+        return np.ones(1,dtype=bool)
+    h=len(p)//2
+    top=_frontk(p[:h])
+    bottom=_frontk(p[h:])
+    # the first column of top is <= the one of bottom
+    b=np.flatnonzero(bottom)
+    bottom[b[_merge(p[:h][top][:,1:],p[h:][b][:,1:])]]=False
+    return np.concatenate([top,bottom])
+
+def pareto(obj):
+    '''non dominated rows (all the columns minimized)
+    input:
+      obj= array (points, objectives); rows with nan are dropped
+    output:
+      boolean mask of the front'''
+    obj=np.asarray(obj,dtype=float)
+    ok=np.flatnonzero(np.isfinite(obj).all(axis=1))
+    # distinct points sorted lexicographically: a point can be
+    # dominated only by the ones before it
+    p=obj[ok]
+    order=np.lexsort(p.T[::-1])
+    p=p[order]
+    new=np.ones(len(p),dtype=bool)
+    new[1:]=(p[1:]!=p[:-1]).any(axis=1)
+    u=p[new]
+    if u.shape[1]==1:
+        keep=np.arange(len(u))==0
+    elif u.shape[1]==2:
+        keep=_front2(u)
+    elif u.shape[1]==3:
+        keep=_front3(u)
+    else:
+        keep=_frontk(u)
+    out=np.zeros(len(obj),dtype=bool)
+    out[ok[order]]=keep[np.cumsum(new)-1]
+    return out
+
+def _brute(obj):
+    '''pareto() comparing every pair of points'''
+    obj=np.asarray(obj,dtype=float)
+    ok=np.isfinite(obj).all(axis=1)
+    le=np.all(obj[None,:,:]<=obj[:,None,:],axis=2)
+    lt=np.any(obj[None,:,:]<obj[:,None,:],axis=2)
+    return ok&~(le&lt&ok[None,:]).any(axis=1)
+
+def check(n=300,tries=50,seed=0):
+    '''compare pareto() with a brute force search on random points
+    (with ties, duplicates and nan) of 1 to 5 objectives
+    output:
+      {objectives: number of tries with a different front}'''
+    rng=np.random.default_rng(seed)
+    out={}
+    for d in range(1,6):
+        out[d]=0
+        for k in range(tries):
+            m=int(rng.integers(1,n+1))
+            if k%2:
+                obj=rng.normal(size=(m,d))
+            else:
+                obj=rng.integers(0,int(rng.integers(2,10)),(m,d))*1.0
+            obj[rng.random(m)<0.05,int(rng.integers(d))]=np.nan
+            out[d]+=bool((pareto(obj)!=_brute(obj)).any())
+    return out
+
+def explore(dcr=0.0,**kw):
+    '''designs of a grid with their standard values
+    input:
+      keywords of eng.INPUTS as in swp.grid(), e.g. fmin and
+      vripple ranges
+      dcr= DCR of the inductors (Ohm) for the efficiency
+    output:
+      {name: array} of the valid designs: inputs, eng.OUTPUTS,
+      vec.SNAPS, vec.ASBUILT, eff.EFFS and err (largest as-built
+      error in % of vout and ripple)'''
+    axes=swp.grid(**kw)
+    cols=swp.expand(axes,0,swp.size(axes))
+    batch=vec.fromrecords(cols)
+    snaps=vec.snap(batch,cols['vout'])
+    cols.update((k,getattr(batch,k)) for k in eng.OUTPUTS)
+    cols.update(snaps)
+    cols.update(vec.asbuilt(cols,batch,snaps))
+    cols.update(eff.efficiency(cols,batch,snaps,dcr))
+    cols['err']=np.maximum(np.abs(cols['ab_vout_err']),
+                           np.abs(cols['ab_vripple']/cols['vripple']-1)*100)
+    return {k:a[batch.ok] for k,a in cols.items()}
+
+def front(cols,objectives=OBJECTIVES):
+    '''Pareto front of the designs of explore()
+    input:
+      objectives= sequence of (column, 1 to minimize or -1 to
+      maximize)
+    output:
+      {name: array} of the designs of the front, sorted by the first
+      objective'''
+    obj=np.column_stack([cols[k]*s for k,s in objectives])
+    i=np.flatnonzero(pareto(obj))
+    i=i[np.argsort(obj[i,0],kind='stable')]
+    return {k:a[i] for k,a in cols.items()}
+
+def main(argv=None):
+    '''command line interface'''
+    p=argparse.ArgumentParser(description='mc34063 Pareto front explorer')
+    for k in eng.INPUTS:
+        p.add_argument('--'+k,default=str(swp.DEFAULTS[k]),
+                       help='start:stop:num or a,b,c (default %(default)s)')
+    p.add_argument('--dcr',type=float,default=0.0,help='DCR of L (Ohm)')
+    p.add_argument('--objectives',default=','.join(
+                       ('-' if s<0 else '')+k for k,s in OBJECTIVES),
+                   help='columns to minimize (-name to maximize)')
+    p.add_argument('-o','--output',default='-',
+                   help='csv file (default stdout)')
+    p.add_argument('--check',action='store_true',
+                   help='compare pareto() with a brute force search')
+    args=p.parse_args(argv)
+    if args.check:
+        for d,bad in check().items():
+            print('%d objectives: %s' % (d,'ok' if bad==0 else
+                                        '%d fronts differ' % bad))
+        return
+    objectives=[(k.lstrip('-'),-1 if k.startswith('-') else 1)
+                for k in args.objectives.split(',')]
+    cols=explore(args.dcr,**{k:getattr(args,k) for k in eng.INPUTS})
+    fr=front(cols,objectives)
+    mode=np.asarray(eng.MODES)[fr.pop('mode')]
+    f=sys.stdout if args.output=='-' else open(args.output,'w')
+    try:
+        f.write(','.join(['mode']+list(fr))+'\n')
+        data=np.column_stack(list(fr.values()))
+        for m,row in zip(mode,data):
+            f.write(m+','+','.join('%.6g' % x for x in row)+'\n')
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+'''
+Reports of computed designs.
+A sink receives the designs with report(d); the standard values
+are computed only by the sinks that write them, and the output is
+buffered and written every `buffer` reports (and at flush/close):
+  NullSink   discards everything
+  TextSink   human readable blocks, as printc()
+  JsonSink   one json object per line
+  LogSink    one line per design on a logging.Logger
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import datetime
+import json
+import logging
+import sys
+import mc34063eng as eng
+from mc34063ser import E24, E12, E6
+
+def _p(*args):
+    '''a line as print() would write it'''
+    return ' '.join(str(x) for x in args)
+
+def text(d,sn,title=''):
+    '''human readable block of a design (the printc() format)
+    input:
+      d= Design
+      sn= Snap of d
+      title= first line of the block'''
+    return '\n'.join([
+        '================================================',
+        title,
+        str(datetime.datetime.now())[0:19],
+        _p('Mode=',d.mode),
+        '------------------------------------------------',
+        _p('Vin=',d.vin,'V'),
+        _p('Vout=',d.vout,'V'),
+        _p('Iout=',d.iout,'A'),
+        _p('Vripple=',d.vripple*1000,'mV'),
+        _p('Vf=',d.vf,'V'),
+        _p('Vsat=',d.vsat,'V'),
+        _p('fmin=',d.fmin,'Hz'),
+        '------------------------------------------------',
+        _p('Ipk=',d.ipk,'A'),
+        _p('Ct=',sn.ct_pf,'pF (',sn.ct_err,'%)'),
+        _p('Rsc=3 //',sn.rsc3,'Ohm (',sn.rsc_err,'%)'),
+        _p('R1=',sn.r1_k,'kOhm  R2=',sn.r2_k,'kOhm (',sn.r_err,'%)'),
+        _p('Lmin=',sn.lmin_uh,'uH (',sn.lmin_err,'%)'),
+        _p('Co=',sn.cout_uf,'uF (',sn.cout_err,'%)')])+'\n'
+
+class NullSink:
+    '''sink that discards the reports'''
+
+    def report(self,d):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+class TextSink(NullSink):
+    '''buffered human readable reports on a file
+    input:
+      f= file (default stdout)
+      buffer= reports kept before writing
+      title= first line of every block
+      series= sct, srsc, sr, sl, sc as in eng.snap()'''
+
+    def __init__(self,f=None,buffer=256,title='',
+                 sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6):
+        self.f=f
+        self.buffer=buffer
+        self.title=title
+        self.series=(sct,srsc,sr,sl,sc)
+        self._lines=[]
+
+    def format(self,d):
+        return text(d,eng.snap(d,*self.series),self.title)
+
+    def report(self,d):
+        self._lines.append(self.format(d))
+        if len(self._lines)>=self.buffer:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            f=self.f or sys.stdout
+            f.write(''.join(self._lines))
+            f.flush()
+            self._lines=[]
+
+    def close(self):
+        self.flush()
+
+class JsonSink(TextSink):
+    '''buffered reports as json lines (design and standard values)'''
+
+    def format(self,d):
+        r=d._asdict()
+        r.update(eng.snap(d,*self.series)._asdict())
+        return json.dumps(r)+'\n'
+
+class LogSink(TextSink):
+    '''reports as one json line per design on a logger
+    input:
+      logger= logging.Logger (default 'mc34063')
+      level= logging level'''
+
+    def __init__(self,logger=None,level=logging.INFO,**kw):
+        TextSink.__init__(self,**kw)
+        self.logger=logger or logging.getLogger('mc34063')
+        self.level=level
+
+    format=JsonSink.format
+
+    def report(self,d):
+        if self.logger.isEnabledFor(self.level):
+            TextSink.report(self,d)
+
+    def flush(self):
+        for line in self._lines:
+            self.logger.log(self.level,line.rstrip('\n'))
+        self._lines=[]
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+'''
+E series of preferred numbers (IEC 60063, E3 to E192) and search
+of the best standard value for a computed one.
+E3 to E24 use the historical values of the standard, E48, E96 and
+E192 are generated from 10**(i/n) rounded to 3 digits (with 920
+in place of 919 in E192, as in the standard).
+Every series keeps a precomputed index: the decision bounds between
+adjacent values (where the relative error to both is the same),
+so the best value is found with bisect in O(log n) without
+building lists on every call. matchvals() does the same over
+numpy arrays.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import bisect
+import math
+
+# powers of ten, computed as the original normalization loop did
+_DECADE={0:1}
+for _i in range(1,40):
+    _DECADE[_i]=_DECADE[_i-1]*10
+    _DECADE[-_i]=_DECADE[1-_i]/10
+
+def _decade(e):
+    '''10**e (from _DECADE when there)'''
+    return _DECADE[e] if e in _DECADE else 10.0**e
+
+class Series(tuple):
+    '''values of one decade of a series, from 1.0 to 10.0 included
+    bounds[i] is the value with the same relative error
+    from self[i] and self[i+1]'''
+
+    def __new__(cls,values,name=''):
+        self=super().__new__(cls,values)
+        self.name=name
+        self.m=len(self)-1
+        self.bounds=tuple(2*a*b/(a+b) for a,b in zip(self,self[1:]))
+        self._decades={}
+        self._ratios=None
+        return self
+
+    def __repr__(self):
+        return self.name or tuple.__repr__(self)
+
+    def decades(self,lo,hi):
+        '''values of the series from 10**lo to 10**hi (excluded)
+        The table is computed at first use and cached'''
+        if (lo,hi) in self._decades:
+            return self._decades[lo,hi]
+        t=tuple(round(v*_decade(e),12) for e in range(lo,hi)
+                for v in self[:-1])
+        self._decades[lo,hi]=t
+        return t
+
+    def ratios(self):
+        '''sorted table of the ratios r2/r1 between 0.1 and 100
+        of all the pairs of values of the series
+        The table is computed at first use and cached
+        output:
+          keys= sorted ratios
+          pairs= (index of r1, index of r2, exponent of ten of r2)'''
+        if self._ratios is None:
+            t=sorted((self[j]/self[i]*_DECADE[d],i,j,d) for d in (0,1)
+                     for i in range(self.m) for j in range(self.m))
+            self._ratios=([x[0] for x in t],[x[1:] for x in t])
+        return self._ratios
+
+def egen(n):
+    '''generate one decade of the E series with n values per decade
+    (n=48|96|192)'''
+    v=[round(10**(i/n),2) for i in range(n)]
+    if n==192:
+        v[v.index(9.19)]=9.20
+    return Series(v+[10.0],'E%d' % n)
+
+E3=Series([1.0,2.2,4.7,10.0],'E3')
+E24=Series([1.0,1.1,1.2,1.3,1.5,1.6,1.8,2.0,2.2,2.4,2.7,3.0,3.3,
+            3.6,3.9,4.3,4.7,5.1,5.6,6.2,6.8,7.5,8.2,9.1,10.0],'E24')
+E12=Series([1,1.2,1.5,1.8,2.2,2.7,3.3,3.9,4.7,5.6,6.8,8.2,10.0],'E12')
+E6=Series([1.0,1.5,2.2,3.3,4.7,6.8,10.0],'E6')
+E48=egen(48)
+E96=egen(96)
+E192=egen(192)
+
+SERIES={s.name:s for s in (E3,E6,E12,E24,E48,E96,E192)}
+
+def _series(s):
+    '''return s as a Series, s may also be the name of a series'''
+    if isinstance(s,Series):
+        return s
+    if isinstance(s,str):
+        return SERIES[s.upper()]
+    return Series(s)
+
+def matchval(c,s):
+    '''searches for best value of c in s
+    input:
+      c= value to match (>=0)
+      s= series to use (E3...E192, or its name)
+    output:
+      best value found,
+      error in %,
+      index in s'''
+    s=_series(s)
+    if c<=0:
+        if c==0:
+            return 0.0, 0.0, 0
+        raise ValueError('value to match must be positive')
+    c,e=_norm(c)
+    n=_decade(e)
+    idx=bisect.bisect_left(s.bounds,c)
+    err=(c-s[idx])/s[idx]
+    # best value found, error in %, index s
+    return int((s[idx]*n)*1000)/1000, int((err*100)*10)/10, idx
+
+def matchvals(c,s):
+    '''vectorized matchval()
+    input:
+      c= array of values to match (>0)
+      s= series to use
+    output:
+      arrays of best values, errors in %, indexes in s'''
+    import numpy as np
+    s=_series(s)
+    c=np.asarray(c,dtype=float)
+    zero=c==0
+    with np.errstate(divide='ignore',invalid='ignore'):
+        n=10.0**np.floor(np.log10(np.where(zero,1.0,c)))
+        x=c/n
+        hi=x>=10
+        lo=x<1
+        x=np.where(hi,x/10,np.where(lo,x*10,x))
+        n=np.where(hi,n*10,np.where(lo,n/10,n))
+        idx=np.searchsorted(np.asarray(s.bounds),x,side='left')
+        v=np.asarray(s)[idx]
+        err=np.where(zero,0.0,(x-v)/v)
+        v=np.where(zero,0.0,v)
+    idx=np.where(zero,0,idx)
+    return np.trunc(v*n*1000)/1000, np.trunc(err*1000)/10, idx
+
+def _norm(c):
+    '''split c>0 in mantissa (1<=x<10) and exponent of ten'''
+    e=math.floor(math.log10(c))
+    x=c/_decade(e)
+    if x>=10:
+        return x/10, e+1
+    elif x<1:
+        return x*10, e-1
+    return x, e
+
+def bestresk(alfa,s,k=5):
+    '''search for the k best values of r2(=alfa*r1) and r1 in s
+    Uses the sorted table of all the ratios r2/r1 of the series
+    (Series.ratios()) and walks it from the position of alfa
+    towards both sides, so the cost is O(log(m)+k); every r1 met
+    gets r2 and the error from matchval(alfa*r1) and ties (the
+    error is truncated to 0.1%) go to the smallest r1. A ratio made
+    by more pairs (1/3, 1.2/3.6, ...) is given once
+    input:
+      alfa=r2/r1
+      s= series to use (E3...E192, or its name)
+      k= number of alternatives
+    out:
+      list of (r1, r2, error in %, index of r2), best first'''
+    s=_series(s)
+    if alfa<=0:
+        if alfa==0:
+            return [[s[0], 0.0, 0.0, 0]]
+        raise ValueError('ratio must be positive')
+    a,_=_norm(alfa)
+    keys,pairs=s.ratios()
+    hi=bisect.bisect_left(keys,a)
+    lo=hi-1
+    seen=set()
+    # (abs error, index of r1, ratio, result)
+    val=[]
+    while lo>=0 or hi<len(keys):
+        elo=a/keys[lo]-1 if lo>=0 else math.inf
+        ehi=1-a/keys[hi] if hi<len(keys) else math.inf
+        if elo<=ehi:
+            n,err=lo,elo
+            lo-=1
+        else:
+            n,err=hi,ehi
+            hi+=1
+        # the next ones cannot truncate to the k-th error
+        if len(val)>=k and err*100>=val[k-1][0]+0.1+1e-9:
+            break
+        i=pairs[n][0]
+        if i in seen:
+            continue
+        seen.add(i)
+        t=matchval(alfa*s[i],s)
+        x=(abs(t[1]),i,keys[n],[s[i],t[0],t[1],t[2]])
+        same=[y for y in val if abs(y[2]-x[2])<=1e-9*x[2]]
+        if same:
+            if same[0][:2]<x[:2]:
+                continue
+            val.remove(same[0])
+        val.append(x)
+        val.sort(key=lambda y:y[:2])
+    return [x[3] for x in val[:k]]
+
+def bestres(alfa,s):
+    '''search for best value of r2(=alfa*r1) and r1 in s
+    input:
+      alfa=r2/r1
+      s= series to use (E3...E192, or its name)
+    out:
+      (r1, r2, error in %, index)'''
+    return bestresk(alfa,s,1)[0]
+
+def bestress(alfa,s,chunk=1<<20):
+    '''vectorized bestres(): matchval(alfa*r1) for every r1 of s, the
+    smallest truncated error wins (the first r1 on ties)
+    input:
+      alfa= array of ratios r2/r1 (>0)
+      s= series to use
+      chunk= max number of alfa*r1 computed at once
+    output:
+      arrays of r1, r2, errors in %, indexes of r2 (nan and -1 where
+      alfa<0, as bestres() raises there)'''
+    import numpy as np
+    s=_series(s)
+    v=np.asarray(s)
+    bounds=np.asarray(s.bounds)
+    alfa=np.asarray(alfa,dtype=float)
+    a=alfa.ravel()
+    r1=np.full(a.shape,np.nan)
+    r2=np.full(a.shape,np.nan)
+    err=np.full(a.shape,np.nan)
+    idx=np.full(a.shape,-1)
+    zero=a==0
+    r1[zero],r2[zero],err[zero],idx[zero]=v[0],0.0,0.0,0
+    # powers of ten as matchval() (_DECADE), so the errors truncate
+    # the same way
+    dec=np.array([_DECADE[e] for e in range(-39,40)],dtype=float)
+    def decade(e):
+        if (np.abs(e)<40).all():
+            return dec[e+39]
+        with np.errstate(over='ignore'):
+            return np.where(np.abs(e)<40,dec[np.clip(e+39,0,78)],10.0**e)
+    # searchsorted(bounds,c) of c in [1,10) by a table over cells of
+    # log10(c): with at most one bound in a cell, the bounds before it
+    # and one comparison
+    cells=4096
+    cb=np.floor(np.log10(bounds)*cells).astype(int)
+    base=np.searchsorted(cb,np.arange(cells+1),side='left')
+    cb=np.append(cb,cells+1)
+    table=len(set(cb.tolist()))==len(cb)
+    def search(c):
+        if not table:
+            return np.searchsorted(bounds,c,side='left')
+        x=np.clip(np.floor(np.log10(c)*cells).astype(int),0,cells)
+        j=base[x]
+        return j+((cb[j]==x)&(bounds[np.minimum(j,len(bounds)-1)]<c))
+
+    good=np.flatnonzero((a>0)&np.isfinite(a))
+    step=max(1,chunk//s.m)
+    for p in range(0,len(good),step):
+        g=good[p:p+step]
+        c=a[g,None]*v[None,:s.m]
+        e=np.floor(np.log10(c)).astype(int)
+        c=c/decade(e)
+        hi=c>=10
+        lo=c<1
+        c=np.where(hi,c/10,np.where(lo,c*10,c))
+        n=decade(e+hi-lo)
+        k=search(c)
+        t=np.trunc((c-v[k])/v[k]*100*10)/10
+        i=np.argmin(np.abs(t),axis=1)
+        row=np.arange(len(g))
+        k,n=k[row,i],n[row,i]
+        r1[g]=v[i]
+        r2[g]=np.trunc(v[k]*n*1000)/1000
+        err[g]=t[row,i]
+        idx[g]=k
+    shape=alfa.shape
+    return r1.reshape(shape),r2.reshape(shape),err.reshape(shape), \
+           idx.reshape(shape)
+
+def nearest(c,s,k=2):
+    '''standard values around c
+    input:
+      c= value (>0)
+      s= series to use (E3...E192, or its name)
+      k= values taken on each side of the best one
+    output:
+      sorted list of 2*k+1 values of s (not truncated)'''
+    s=_series(s)
+    x,e=_norm(c)
+    idx=bisect.bisect_left(s.bounds,x)
+    val=[]
+    for j in range(idx-k,idx+k+1):
+        d,i=divmod(j,s.m)
+        val.append(s[i]*_decade(e+d))
+    return val
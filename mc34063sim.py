@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+'''
+Cycle by cycle time domain simulation of mc34063 designs.
+Every cycle the comparator looks at the output: if it is below the
+regulated voltage the switch is turned on for ton (ended earlier if
+the inductor current reaches the current limit VSENSE/Rsc), then
+the diode conducts for toff (or until the inductor current is 0);
+otherwise the cycle is skipped. The inductor current is linear in
+every interval (the output voltage is taken constant inside it)
+and the capacitor voltage is integrated exactly, with its min and
+max (with the ESR) found analytically, so a cycle is a few numpy
+operations over all the designs at once.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+
+# results of simulate(), over the last cycles:
+#   vout (mean at the end of the cycles), vmin, vmax, vripple (V),
+#   ipeak, ivalley (A) of the inductor, f (Hz, mean), ilimhits,
+#   skips, dcm (number of cycles with current limit, skipped,
+#   discontinuous)
+SIMS=('vout','vmin','vmax','vripple','ipeak','ivalley','f','ilimhits',
+      'skips','dcm')
+
+def _seg(v,i,s,tau,iload,cout,esr,deliver):
+    '''interval of length tau with inductor current i+s*t, given to
+    the capacitor times deliver (1 or 0), and load current iload
+    output:
+      capacitor voltage at the end, min and max of the output
+      voltage (capacitor voltage+esr*capacitor current)'''
+    d=deliver
+    def out(t):
+        ic=d*(i+s*t)-iload
+        vc=v+(d*(i*t+s*t*t/2)-iload*t)/cout
+        return vc,vc+esr*ic
+    v1,o1=out(tau)
+    _,o0=out(0.0)
+    # the output voltage has its extremum where its derivative
+    # ic/cout+esr*d*s is 0
+    with np.errstate(divide='ignore',invalid='ignore'):
+        t=(iload-d*i-esr*cout*d*s)/(d*s)
+    t=np.clip(np.where(np.isfinite(t),t,0.0),0.0,tau)
+    _,ot=out(t)
+    return v1,np.minimum(np.minimum(o0,o1),ot), \
+           np.maximum(np.maximum(o0,o1),ot)
+
+def simulate(mode,vin,vout,iout,vf,vsat,ton,toff,l,cout,ilim,esr=0.0,
+             cycles=2000,last=200,v0=0.0,i0=0.0,trace=0):
+    '''simulate designs for a number of cycles from v0, i0
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting', code or array of them
+      vin (V)
+      vout= regulated output voltage (V, negative for Inverting)
+      iout= load current at vout (A), the load is a resistor
+      vf, vsat (V), ton, toff (s), l (H), cout (F), ilim (A),
+      esr (Ohm) of cout, as scalars or arrays
+      cycles= cycles simulated
+      last= cycles of the results (the steady state)
+      v0, i0= output voltage (absolute value) and inductor current
+        at the start
+      trace= keep the output voltage and inductor current at the end
+        of every trace-th cycle (0 for none)
+    output:
+      {name in SIMS: array}, trace {'t','vout','il': array of
+      (cycles//trace, designs)} or None'''
+    mode=vec.modecode(mode)
+    mode,vin,vout,iout,vf,vsat,ton,toff,l,cout,ilim,esr=[
+        np.asarray(x,dtype=float) for x in np.broadcast_arrays(
+            mode,vin,vout,iout,vf,vsat,ton,toff,l,cout,ilim,esr)]
+    up=mode==vec.STEPUP
+    down=mode==vec.STEPDOWN
+    dn=down*1.0
+    vt=np.abs(vout)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        rload=vt/np.abs(iout)
+    v=np.full(vt.shape,float(v0))
+    i=np.full(vt.shape,float(i0))
+    t=np.zeros(vt.shape)
+    res={k:np.zeros(vt.shape) for k in SIMS}
+    for k,x in (('vmin',np.inf),('vmax',-np.inf),('ivalley',np.inf),
+                ('ipeak',-np.inf)):
+        res[k]=np.full(vt.shape,x)
+    tr={'t':[],'vout':[],'il':[]} if trace else None
+    start=max(cycles-last,0)
+    for n in range(cycles):
+        iload=v/rload
+        # on: the comparator fires the switch if the output is low
+        fire=v<vt
+        son=np.where(down,vin-vsat-v,vin-vsat)/l
+        with np.errstate(divide='ignore',invalid='ignore'):
+            tl=np.where(son>0,(ilim-i)/son,np.inf)
+        t1=np.where(fire,np.clip(tl,0.0,ton),0.0)
+        lim=fire&(tl<ton)
+        i1=i+son*t1
+        v1,lo1,hi1=_seg(v,i,son,t1,iload,cout,esr,dn)
+        # off: the diode conducts until the current is 0
+        t2=np.where(fire,toff,ton+toff)
+        soff=np.where(up,vin-vf-v1,-(v1+vf))/l
+        with np.errstate(divide='ignore',invalid='ignore'):
+            tz=np.where(soff<0,i1/-soff,np.inf)
+        t3=np.minimum(t2,tz)
+        dcm=tz<t2
+        i2=np.where(dcm,0.0,i1+soff*t3)
+        v2,lo2,hi2=_seg(v1,i1,soff,t3,iload,cout,esr,1.0)
+        # then (dcm) only the load discharges the capacitor
+        v3=v2-iload*(t2-t3)/cout
+        lo3=v3-esr*iload
+        dt=t1+t2
+        t=t+dt
+        if n>=start:
+            res['vout']+=v3
+            res['vmin']=np.minimum(res['vmin'],np.minimum(
+                np.minimum(lo1,lo2),np.where(dcm,lo3,np.inf)))
+            res['vmax']=np.maximum(res['vmax'],np.maximum(hi1,hi2))
+            res['ipeak']=np.maximum(res['ipeak'],np.maximum(i,i1))
+            res['ivalley']=np.minimum(res['ivalley'],np.minimum(i,i2))
+            res['f']+=dt
+            res['ilimhits']+=lim
+            res['skips']+=~fire
+            res['dcm']+=dcm
+        v,i=v3,i2
+        if trace and (n+1)%trace==0:
+            tr['t'].append(t)
+            tr['vout'].append(np.where(mode==vec.INVERTING,-v,v))
+            tr['il'].append(i)
+    m=cycles-start
+    res['vout']/=max(m,1)
+    inv=mode==vec.INVERTING
+    # the results are for the absolute value of the output voltage
+    lo,hi=res['vmin'],res['vmax']
+    res['vout']=np.where(inv,-res['vout'],res['vout'])
+    res['vmin'],res['vmax']=np.where(inv,-hi,lo),np.where(inv,-lo,hi)
+    res['vripple']=hi-lo
+    with np.errstate(divide='ignore',invalid='ignore'):
+        res['f']=m/res['f']
+    if trace:
+        tr={k:np.array(x) for k,x in tr.items()}
+    return res,tr
+
+def fromdesign(cols,batch,snaps=None,esr=0.0):
+    '''arguments of simulate() for a batch of designs
+    input:
+      cols= columns of the inputs (mode, vin, vout, iout, vf, vsat)
+      batch= Batch from vec.compute()
+      snaps= {name in vec.SNAPS: array} to simulate the standard
+        values (vec.snap()) instead of the computed ones
+      esr= ESR of cout (Ohm)
+    output:
+      dict of arguments of simulate()'''
+    kw={k:cols[k] for k in ('mode','vin','vout','iout','vf','vsat')}
+    if snaps is None:
+        kw.update(ton=batch.ton,toff=batch.toff,l=batch.lmin,cout=batch.cout,
+                  ilim=eng.VSENSE/batch.rsc)
+    else:
+        p=vec.parts(snaps)
+        r,_=vec.evaluate(cols['mode'],cols['vin'],cols['iout'],cols['vf'],
+                         cols['vsat'],**p)
+        kw.update(vout=r['vout'],ton=r['ton'],toff=r['toff'],l=p['l'],
+                  cout=p['cout'],ilim=r['ilim'])
+    kw['esr']=esr
+    return kw
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+'''
+Design space sweep for switching regulator with mc34063.
+The Cartesian grid of the input parameters is never built: it is
+cut in chunks of flat indexes, every chunk is expanded to column
+arrays and computed with mc34063vec in a pool of processes, and
+the results are streamed out in order with a bounded number of
+chunks in flight.
+
+Command line:
+  mc34063swp.py --mode StepDown --vin 6:40:35 --vout 3.3,5 \\
+                --iout 0.1:1:10 > sweep.csv
+ranges are start:stop:num (linspace) or comma separated values.
+--store dir writes memory-mapped column files (see mc34063col).
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import argparse
+import collections
+import concurrent.futures
+import os
+import sys
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+import mc34063col as col
+import mc34063dcm as dcm
+
+# default values of the inputs, as in the GUI
+DEFAULTS={'mode':'StepDown','vin':12.0,'vout':5.0,'iout':0.5,
+          'fmin':33000.0,'vripple':0.05,'vf':0.4,'vsat':1.0}
+
+def axis(v):
+    '''values of one axis of the grid
+    input:
+      v= scalar, sequence, or string 'start:stop:num' or 'a,b,c'
+    output:
+      1-D array (of mode codes for the mode axis)'''
+    if isinstance(v,str):
+        if ':' in v:
+            a,b,n=v.split(':')
+            return np.linspace(float(a),float(b),int(n))
+        v=v.split(',')
+        try:
+            return np.array([float(x) for x in v])
+        except ValueError:
+            pass
+    return np.atleast_1d(np.asarray(v))
+
+def grid(**kw):
+    '''axes of the grid, in the order of eng.INPUTS
+    input:
+      keywords of eng.INPUTS with values accepted by axis(),
+      the missing ones take DEFAULTS'''
+    axes=[]
+    for k in eng.INPUTS:
+        a=axis(kw.get(k,DEFAULTS[k]))
+        if k=='mode':
+            a=vec.modecode(a)
+        axes.append(a)
+    return tuple(axes)
+
+def size(axes):
+    '''number of points of the grid'''
+    return int(np.prod([len(a) for a in axes]))
+
+def expand(axes,start,stop):
+    '''column arrays of the points start..stop (excluded) of the grid'''
+    idx=np.unravel_index(np.arange(start,stop),[len(a) for a in axes])
+    return {k:a[i] for k,a,i in zip(eng.INPUTS,axes,idx)}
+
+def _chunk(axes,start,stop,snap=False,regime=None):
+    '''compute one chunk (runs in the workers)'''
+    cols=expand(axes,start,stop)
+    batch=vec.fromrecords(cols)
+    l=None
+    if snap:
+        snaps=vec.snap(batch,cols['vout'])
+        l=vec.parts(snaps)['l']
+        cols.update(snaps)
+        cols.update(vec.asbuilt(cols,batch,snaps))
+    if regime is not None:
+        cols.update(dcm.regime(cols,batch,l,cols['iout']*regime))
+    return cols,batch
+
+def sweep(axes,chunk=65536,workers=None,snap=False,regime=None):
+    '''compute all the points of the grid
+    input:
+      axes= grid axes (from grid())
+      chunk= points per chunk
+      workers= number of processes, 0 to compute in this process,
+        None for the number of cpus
+      snap= add to the columns the standard values (vec.snap())
+        and the as-built ones (vec.asbuilt())
+      regime= add the regime columns (dcm.regime()) at this fraction
+        of iout, with the standard L if snap else Lmin
+    output:
+      generator of (columns, vec.Batch) for every chunk, in order'''
+    n=size(axes)
+    bounds=((i,min(i+chunk,n)) for i in range(0,n,chunk))
+    if workers==0:
+        for a,b in bounds:
+            yield _chunk(axes,a,b,snap,regime)
+        return
+    workers=workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(workers) as ex:
+        pending=collections.deque()
+        for a,b in bounds:
+            pending.append(ex.submit(_chunk,axes,a,b,snap,regime))
+            if len(pending)>=2*workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def writecsv(f,cols,batch,valid=True,header=False):
+    '''write one chunk of a sweep as csv lines
+    input:
+      valid= write only the valid points
+      header= write before the names of the columns'''
+    c=col.columns(cols,batch)
+    ok=batch.ok if valid else slice(None)
+    code=c.pop('mode')
+    mode=np.asarray(eng.MODES+('?',))[np.where(code<0,3,code)][ok]
+    if header:
+        f.write(','.join(['mode']+list(c))+'\n')
+    data=np.column_stack([a[ok] for a in c.values()])
+    for m,row in zip(mode,data):
+        f.write(m+','+','.join('%.6g' % x for x in row)+'\n')
+
+def main(argv=None):
+    '''command line interface'''
+    p=argparse.ArgumentParser(description='mc34063 design space sweep')
+    for k in eng.INPUTS:
+        p.add_argument('--'+k,default=str(DEFAULTS[k]),
+                       help='start:stop:num or a,b,c (default %(default)s)')
+    p.add_argument('--chunk',type=int,default=65536,help='points per chunk')
+    p.add_argument('--workers',type=int,default=None,
+                   help='processes (0= no pool, default= cpus)')
+    p.add_argument('--all',action='store_true',
+                   help='write also the invalid points')
+    p.add_argument('--asbuilt',action='store_true',
+                   help='add standard values and as-built columns')
+    p.add_argument('--regime',type=float,default=None,metavar='FRACTION',
+                   help='add CCM/DCM columns at this fraction of iout')
+    p.add_argument('-o','--output',default='-',help='csv file (default stdout)')
+    p.add_argument('--store',default=None,
+                   help='directory of column files (mc34063col) instead of csv')
+    args=p.parse_args(argv)
+    axes=grid(**{k:getattr(args,k) for k in eng.INPUTS})
+    if args.store:
+        col.writesweep(args.store,sweep(axes,args.chunk,args.workers,
+                                        args.asbuilt,args.regime),not args.all)
+        return
+    f=sys.stdout if args.output=='-' else open(args.output,'w')
+    try:
+        chunks=sweep(axes,args.chunk,args.workers,args.asbuilt,args.regime)
+        for i,(cols,batch) in enumerate(chunks):
+            writecsv(f,cols,batch,not args.all,i==0)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+'''
+Tolerance analysis of a mc34063 design built with standard values.
+montecarlo() samples the tolerances of the components, the spread
+of the 1.25 V reference, of vsat and vf and a range of vin, and
+evaluates vout, frequency, peak current, current limit and ripple
+of all the samples at once with mc34063vec.evaluate(); the samples
+can be split over processes, each with its own seeded stream.
+wcdesign() and wcevaluate() give instead guaranteed worst case
+bounds in a single pass, evaluating the same equations with
+interval arithmetic (Interval), over batches of designs.
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+import concurrent.futures
+import numpy as np
+import mc34063eng as eng
+import mc34063vec as vec
+
+# default tolerances (relative, +-)
+TOL={'ct':0.10,'rsc':0.05,'r1':0.01,'r2':0.01,'l':0.20,'cout':0.20,
+     'vref':0.02,'vf':0.20,'vsat':0.20}
+
+def _sample(rng,x,t,n,dist):
+    '''n samples of x with relative tolerance t'''
+    if dist=='normal':
+        # the tolerance is taken as 3 sigma
+        return x*(1+rng.normal(0,t/3,n))
+    return x*(1+rng.uniform(-t,t,n))
+
+def _run(mode,parts,vin,iout,vf,vsat,n,tol,dist,seed):
+    '''n samples with one random stream (runs in the workers)'''
+    rng=np.random.default_rng(seed)
+    p={k:_sample(rng,v,tol[k],n,dist) for k,v in parts.items()}
+    if np.ndim(vin)==0:
+        vin=np.full(n,float(vin))
+    else:
+        vin=rng.uniform(vin[0],vin[1],n)
+    r,ok=vec.evaluate(mode,vin,iout,_sample(rng,vf,tol['vf'],n,dist),
+                      _sample(rng,vsat,tol['vsat'],n,dist),
+                      vref=_sample(rng,eng.VREF,tol['vref'],n,dist),**p)
+    r=dict(r)
+    r['vin']=vin
+    r['ok']=ok
+    return r
+
+def montecarlo(mode,parts,vin,iout,vf,vsat,n=1000000,tol=None,
+               dist='uniform',seed=None,workers=0,chunk=250000):
+    '''Monte Carlo analysis of a design
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting'
+      parts= {'ct','rsc','r1','r2','l','cout'} in SI units
+        (vec.parts() of the standard values)
+      vin= input voltage, or (min, max) range sampled uniformly
+      iout (A), vf, vsat (V)= nominal values
+      n= number of samples
+      tol= tolerances replacing the ones of TOL
+      dist= 'uniform' or 'normal' (tolerance= 3 sigma)
+      seed= seed of the random streams
+      workers= number of processes, 0 to compute in this process
+      chunk= samples per stream
+    output:
+      {name in vec.EVALS, 'vin', 'ok': array of n samples}'''
+    t=dict(TOL)
+    t.update(tol or {})
+    parts={k:float(parts[k]) for k in ('ct','rsc','r1','r2','l','cout')}
+    sizes=[min(chunk,n-i) for i in range(0,n,chunk)]
+    seeds=np.random.SeedSequence(seed).spawn(len(sizes))
+    args=[(mode,parts,vin,iout,vf,vsat,m,t,dist,s)
+          for m,s in zip(sizes,seeds)]
+    if workers:
+        with concurrent.futures.ProcessPoolExecutor(workers) as ex:
+            res=list(ex.map(_run,*zip(*args)))
+    else:
+        res=[_run(*a) for a in args]
+    return {k:np.concatenate([r[k] for r in res]) for k in res[0]}
+
+def summary(r,q=(0.001,0.5,0.999)):
+    '''min, quantiles and max of the valid samples
+    output:
+      {name: (min, quantiles..., max)}'''
+    ok=r['ok']
+    return {k:(v[ok].min(),*np.quantile(v[ok],q),v[ok].max())
+            for k,v in r.items() if k!='ok' and ok.any()}
+
+class Interval:
+    '''closed intervals [lo, hi] of numpy arrays (or scalars)
+    The operations give bounds that always contain the result
+    (rounded outwards by one ulp, to cover the rounding of floats);
+    a division by an interval containing 0 gives [-inf, inf]'''
+
+    def __init__(self,lo,hi=None):
+        lo=np.asarray(lo,dtype=float)
+        hi=lo if hi is None else np.asarray(hi,dtype=float)
+        self.lo=np.minimum(lo,hi)
+        self.hi=np.maximum(lo,hi)
+
+    def __repr__(self):
+        return 'Interval(%r, %r)' % (self.lo,self.hi)
+
+    @staticmethod
+    def _out(lo,hi):
+        '''interval [lo, hi] rounded outwards'''
+        return Interval(np.nextafter(lo,-np.inf),np.nextafter(hi,np.inf))
+
+    @staticmethod
+    def of(x):
+        '''x as Interval: Interval, (lo, hi) or value'''
+        if isinstance(x,Interval):
+            return x
+        if isinstance(x,tuple):
+            return Interval(*x)
+        return Interval(x)
+
+    @staticmethod
+    def tol(x,t):
+        '''x +- relative tolerance t'''
+        x=Interval.of(x)
+        return x*Interval(1-t,1+t)
+
+    def __add__(self,o):
+        o=Interval.of(o)
+        return Interval._out(self.lo+o.lo,self.hi+o.hi)
+
+    __radd__=__add__
+
+    def __neg__(self):
+        return Interval(-self.hi,-self.lo)
+
+    def __sub__(self,o):
+        return self+(-Interval.of(o))
+
+    def __rsub__(self,o):
+        return Interval.of(o)+(-self)
+
+    def __mul__(self,o):
+        o=Interval.of(o)
+        p=(self.lo*o.lo,self.lo*o.hi,self.hi*o.lo,self.hi*o.hi)
+        return Interval._out(np.minimum.reduce(p),np.maximum.reduce(p))
+
+    __rmul__=__mul__
+
+    def recip(self):
+        '''1/self'''
+        zero=(self.lo<=0)&(self.hi>=0)
+        with np.errstate(divide='ignore'):
+            return Interval._out(np.where(zero,-np.inf,1/self.hi),
+                                 np.where(zero,np.inf,1/self.lo))
+
+    def __truediv__(self,o):
+        return self*Interval.of(o).recip()
+
+    def __rtruediv__(self,o):
+        return Interval.of(o)*self.recip()
+
+    def __abs__(self):
+        lo=np.where(self.lo>=0,self.lo,np.where(self.hi<=0,-self.hi,0.0))
+        return Interval(lo,np.maximum(np.abs(self.lo),np.abs(self.hi)))
+
+    @staticmethod
+    def where(c,a,b):
+        '''elementwise a where c else b'''
+        a=Interval.of(a)
+        b=Interval.of(b)
+        return Interval(np.where(c,a.lo,b.lo),np.where(c,a.hi,b.hi))
+
+def _ratio(up,vin,vout,vf,vsat):
+    '''interval of ton/toff'''
+    return Interval.where(up,(abs(vout)+vf-vin)/(vin-vsat),
+                          (abs(vout)+vf)/(vin-vsat-vout))
+
+def wcdesign(mode,vin,vout,iout,fmin,vripple,vf,vsat):
+    '''worst case bounds of the values computed by eng.compute()
+    input:
+      as vec.compute(), every value may also be an Interval or a
+      (min, max) tuple
+    output:
+      {name in eng.OUTPUTS: Interval}, ok mask (True where every
+      point of the input intervals gives a valid design)'''
+    mode=vec.modecode(mode)
+    vin,vout,iout,fmin,vripple,vf,vsat=[Interval.of(x) for x in
+        (vin,vout,iout,fmin,vripple,vf,vsat)]
+    up=mode==vec.STEPUP
+    down=mode==vec.STEPDOWN
+    # vec.valid() for every point of the intervals
+    ok=(iout.lo>0)&(vripple.lo>0)&(fmin.lo>=eng.FMINLO)& \
+       (fmin.hi<=eng.FMINHI)&(vsat.lo>0)&(vf.lo>0)& \
+       (vin.hi<=eng.VINHI)&(vin.lo>=eng.VINLO)
+    inv=(vout.hi<0)&((vin-vsat-vout).lo>0)
+    dn=(vout.lo>0)&(vout.hi<vin.lo)&((vin-vsat-vout).lo>0)
+    upok=(vout.lo>vin.hi)&((vin-vsat).lo>0)
+    ok=ok&np.where(mode==vec.INVERTING,inv,
+                   np.where(down,dn,up&upok))
+    with np.errstate(divide='ignore',invalid='ignore'):
+        tonplustoff=1/fmin
+        r=_ratio(up,vin,vout,vf,vsat)
+        toff=tonplustoff/(r+1.0)
+        # ton= tonplustoff-toff, written with r only once
+        ton=tonplustoff*(1.0-1/(r+1.0))
+        ct=eng.KCT*ton
+        ipk=Interval.where(down,2*abs(iout),2*abs(iout)*(r+1.0))
+        lmin=Interval.where(down,vin-vsat-vout,vin-vsat)/ipk*ton
+        cout=Interval.where(down,ipk*tonplustoff/(8*vripple),
+                            9*iout*ton/vripple)
+        rsc=eng.VSENSE/ipk
+        r1=Interval(np.full(np.shape(ok),eng.R1))
+        r2=(abs(vout)/eng.VREF-1.0)*r1
+    return {'ton':ton,'toff':toff,'ct':ct,'ipk':ipk,'rsc':rsc,
+            'lmin':lmin,'cout':cout,'r1':r1,'r2':r2},ok
+
+def wcevaluate(mode,parts,vin,iout,vf,vsat,tol=None):
+    '''worst case bounds of what a circuit built with given components
+    does (vec.evaluate() with interval arithmetic)
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting', code or array of them
+      parts= {'ct','rsc','r1','r2','l','cout'} in SI units
+      vin, iout, vf, vsat= values, (min, max) tuples or Interval
+      tol= tolerances replacing the ones of TOL (also for vf, vsat
+        and vref around their nominal values)
+    output:
+      {name in vec.EVALS: Interval}, ok mask'''
+    t=dict(TOL)
+    t.update(tol or {})
+    mode=vec.modecode(mode)
+    up=mode==vec.STEPUP
+    down=mode==vec.STEPDOWN
+    p={k:Interval.tol(parts[k],t[k]) for k in
+       ('ct','rsc','r1','r2','l','cout')}
+    vin=Interval.of(vin)
+    iout=Interval.of(iout)
+    vf=Interval.tol(vf,t['vf'])
+    vsat=Interval.tol(vsat,t['vsat'])
+    vref=Interval.tol(eng.VREF,t['vref'])
+    with np.errstate(divide='ignore',invalid='ignore'):
+        vout=vref*(1.0+p['r2']/p['r1'])
+        vout=Interval.where(mode==vec.INVERTING,-vout,vout)
+        ton=p['ct']/eng.KCT
+        r=_ratio(up,vin,vout,vf,vsat)
+        toff=ton/r
+        # f= 1/(ton+toff), written with ton and r only once
+        f=1/(ton*(1.0+1/r))
+        ipk=Interval.where(down,2*abs(iout),2*abs(iout)*(r+1.0))
+        ilim=eng.VSENSE/p['rsc']
+        di=Interval.where(down,vin-vsat-vout,vin-vsat)*ton/p['l']
+        vripple=Interval.where(down,di/(8*f*p['cout']),
+                               9*iout*ton/p['cout'])
+    ok=(r.lo>0)&np.isfinite(r.hi)&(mode>=0)
+    return {'vout':vout,'ton':ton,'toff':toff,'f':f,'ipk':ipk,
+            'ilim':ilim,'vripple':vripple},ok
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+'''
+Vectorized version of mc34063eng.compute() using numpy.
+All the inputs may be scalars or arrays (broadcasted together),
+the mode can be a string, a code (index in MODES) or an array of
+them. Invalid operating points are marked False in the ok mask
+and have nan values instead of the early return of compute().
+
+(c) Fabio Sturman fabio.sturman@gmail.com - 2023
+This program is covered by
+GNU General Public License, version 3
+'''
+from collections import namedtuple
+import numpy as np
+import mc34063eng as eng
+from mc34063ser import E24, E12, E6, matchvals, bestress
+
+# mode codes
+STEPDOWN=eng.MODES.index('StepDown')
+STEPUP=eng.MODES.index('StepUp')
+INVERTING=eng.MODES.index('Inverting')
+
+Batch=namedtuple('Batch',('ok',)+eng.OUTPUTS)
+Batch.__doc__='''column arrays of computed values and validity mask'''
+
+def modecode(mode):
+    '''convert mode (string, code or array of them) to array of codes'''
+    m=np.asarray(mode)
+    if m.dtype.kind in 'US':
+        code=np.full(m.shape,-1,dtype=np.int8)
+        for i,name in enumerate(eng.MODES):
+            code[m==name]=i
+        return code
+    return m.astype(np.int8)
+
+def valid(mode,vin,vout,iout,fmin,vripple,vf,vsat):
+    '''vectorized eng.valid()
+    output:
+      boolean array'''
+    ok=(iout>0)&(vripple>0)&(fmin>=eng.FMINLO)&(fmin<=eng.FMINHI)& \
+       (vsat>0)&(vf>0)&(vin<=eng.VINHI)&(vin>=eng.VINLO)& \
+       (np.abs(vout)>=eng.VREF)
+    inv=(vout<0)&(vin-vsat-vout>0)
+    down=(vout>0)&(vout<vin)&(vin-vsat-vout>0)
+    up=(vout>vin)&(vin-vsat>0)
+    return ok&np.where(mode==INVERTING,inv,
+                       np.where(mode==STEPDOWN,down,(mode==STEPUP)&up))
+
+def compute(mode,vin,vout,iout,fmin,vripple,vf,vsat):
+    '''compute a batch of designs
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting', code or array of them
+      vin, vout (V), iout (A), fmin (Hz), vripple, vf, vsat (V)
+      as scalars or arrays
+    output:
+      Batch of float arrays (nan where not ok) and ok mask'''
+    mode=modecode(mode)
+    mode,vin,vout,iout,fmin,vripple,vf,vsat=np.broadcast_arrays(mode,
+        *[np.asarray(x,dtype=float) for x in
+          (vin,vout,iout,fmin,vripple,vf,vsat)])
+    ok=valid(mode,vin,vout,iout,fmin,vripple,vf,vsat)
+    up=mode==STEPUP
+    down=mode==STEPDOWN
+    with np.errstate(divide='ignore',invalid='ignore'):
+        tonplustoff=1/fmin
+        tonontoff=np.where(up,(np.abs(vout)+vf-vin)/(vin-vsat),
+                           (np.abs(vout)+vf)/(vin-vsat-vout))
+        toff=tonplustoff/(tonontoff+1.0)
+        ton=tonplustoff-toff
+        ct=eng.KCT*ton
+        ipk=np.where(down,2*np.abs(iout),2*np.abs(iout)*(tonontoff+1.0))
+        lmin=np.where(down,vin-vsat-vout,vin-vsat)/ipk*ton
+        cout=np.where(down,ipk*tonplustoff/(8*vripple),9*iout*ton/vripple)
+        rsc=eng.VSENSE/ipk
+        r1=np.full(ok.shape,eng.R1)
+        r2=(np.abs(vout)/eng.VREF-1.0)*r1
+    out=[np.where(ok,x,np.nan) for x in (ton,toff,ct,ipk,rsc,lmin,cout,r1,r2)]
+    return Batch(ok,*out)
+
+def fromrecords(a):
+    '''compute a batch of designs from a structured array
+    (or any mapping of columns) with the fields of eng.INPUTS'''
+    return compute(*[a[k] for k in eng.INPUTS])
+
+# columns of snap(), as eng.snap()
+SNAPS=eng.SNAPS
+
+def snap(batch,vout,sct=E12,srsc=E12,sr=E24,sl=E6,sc=E6):
+    '''standard values of a batch of designs, as eng.snap()
+    input:
+      batch= Batch from compute()
+      vout= output voltages of the batch
+      series (E3...E192) used for Ct, Rsc, R1 and R2, Lmin, Cout
+    output:
+      {name in SNAPS: array}, nan where batch.ok is False'''
+    ok=batch.ok
+    def fill(x):
+        return np.where(ok,x,0.0)
+    out={}
+    v,e,_=matchvals(fill(batch.ct/1e-12),sct)
+    out['ct_pf'],out['ct_err']=v,-e
+    v,e,_=matchvals(fill(batch.rsc*3),srsc)
+    out['rsc3'],out['rsc_err']=v,-e
+    r1,r2,e,_=bestress(fill(np.abs(vout)/eng.VREF-1.0),sr)
+    out['r1_k'],out['r2_k'],out['r_err']=r1,r2,-e
+    v,e,_=matchvals(fill(batch.lmin/1e-6),sl)
+    out['lmin_uh'],out['lmin_err']=v,-e
+    v,e,_=matchvals(fill(batch.cout/1e-6),sc)
+    out['cout_uf'],out['cout_err']=v,-e
+    return {k:np.where(ok,np.broadcast_to(out[k],ok.shape),np.nan)
+            for k in SNAPS}
+
+# outputs of evaluate()
+EVALS=('vout','ton','toff','f','ipk','ilim','vripple')
+
+def parts(sn):
+    '''component values (SI units) of standard values
+    input:
+      sn= Snap, or mapping of SNAPS columns
+    output:
+      {'ct','rsc','r1','r2','l','cout': value or array}'''
+    if hasattr(sn,'_asdict'):
+        sn=sn._asdict()
+    return {'ct':np.asarray(sn['ct_pf'])*1e-12,
+            'rsc':np.asarray(sn['rsc3'])/3,
+            'r1':np.asarray(sn['r1_k'])*1e3,
+            'r2':np.asarray(sn['r2_k'])*1e3,
+            'l':np.asarray(sn['lmin_uh'])*1e-6,
+            'cout':np.asarray(sn['cout_uf'])*1e-6}
+
+def ripple(mode,iout,ipk,di,f,ton,cout,esr=0.0):
+    '''output ripple (V) with the ESR of the output capacitor:
+    the capacitive part of compute() plus di*esr in StepDown (ripple
+    current of the inductor) or ipk*esr otherwise (the current pulse
+    of the diode)
+    input:
+      mode, iout (A), ipk (A), di (A), f (Hz), ton (s), cout (F),
+      esr (Ohm) as scalars or arrays'''
+    down=modecode(mode)==STEPDOWN
+    with np.errstate(divide='ignore',invalid='ignore'):
+        return np.where(down,di/(8*f*cout)+di*esr,9*iout*ton/cout+ipk*esr)
+
+def evaluate(mode,vin,iout,vf,vsat,ct,rsc,r1,r2,l,cout,vref=eng.VREF,
+             esr=0.0):
+    '''what a circuit built with given components does
+    (the equations of compute() used the other way round)
+    input:
+      mode= 'StepDown'|'StepUp'|'Inverting', code or array of them
+      vin (V), iout (A), vf, vsat (V),
+      ct (F), rsc (Ohm), r1, r2 (Ohm), l (H), cout (F), vref (V),
+      esr (Ohm) of cout, as scalars or arrays
+    output:
+      {name in EVALS: array} and ok mask:
+        vout= output voltage (V), ton, toff (s), f= frequency (Hz),
+        ipk= peak current needed for iout (A), ilim= current limit (A),
+        vripple= output ripple (V)'''
+    mode=modecode(mode)
+    up=mode==STEPUP
+    down=mode==STEPDOWN
+    inv=mode==INVERTING
+    with np.errstate(divide='ignore',invalid='ignore'):
+        vout=vref*(1.0+np.asarray(r2)/r1)
+        vout=np.where(inv,-vout,vout)
+        ton=np.asarray(ct)/eng.KCT
+        tonontoff=np.where(up,(np.abs(vout)+vf-vin)/(vin-vsat),
+                           (np.abs(vout)+vf)/(vin-vsat-vout))
+        toff=ton/tonontoff
+        f=1/(ton+toff)
+        ipk=np.where(down,2*np.abs(iout),2*np.abs(iout)*(tonontoff+1.0))
+        ilim=eng.VSENSE/np.asarray(rsc)
+        di=np.where(down,vin-vsat-vout,vin-vsat)*ton/l
+        vripple=ripple(mode,iout,ipk,di,f,ton,cout,esr)
+    ok=(tonontoff>0)&np.isfinite(tonontoff)&(mode>=0)
+    out={'vout':vout,'ton':ton,'toff':toff,'f':f,'ipk':ipk,'ilim':ilim,
+         'vripple':vripple}
+    shape=np.broadcast(ok,*out.values()).shape
+    return {k:np.broadcast_to(v,shape) for k,v in out.items()}, \
+           np.broadcast_to(ok,shape)
+
+# columns of asbuilt(): vout (V) and its error from the wanted one
+# in %, frequency (Hz), current limit (A) and its ratio to the
+# needed peak current, output ripple (V)
+ASBUILT=('ab_vout','ab_vout_err','ab_f','ab_ilim','ab_ilim_margin',
+         'ab_vripple')
+
+def asbuilt(cols,batch,snaps):
+    '''what the designs of a batch do when built with their
+    standard values
+    input:
+      cols= input columns (eng.INPUTS) of the batch
+      batch= Batch from compute()
+      snaps= standard values from snap()
+    output:
+      {name in ASBUILT: array}, nan where batch.ok is False'''
+    ok=batch.ok
+    p=parts(snaps)
+    r,rok=evaluate(cols['mode'],cols['vin'],cols['iout'],cols['vf'],
+                   cols['vsat'],**p)
+    ok=ok&rok
+    with np.errstate(divide='ignore',invalid='ignore'):
+        out={'ab_vout':r['vout'],
+             'ab_vout_err':(r['vout']-cols['vout'])/np.abs(cols['vout'])*100,
+             'ab_f':r['f'],
+             'ab_ilim':r['ilim'],
+             'ab_ilim_margin':r['ilim']/batch.ipk,
+             'ab_vripple':r['vripple']}
+    return {k:np.where(ok,v,np.nan) for k,v in out.items()}